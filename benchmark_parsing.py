@@ -0,0 +1,94 @@
+"""
+Micro-benchmark de l'analyse HTML du scraper : html.parser complet (chemin
+historique) contre parse_page (lxml + sous-arbres ciblés).
+
+Usage:
+    python benchmark_parsing.py                           # pages synthétiques
+    python benchmark_parsing.py --kind player p1.html p2.html
+"""
+
+import argparse
+import time
+
+from scraper_parsing import PARSER, parse_full, parse_page
+
+# Recherches effectuées par le scraper sur chaque type de page
+LOOKUPS = {
+    'tournament': lambda page: page.find('div', id='tournamentTabs-1-data').find('table', class_='result').find_all('tr'),
+    'match': lambda page: page.find_all('table', class_='result'),
+    'player': lambda page: (page.find_all('table', class_='plDetail'), page.find_all('table', class_='result balance'),
+                            page.find('tr', class_='summary')),
+}
+
+
+def filler(n):
+    """Bloc de navigation/publicité représentatif du bruit autour des tableaux."""
+    links = ''.join(f'<li><a href="/ranking/{i}/">Lien {i}</a></li>' for i in range(n))
+    return f'<div class="menu"><ul>{links}</ul></div><script>var x = {n};</script>'
+
+
+def synthetic_page(kind):
+    """Construit une page de taille réaliste pour un type donné."""
+    if kind == 'tournament':
+        rows = ''.join(
+            f'<tr class="one"><td class="first time">10.07., 1{i % 10}:00</td><td class="round">R1</td>'
+            f'<td class="t-name"><a href="/match-detail/?id={i}">Joueur {i} - Joueur {i + 1}</a></td>'
+            f'<td class="h2h">1-2</td><td class="course">1.{i % 9 + 1}</td><td class="course">2.{i % 9}</td></tr>'
+            for i in range(60))
+        body = (f'<h1 class="bg">Tournoi (France)</h1>{filler(400)}'
+                f'<div id="tournamentTabs-1-data"><table class="result"><tr><th>x</th></tr>{rows}</table></div>')
+    elif kind == 'match':
+        rows = ''.join(f'<tr class="one"><td>2024</td><td>T{i}</td><td>A</td><td>2</td><td><span title="Hard"></span></td></tr>'
+                       f'<tr class="two"><td>B</td><td>1</td></tr>' for i in range(20))
+        tables = ''.join(f'<table class="result"><tr><td>{i}</td></tr>{rows}</table>' for i in range(6))
+        body = f'{filler(400)}<table><tr><th class="plName"><a href="/player/a/">A</a></th></tr></table>{tables}'
+    else:
+        rows = ''.join(f'<tr class="one"><td>{2024 - i}</td><td>30/10</td><td>5/1</td><td>20/2</td><td>5/0</td>'
+                       f'<td>0/0</td><td>-</td></tr>' for i in range(10))
+        recent = ''.join(f'<tr class="one"><td class="first time">0{i % 9 + 1}.07.</td><td class="t-name">A - B</td>'
+                         f'<td class="tl">6-4, 6-4</td><td class="course">1.5</td><td class="course">2.5</td></tr>'
+                         for i in range(50))
+        body = (f'{filler(400)}<table class="plDetail"><tr><td class="photo"></td><td><h3>Nom</h3>'
+                f'<div class="date">Country: France</div></td></tr></table>'
+                f'<table class="result balance">{rows}<tr class="summary"><td>S</td><td><a>1/1</a></td></tr></table>'
+                f'<table class="result balance">{recent}</table><table class="result balance">{recent}</table>')
+    return f'<html><head><title>{kind}</title></head><body>{body}{filler(200)}</body></html>'.encode('utf-8')
+
+
+def measure(func, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in pages:
+            func(content)
+    return (time.perf_counter() - start) / (repeat * len(pages)) * 1000
+
+
+def run(kind, pages, repeat):
+    lookup = LOOKUPS[kind]
+    old = measure(lambda content: lookup(parse_full(content)), pages, repeat)
+    new = measure(lambda content: lookup(parse_page(content, kind)), pages, repeat)
+    print(f"{kind:<11} html.parser: {old:7.2f} ms/page   parse_page ({PARSER}): {new:7.2f} ms/page   x{old / new:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--kind', choices=sorted(LOOKUPS), help="type des pages fournies")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('files', nargs='*', help="pages HTML enregistrées")
+    args = parser.parse_args()
+
+    if args.files:
+        if not args.kind:
+            parser.error("--kind est requis avec des fichiers")
+        pages = []
+        for path in args.files:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        run(args.kind, pages, args.repeat)
+    else:
+        for kind in ('tournament', 'match', 'player'):
+            run(kind, [synthetic_page(kind)], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
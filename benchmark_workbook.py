@@ -0,0 +1,86 @@
+"""
+Benchmark de la lecture des onglets de Result_data_export.xlsx : un
+pd.read_excel par onglet (chemin historique de transform_stats) contre
+workbook_reader (classeur ouvert une fois, en séquentiel puis en parallèle).
+
+Usage:
+    python benchmark_workbook.py                      # classeur synthétique de 40 onglets
+    python benchmark_workbook.py --sheets 80 --workers 4
+    python benchmark_workbook.py ./data/Result_data_export.xlsx
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+from openpyxl import Workbook
+
+from workbook_reader import read_sheets, sheet_names
+
+# Libellés des lignes d'un onglet d'export (une colonne par joueur)
+LIGNES = ['Match', 'Tableau', 'Nom', 'Classement'] + [f'Stat {i}' for i in range(4, 37)]
+
+
+def synthetic_workbook(path, sheets, matches=16):
+    """Classeur au format de l'export : une ligne d'en-tête vide puis une ligne par statistique."""
+    wb = Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(title=f'Tournoi {s}')
+        ws.append([None] * (2 * matches + 1))
+        for i, libelle in enumerate(LIGNES):
+            if i == 0:
+                row = [f'Match {j // 2 + 1}' for j in range(2 * matches)]
+            elif i == 2:
+                row = [f'Joueur {s}-{j}' for j in range(2 * matches)]
+            else:
+                row = [None if (i + j) % 11 == 0 else str((i * 7 + j * 13) % 100) for j in range(2 * matches)]
+            ws.append([libelle] + row)
+    wb.save(path)
+
+
+def read_each(path):
+    """Chemin historique : un pd.read_excel par onglet."""
+    return {name: pd.read_excel(path, sheet_name=name) for name in sheet_names(path)}
+
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def run(path, workers, repeat):
+    old, reference = measure(lambda: read_each(path), repeat)
+    print(f"{len(reference)} onglets")
+    print(f"read_excel par onglet : {old:6.2f} s")
+    candidates = [('séquentiel', 1)] + ([(f'{workers} processus', workers)] if workers > 1 else [])
+    for label, n in candidates:
+        new, sheets = measure(lambda: read_sheets(path, workers=n), repeat)
+        assert list(sheets) == list(reference)
+        for name, df in reference.items():
+            pd.testing.assert_frame_equal(sheets[name], df)
+        print(f"read_sheets {label:<11}: {new:6.2f} s   x{old / new:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sheets', type=int, default=40, help="onglets du classeur synthétique")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('workbook', nargs='?', help="classeur d'export existant")
+    args = parser.parse_args()
+
+    if args.workbook:
+        run(args.workbook, args.workers, args.repeat)
+        return
+    with tempfile.TemporaryDirectory() as dossier:
+        path = os.path.join(dossier, 'Result_data_export.xlsx')
+        synthetic_workbook(path, args.sheets)
+        run(path, args.workers, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Format d'échange en colonnes (Parquet) entre le scraper, transform_stats et
+les systèmes de prédiction.
+
+Chaque étape écrit un fichier .parquet à côté de son classeur Excel
+(Result_data_export.parquet, Stats_tournois_en_cours.parquet) ; l'étape
+suivante le lit en priorité s'il est au moins aussi récent que le classeur.
+Le classeur Excel reste disponible pour consultation. Sans pyarrow, tout
+continue de passer par Excel.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_COLUMNAR = True
+except ImportError:
+    HAS_COLUMNAR = False
+
+
+def columnar_path(excel_path):
+    """Fichier Parquet associé à un classeur ('x.xlsx' -> 'x.parquet')."""
+    return os.path.splitext(excel_path)[0] + '.parquet'
+
+
+def _colonnes_homogenes(df):
+    """Copie de df où les colonnes objet de types mélangés sont passées en texte.
+
+    Parquet impose un type par colonne ('42' et 42 dans la même colonne ne
+    passent pas) ; les valeurs absentes sont conservées.
+    """
+    df = df.copy()
+    for col in df.columns[df.dtypes == object]:
+        valeurs = df[col][df[col].notna()]
+        if valeurs.map(type).nunique() > 1:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v), na_action='ignore')
+    return df
+
+
+def types_comme_excel(df):
+    """Copie de df typée comme après un aller-retour par pd.read_excel.
+
+    Les colonnes de textes numériques ('44', '2.0') deviennent des nombres,
+    les colonnes vides des NaN et les flottants entiers sans valeur absente des
+    entiers, ce que voient les systèmes de prédiction quand ils lisent le
+    classeur.
+    """
+    df = df.copy()
+    for col in df.columns:
+        serie = df[col]
+        if serie.dtype == object or pd.api.types.is_string_dtype(serie):
+            try:
+                df[col] = pd.to_numeric(serie) if serie.notna().any() else np.nan
+            except (ValueError, TypeError):
+                pass
+        elif pd.api.types.is_float_dtype(serie) and serie.notna().all() and (serie == serie.round()).all():
+            df[col] = serie.astype('int64')
+    return df
+
+
+def write_table(df, path):
+    """Écrit df en Parquet (écriture atomique). Retourne False si impossible."""
+    if not HAS_COLUMNAR:
+        return False
+    tmp_path = f'{path}.tmp'
+    try:
+        _colonnes_homogenes(df).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"Écriture Parquet impossible pour {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def read_if_present(excel_path):
+    """Table Parquet associée au classeur si elle existe et est à jour, sinon None."""
+    path = columnar_path(excel_path)
+    if not HAS_COLUMNAR or not os.path.exists(path):
+        return None
+    # Un classeur plus récent (réécrit à la main, vidé en début d'exécution...) fait foi
+    if os.path.exists(excel_path) and os.path.getmtime(path) < os.path.getmtime(excel_path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        print(f"Lecture Parquet impossible pour {path}: {e}")
+        return None
+
+
+def read_stats(excel_path, sheet_name=0):
+    """Lit la table en colonnes si elle est disponible, sinon l'onglet du classeur."""
+    df = read_if_present(excel_path)
+    if df is not None:
+        print(f"Données lues depuis {columnar_path(excel_path)}")
+        return df
+    return pd.read_excel(excel_path, sheet_name=sheet_name)
+
+
+def _nom_ligne(i, libelle, pris):
+    """Nom de colonne d'une ligne de l'onglet : son libellé, ou 'Ligne i' s'il est vide ou déjà pris."""
+    if isinstance(libelle, str) and libelle and libelle not in pris and not libelle.startswith('Ligne '):
+        return libelle
+    return f'Ligne {i}'
+
+
+def table_onglets(onglets):
+    """Table longue des onglets d'export [(nom, lignes)] : une ligne par colonne de joueur.
+
+    Les lignes de l'onglet (Nom, Classement, ...) deviennent les colonnes de
+    la table, dans leur ordre. La ligne d'en-tête vide est ignorée, comme les
+    onglets sans joueur.
+    """
+    enregistrements = []
+    noms = None
+    for sheet_name, rows in onglets:
+        lignes = rows[1:]
+        if not lignes:
+            continue
+        if noms is None or len(noms) != len(lignes):
+            noms = []
+            for i, row in enumerate(lignes):
+                noms.append(_nom_ligne(i, row[0], noms))
+        largeur = max(len(row) for row in lignes)
+        for j in range(1, largeur):
+            enregistrement = {'Onglet': sheet_name}
+            for nom, row in zip(noms, lignes):
+                valeur = row[j] if j < len(row) else None
+                enregistrement[nom] = None if valeur == '' else valeur
+            enregistrements.append(enregistrement)
+    return pd.DataFrame(enregistrements)
+
+
+def onglets_table(table):
+    """Inverse de table_onglets : {nom d'onglet: DataFrame tel que lu par pd.read_excel}."""
+    onglets = {}
+    if table is None or table.empty:
+        return onglets
+    noms = [col for col in table.columns if col != 'Onglet']
+    libelles = [np.nan if nom == f'Ligne {i}' else nom for i, nom in enumerate(noms)]
+    for sheet_name, joueurs in table.groupby('Onglet', sort=False):
+        valeurs = joueurs[noms].to_numpy(dtype=object).T
+        df = pd.DataFrame(valeurs, columns=[f'Unnamed: {j}' for j in range(1, len(joueurs) + 1)])
+        df.insert(0, 'Unnamed: 0', libelles)
+        onglets[sheet_name] = df.astype(object).where(df.notna(), np.nan)
+    return onglets
@@ -0,0 +1,86 @@
+"""
+Archive des pages HTML brutes récupérées par le scraper.
+
+Les contenus sont stockés compressés et dédupliqués par empreinte SHA-256
+(`objects/ab/cdef...`). Chaque exécution a son manifeste (`runs/<run-id>/`)
+qui associe chaque URL à son contenu, ce qui permet de rejouer une exécution
+entière sans accès réseau (`--replay <run-id>`).
+"""
+
+import glob
+import hashlib
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+
+
+def new_run_id():
+    """Identifiant d'exécution horodaté."""
+    return datetime.now().strftime('%Y%m%d-%H%M%S')
+
+
+class PageArchive:
+    """Archive dédupliquée des pages, avec manifeste par exécution."""
+
+    def __init__(self, root='./data/archive', run_id=None, replay=False):
+        self.root = root
+        self.run_id = run_id or new_run_id()
+        self.replay = replay
+        self.run_dir = os.path.join(root, 'runs', self.run_id)
+        self._lock = threading.Lock()
+        self._manifest = {}
+
+        if replay:
+            if not os.path.isdir(self.run_dir):
+                raise FileNotFoundError(f"Exécution {self.run_id} introuvable dans {root}/runs")
+            for path in sorted(glob.glob(os.path.join(self.run_dir, 'manifest-*.jsonl'))):
+                with open(path, encoding='utf-8') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self._manifest[entry['url']] = entry['sha256']
+        else:
+            os.makedirs(self.run_dir, exist_ok=True)
+        self._manifest_path = os.path.join(self.run_dir, f'manifest-{os.getpid()}.jsonl')
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:])
+
+    def put(self, url, body):
+        """Archive le contenu d'une URL pour l'exécution courante."""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        with self._lock:
+            if self._manifest.get(url) == digest:
+                return
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(zlib.compress(body))
+                os.replace(tmp_path, path)
+            self._manifest[url] = digest
+            with open(self._manifest_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'url': url, 'sha256': digest}) + '\n')
+
+    def get(self, url):
+        """Contenu archivé d'une URL pour l'exécution courante, ou None."""
+        digest = self._manifest.get(url)
+        if digest is None:
+            return None
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def urls(self):
+        """URLs archivées pour l'exécution courante."""
+        return list(self._manifest)
+
+    def __len__(self):
+        return len(self._manifest)
+
+
+def list_runs(root='./data/archive'):
+    """Identifiants des exécutions archivées, du plus ancien au plus récent."""
+    return sorted(os.path.basename(path) for path in glob.glob(os.path.join(root, 'runs', '*')))
@@ -0,0 +1,85 @@
+"""
+Pool de navigateurs Firefox headless pour l'étape tennisabstract du scraper.
+
+Les sessions sont créées à la demande puis réutilisées. Chaque chargement de
+page rend la main dès que l'élément attendu est présent, au lieu d'attendre
+un délai fixe. Une session est recyclée après une erreur du navigateur ou
+après `max_pages` pages.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.firefox.options import Options
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def headless_firefox():
+    """Crée un driver Firefox headless."""
+    firefox_options = Options()
+    firefox_options.add_argument("--headless")
+    return webdriver.Firefox(options=firefox_options)
+
+
+class DriverPool:
+    """Pool de `size` sessions Selenium longues, partagées entre threads."""
+
+    def __init__(self, size=3, max_pages=50, wait_timeout=15, ready_id='recent-results',
+                 driver_factory=headless_firefox):
+        self.size = size
+        self.max_pages = max_pages
+        self.wait_timeout = wait_timeout
+        self.ready_id = ready_id
+        self.driver_factory = driver_factory
+        self._sessions = [{'driver': None, 'pages': 0} for _ in range(size)]
+        self._idle = queue.Queue()
+        for session in self._sessions:
+            self._idle.put(session)
+
+    def _recycle(self, session):
+        """Ferme le navigateur d'une session; il sera recréé au prochain usage."""
+        driver, session['driver'], session['pages'] = session['driver'], None, 0
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass  # Ignorer les erreurs de fermeture du driver
+
+    def fetch(self, url):
+        """Charge une page et retourne son HTML dès que l'élément attendu est présent."""
+        session = self._idle.get()
+        try:
+            if session['driver'] is None:
+                session['driver'] = self.driver_factory()
+            driver = session['driver']
+            driver.get(url)
+            try:
+                WebDriverWait(driver, self.wait_timeout).until(
+                    EC.presence_of_element_located((By.ID, self.ready_id)))
+            except TimeoutException:
+                print(f"Élément '{self.ready_id}' absent après {self.wait_timeout}s: {url}")
+            page_source = driver.page_source
+            session['pages'] += 1
+            if session['pages'] >= self.max_pages:
+                self._recycle(session)
+            return page_source
+        except WebDriverException as e:
+            print(f"Erreur navigateur sur {url}, session recyclée: {e}")
+            self._recycle(session)
+            return None
+        finally:
+            self._idle.put(session)
+
+    def map(self, func, items):
+        """Applique `func` à `items` avec une tâche par session; l'ordre est conservé."""
+        with ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="browser") as executor:
+            return list(executor.map(func, items))
+
+    def close(self):
+        """Ferme tous les navigateurs du pool."""
+        for session in self._sessions:
+            self._recycle(session)
@@ -0,0 +1,94 @@
+"""
+Cache HTTP persistant (SQLite) pour les pages Tennis Explorer.
+
+Chaque réponse est stockée compressée avec ses en-têtes ETag/Last-Modified.
+La durée de validité dépend du type d'URL (liste des matchs courte, fiches
+joueurs longues). Une entrée expirée est revalidée par une requête
+conditionnelle quand le serveur le permet.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+# (motif d'URL, durée de validité en secondes) - le premier motif qui correspond s'applique
+DEFAULT_TTLS = [
+    (re.compile(r'tennisexplorer\.com/player/'), 24 * 3600),
+    (re.compile(r'tennisexplorer\.com/match-detail/'), 6 * 3600),
+    (re.compile(r'tennisexplorer\.com/matches/'), 15 * 60),
+]
+DEFAULT_TTL = 30 * 60  # Pages de tournoi (cotes et horaires)
+
+
+class HttpCache:
+    """Cache de réponses HTTP indexé par URL."""
+
+    def __init__(self, db_path='./data/http_cache.sqlite', ttls=None, default_ttl=DEFAULT_TTL):
+        self.db_path = db_path
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS responses (
+            url TEXT PRIMARY KEY,
+            body BLOB NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL
+        )
+        ''')
+        self._conn.commit()
+
+    def ttl_for(self, url):
+        """Retourne la durée de validité applicable à une URL."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url):
+        """Retourne (body, etag, last_modified, frais) ou None si l'URL est absente."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, fetched_at = row
+        fresh = time.time() - fetched_at < self.ttl_for(url)
+        return zlib.decompress(body), etag, last_modified, fresh
+
+    def validators(self, entry):
+        """En-têtes de requête conditionnelle pour une entrée du cache."""
+        headers = {}
+        if entry is not None:
+            _, etag, last_modified, _ = entry
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """Enregistre (ou remplace) la réponse d'une URL."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (url, zlib.compress(body), etag, last_modified, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url):
+        """Prolonge la validité d'une entrée après une réponse 304."""
+        with self._lock:
+            self._conn.execute('UPDATE responses SET fetched_at = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
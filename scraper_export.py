@@ -0,0 +1,125 @@
+"""
+Export du classeur Result_data_export.xlsx en une seule écriture.
+
+Chaque tournoi terminé est déposé dans un fichier d'étape (JSON, un par
+onglet) au lieu de rouvrir et réécrire tout le classeur. `terminer` assemble
+les onglets, dans l'ordre de dépôt, dans un classeur openpyxl en écriture
+seule. La mise en page des onglets est celle de `lignes_export`, attendue par
+transform_stats.py.
+
+Les fichiers d'étape servent aussi de points de reprise : avec `reprise=True`,
+les onglets déjà déposés par l'exécution précédente sont conservés, et
+`execution.json` retient la description de cette exécution (identifiant,
+rejeu...) et si elle est allée jusqu'au bout.
+
+Les mêmes onglets sont écrits en Parquet (Result_data_export.parquet, une
+ligne par colonne de joueur), lu en priorité par transform_stats.py ; le
+classeur Excel peut alors être désactivé (`excel=False`).
+"""
+
+import glob
+import json
+import os
+import re
+
+from openpyxl import Workbook
+
+from columnar_interchange import columnar_path, table_onglets, write_table
+from scraper_records import lignes_export
+
+
+def execution_precedente(staging_dir='./data/export_staging'):
+    """Description de la dernière exécution, avec 'termine' (None s'il n'y en a pas)."""
+    try:
+        with open(os.path.join(staging_dir, 'execution.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _fichiers_etape(staging_dir):
+    """Fichiers d'étape des onglets, dans l'ordre de dépôt."""
+    paths = [path for path in glob.glob(os.path.join(staging_dir, '*.json'))
+             if re.fullmatch(r'\d+\.json', os.path.basename(path))]
+    return sorted(paths, key=lambda path: int(os.path.basename(path).split('.')[0]))
+
+
+class ExportClasseur:
+    """Classeur d'export alimenté onglet par onglet, écrit une seule fois."""
+
+    def __init__(self, filename='./data/Result_data_export.xlsx', staging_dir='./data/export_staging', excel=True,
+                 execution=None, reprise=False):
+        self.filename = filename
+        self.staging_dir = staging_dir
+        self.excel = excel
+        self.execution = dict(execution or {})
+        self._onglets = {}  # nom d'onglet -> fichier d'étape
+        self._sequence = 0
+        os.makedirs(staging_dir, exist_ok=True)
+        for path in _fichiers_etape(staging_dir):
+            if reprise:
+                # Onglets de l'exécution interrompue, repris tels quels
+                with open(path, encoding='utf-8') as f:
+                    self._onglets[json.load(f)['sheet']] = path
+                self._sequence = int(os.path.basename(path).split('.')[0])
+            else:
+                os.remove(path)
+        self._etat(termine=False)
+
+    def ajouter(self, sheet_name, records):
+        """Dépose l'onglet d'un tournoi (remplace un onglet de même nom)."""
+        ancien = self._onglets.pop(sheet_name, None)
+        if ancien:
+            os.remove(ancien)
+        self._sequence += 1
+        path = os.path.join(self.staging_dir, f'{self._sequence:04d}.json')
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'sheet': sheet_name, 'rows': list(lignes_export(records))}, f, ensure_ascii=False)
+        os.replace(f'{path}.tmp', path)
+        self._onglets[sheet_name] = path
+
+    def __contains__(self, sheet_name):
+        return sheet_name in self._onglets
+
+    def __len__(self):
+        return len(self._onglets)
+
+    def _etat(self, termine):
+        path = os.path.join(self.staging_dir, 'execution.json')
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump(dict(self.execution, termine=termine), f)
+        os.replace(f'{path}.tmp', path)
+
+    def marquer_termine(self):
+        """Note que l'exécution a traité tous ses tournois (une reprise repartira de zéro)."""
+        self._etat(termine=True)
+
+    def _lire_onglets(self):
+        for path in self._onglets.values():
+            with open(path, encoding='utf-8') as f:
+                onglet = json.load(f)
+            yield onglet['sheet'], onglet['rows']
+
+    def terminer(self):
+        """Écrit le classeur et sa table Parquet avec tous les onglets déposés (rien si aucun onglet).
+
+        Le Parquet est écrit après le classeur pour être reconnu à jour ; sans
+        Parquet, le classeur est écrit même si `excel` est désactivé.
+        """
+        if not self._onglets:
+            return
+        if self.excel:
+            self._ecrire_classeur()
+        if not write_table(table_onglets(self._lire_onglets()), columnar_path(self.filename)) and not self.excel:
+            self._ecrire_classeur()
+
+    def _ecrire_classeur(self):
+        wb = Workbook(write_only=True)
+        for sheet_name, rows in self._lire_onglets():
+            ws = wb.create_sheet(title=sheet_name)
+            for row in rows:
+                # Cellule vide plutôt que texte vide, comme le classeur classique
+                ws.append([None if value == '' else value for value in row])
+        tmp_path = f'{self.filename}.tmp'
+        wb.save(tmp_path)
+        os.replace(tmp_path, self.filename)
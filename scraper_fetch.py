@@ -0,0 +1,266 @@
+"""
+Moteur de récupération HTTP concurrent pour le scraper Tennis Explorer.
+
+Une seule session `requests` (pool de connexions keep-alive) est partagée
+par un pool de threads borné. Le nombre de requêtes simultanées vers un même
+hôte est limité par un sémaphore par hôte. Un `HttpCache` optionnel évite
+de retélécharger les pages encore valides.
+
+Le débit par hôte est régulé par un seau à jetons adaptatif : il ralentit sur
+les réponses 429/5xx (en respectant Retry-After) et accélère tant que les
+réponses sont saines. Les échecs transitoires sont retentés avec un délai
+exponentiel aléatoire. Une `PageArchive` optionnelle conserve chaque page
+servie, ou les sert seule en mode rejeu (aucun accès réseau).
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scraper_cache import HttpCache
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Encoding": "gzip, deflate"
+}
+
+
+def retry_after_seconds(value):
+    """Convertit un en-tête Retry-After (secondes ou date HTTP) en secondes, ou None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Seau à jetons dont le débit s'adapte aux réponses du serveur."""
+
+    def __init__(self, rate=4.0, min_rate=0.5, max_rate=10.0, burst=4, increase=0.2):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Attend qu'un jeton soit disponible; retourne le temps d'attente (s)."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def penalize(self, pause=None):
+        """Réduit le débit de moitié et suspend l'hôte pendant `pause` secondes."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            if pause:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+    def reward(self):
+        """Augmente progressivement le débit après une réponse saine."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+class FetchEngine:
+    """Récupère des pages en parallèle en conservant l'ordre des URLs."""
+
+    def __init__(self, max_workers=8, per_host_limit=4, timeout=10, headers=None, cache_path=None,
+                 rate=4.0, min_rate=0.5, max_rate=10.0, max_retries=3, backoff=1.0, max_backoff=60.0,
+                 archive=None):
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.cache = HttpCache(cache_path) if cache_path else None
+        self.archive = archive
+        self.rate, self.min_rate, self.max_rate = rate, min_rate, max_rate
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._host_slots = {}
+        self._buckets = {}
+        self._counters = dict.fromkeys(
+            ('requests', 'success', 'cache_hits', 'archive_hits', 'not_modified', 'retries', 'throttled',
+             'server_errors', 'network_errors', 'failures', 'bytes', 'throttle_wait_s'), 0)
+        self._lock = threading.Lock()
+        self._executor = None
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _host_slot(self, url):
+        """Retourne le sémaphore associé à l'hôte de l'URL."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_slots[host]
+
+    def _bucket(self, url):
+        """Retourne le seau à jetons associé à l'hôte de l'URL."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.min_rate, self.max_rate,
+                                                  burst=self.per_host_limit)
+            return self._buckets[host]
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self._counters[name] += value
+
+    def counters(self):
+        """Compteurs de requêtes (succès, relances, limitations...) et débit courant par hôte."""
+        with self._lock:
+            counters = dict(self._counters)
+            counters['rates'] = {host: round(bucket.rate, 2) for host, bucket in self._buckets.items()}
+        return counters
+
+    def _delay(self, attempt):
+        """Délai exponentiel avec gigue pour la tentative `attempt`."""
+        return min(self.max_backoff, self.backoff * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+    def fetch(self, url):
+        """Télécharge une URL et retourne le contenu brut (bytes) ou None."""
+        if not url:
+            return None
+        if self.archive is not None and self.archive.replay:
+            content = self.archive.get(url)
+            if content is None:
+                self._count('failures')
+                print(f"Page absente de l'archive {self.archive.run_id}: {url}")
+            else:
+                self._count('archive_hits')
+            return content
+        content = self._fetch(url)
+        if content is not None and self.archive is not None:
+            self.archive.put(url, content)
+        return content
+
+    def _fetch(self, url):
+        """Récupère une URL depuis le cache ou le réseau (avec limitation et relances)."""
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and entry[3]:
+            self._count('cache_hits')
+            return entry[0]
+        headers = self.cache.validators(entry) if self.cache else {}
+        bucket = self._bucket(url)
+
+        for attempt in range(self.max_retries + 1):
+            self._count('throttle_wait_s', bucket.acquire())
+            self._count('requests')
+            try:
+                with self._host_slot(url):
+                    response = self.session.get(url, timeout=self.timeout, headers=headers)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._count('network_errors')
+                delay, error = self._delay(attempt), e
+            else:
+                if response.status_code == 429 or response.status_code >= 500:
+                    self._count('throttled' if response.status_code == 429 else 'server_errors')
+                    pause = retry_after_seconds(response.headers.get('Retry-After'))
+                    bucket.penalize(pause)
+                    delay, error = pause if pause is not None else self._delay(attempt), f"HTTP {response.status_code}"
+                else:
+                    # Seules les réponses abouties accélèrent le débit (pas les 403/404)
+                    if 200 <= response.status_code < 300 or response.status_code == 304:
+                        bucket.reward()
+                    if response.status_code == 304 and entry is not None:
+                        self._count('not_modified')
+                        self.cache.touch(url)
+                        return entry[0]
+                    try:
+                        response.raise_for_status()
+                    except requests.exceptions.RequestException as e:
+                        self._count('failures')
+                        print(f"Request error: {e}")
+                        return None
+                    self._count('success')
+                    self._count('bytes', len(response.content))
+                    if self.cache:
+                        self.cache.put(url, response.content,
+                                       response.headers.get('ETag'), response.headers.get('Last-Modified'))
+                    return response.content
+
+            if attempt < self.max_retries:
+                self._count('retries')
+                time.sleep(min(delay, self.max_backoff))
+
+        self._count('failures')
+        print(f"Request error: {error} ({url}, abandon après {self.max_retries + 1} tentatives)")
+        return None
+
+    def fetch_many(self, urls):
+        """Télécharge une liste d'URLs en parallèle; les résultats suivent l'ordre d'entrée."""
+        urls = list(urls)
+        if len(urls) <= 1:
+            return [self.fetch(url) for url in urls]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="fetch")
+            executor = self._executor
+        return list(executor.map(self.fetch, urls))
+
+    def close(self):
+        """Libère le pool de threads et les connexions."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine(**kwargs):
+    """Retourne le moteur partagé du processus (créé au premier appel)."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine(**kwargs)
+        return _engine
+
+
+def configure_engine(**kwargs):
+    """Remplace le moteur partagé par un moteur configuré avec `kwargs`."""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.close()
+        _engine = FetchEngine(**kwargs)
+        return _engine
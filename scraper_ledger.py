@@ -0,0 +1,74 @@
+"""
+Registre persistant des matchs déjà scrapés, indexé par l'identifiant
+`match-detail/?id=` de Tennis Explorer.
+
+Pour chaque match, le registre conserve les statistiques calculées (les
+PlayerRecord des deux joueurs), leur date de calcul et une signature des
+cotes/horaires et du jour de l'exécution (plusieurs statistiques dépendent de
+la date). Un match dont la signature n'a pas changé n'est pas retéléchargé par une autre exécution du même jour, ni à
+la reprise d'une exécution interrompue. Chaque match est enregistré dès que
+son calcul est terminé.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from urllib.parse import parse_qs, urlparse
+
+# Format des données enregistrées, inclus dans les signatures : l'incrémenter
+# quand il change pour que les anciennes entrées ne soient plus relues
+LEDGER_VERSION = 2
+
+
+def match_id(url):
+    """Identifiant Tennis Explorer d'une URL match-detail (ou l'URL elle-même)."""
+    ids = parse_qs(urlparse(url).query).get('id')
+    return ids[0] if ids else url
+
+
+def match_signature(*values):
+    """Empreinte des données d'un match susceptibles de changer (cotes, date, heure...)."""
+    return hashlib.sha1(json.dumps((LEDGER_VERSION,) + values, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+class ScrapeLedger:
+    """Statistiques par match stockées dans SQLite."""
+
+    def __init__(self, db_path='./data/scrape_ledger.sqlite'):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=30)
+        self._conn.execute('''
+        CREATE TABLE IF NOT EXISTS matchs (
+            match_id TEXT PRIMARY KEY,
+            tournoi TEXT,
+            signature TEXT NOT NULL,
+            donnees BLOB NOT NULL,
+            calcule_le REAL NOT NULL
+        )
+        ''')
+        self._conn.commit()
+
+    def get(self, match_id, signature):
+        """Retourne les statistiques enregistrées si la signature est inchangée, sinon None."""
+        row = self._conn.execute(
+            'SELECT signature, donnees FROM matchs WHERE match_id = ?', (match_id,)
+        ).fetchone()
+        if row is None or row[0] != signature:
+            return None
+        return pickle.loads(zlib.decompress(row[1]))
+
+    def put(self, match_id, tournoi, signature, donnees):
+        """Enregistre (ou remplace) les statistiques d'un match."""
+        self._conn.execute(
+            'INSERT OR REPLACE INTO matchs (match_id, tournoi, signature, donnees, calcule_le) VALUES (?, ?, ?, ?, ?)',
+            (match_id, tournoi, signature, zlib.compress(pickle.dumps(donnees)), time.time())
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
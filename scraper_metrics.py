@@ -0,0 +1,162 @@
+"""
+Mesures d'exécution du scraper : durée de chaque étape d'un tournoi, pages
+téléchargées, octets, accès au cache, relances et temps d'analyse HTML.
+
+Un processus traite un tournoi à la fois : `debut_tournoi` installe les
+mesures courantes, que `etape` et `analyse` alimentent depuis n'importe quel
+thread (sans effet hors tournoi). Les compteurs HTTP sont ceux du moteur
+partagé, relevés en début et fin d'étape. Le coût se limite à quelques
+appels à perf_counter et à une copie des compteurs par étape.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Compteurs du moteur HTTP repris dans les mesures
+COMPTEURS_HTTP = ('requests', 'success', 'cache_hits', 'archive_hits', 'not_modified', 'retries', 'throttled',
+                  'failures', 'bytes', 'throttle_wait_s')
+
+
+def pages(compteurs):
+    """Pages obtenues (réseau, cache, archive ou 304)."""
+    return sum(compteurs.get(k, 0) for k in ('success', 'cache_hits', 'archive_hits', 'not_modified'))
+
+
+class Mesures:
+    """Durées et compteurs par étape pour un tournoi."""
+
+    def __init__(self, tournoi, compteurs=None):
+        self.tournoi = tournoi
+        self._compteurs = compteurs or (lambda: {})
+        self._lock = threading.Lock()
+        self.etapes = {}
+        self.analyse = {}
+        self._debut = time.perf_counter()
+        self._http_debut = self._releve()
+        self.duree_s = None
+        self.http = None
+
+    def _releve(self):
+        compteurs = self._compteurs()
+        return {k: compteurs.get(k, 0) for k in COMPTEURS_HTTP}
+
+    @staticmethod
+    def _ecart(avant, apres):
+        return {k: round(apres[k] - avant[k], 3) for k in COMPTEURS_HTTP}
+
+    @contextmanager
+    def etape(self, nom):
+        avant, debut = self._releve(), time.perf_counter()
+        try:
+            yield
+        finally:
+            duree = time.perf_counter() - debut
+            ecart = self._ecart(avant, self._releve())
+            with self._lock:
+                mesure = self.etapes.setdefault(nom, dict({'duree_s': 0.0, 'appels': 0}, **dict.fromkeys(COMPTEURS_HTTP, 0)))
+                mesure['duree_s'] += duree
+                mesure['appels'] += 1
+                for k, v in ecart.items():
+                    mesure[k] += v
+
+    def ajouter_analyse(self, kind, duree):
+        with self._lock:
+            mesure = self.analyse.setdefault(kind, {'pages': 0, 'duree_s': 0.0})
+            mesure['pages'] += 1
+            mesure['duree_s'] += duree
+
+    def terminer(self):
+        """Fige la durée totale et les compteurs HTTP du tournoi."""
+        self.duree_s = time.perf_counter() - self._debut
+        self.http = self._ecart(self._http_debut, self._releve())
+
+    def rapport(self):
+        """Mesures du tournoi sous forme de dictionnaire (JSON)."""
+        if self.duree_s is None:
+            self.terminer()
+        return {
+            'tournoi': self.tournoi,
+            'duree_s': round(self.duree_s, 3),
+            'pages': pages(self.http),
+            'http': self.http,
+            'analyse': _arrondi(self.analyse),
+            'etapes': _arrondi(self.etapes),
+        }
+
+
+def _arrondi(mesures):
+    return {nom: {k: round(v, 3) if isinstance(v, float) else v for k, v in m.items()} for nom, m in mesures.items()}
+
+
+def resume(rapport):
+    """Résumé d'une ligne d'un rapport de tournoi."""
+    http = rapport['http']
+    analyse = sum(m['duree_s'] for m in rapport['analyse'].values())
+    etapes = ', '.join(f"{nom} {m['duree_s']:.1f}s" for nom, m in rapport['etapes'].items())
+    return (f"[Mesures] {rapport['tournoi']}: {rapport['duree_s']:.1f}s | {rapport['pages']} pages "
+            f"(cache {http['cache_hits'] + http['not_modified']}, archive {http['archive_hits']}), "
+            f"{http['bytes'] / 1e6:.2f} Mo, {http['retries']} relances, {http['failures']} échecs "
+            f"| analyse {analyse:.1f}s | {etapes}")
+
+
+_courant = None
+
+
+def debut_tournoi(tournoi, compteurs=None):
+    """Démarre les mesures d'un tournoi dans ce processus."""
+    global _courant
+    _courant = Mesures(tournoi, compteurs)
+    return _courant
+
+
+def fin_tournoi():
+    """Termine les mesures en cours et retourne le rapport du tournoi (None sans mesures)."""
+    global _courant
+    mesures, _courant = _courant, None
+    return mesures.rapport() if mesures else None
+
+
+@contextmanager
+def etape(nom):
+    """Mesure une étape du tournoi en cours."""
+    mesures = _courant
+    if mesures is None:
+        yield
+        return
+    with mesures.etape(nom):
+        yield
+
+
+@contextmanager
+def analyse(kind):
+    """Mesure le temps d'analyse d'une page du tournoi en cours."""
+    mesures = _courant
+    debut = time.perf_counter()
+    try:
+        yield
+    finally:
+        if mesures is not None:
+            mesures.ajouter_analyse(kind or 'page', time.perf_counter() - debut)
+
+
+def ecrire_rapport(path, run_id, tournois, planification=None, **extra):
+    """Écrit le rapport JSON de l'exécution (écriture atomique).
+
+    planification : mesures de la lecture des tableaux avant les tournois,
+    comptées dans les totaux de l'exécution.
+    """
+    total = dict.fromkeys(COMPTEURS_HTTP, 0)
+    for rapport in tournois + ([planification] if planification else []):
+        for k in COMPTEURS_HTTP:
+            total[k] += rapport['http'][k]
+    contenu = dict({'run_id': run_id, 'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'pages': pages(total), 'http': {k: round(v, 3) for k, v in total.items()},
+                    'planification': planification, 'tournois': tournois}, **extra)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(contenu, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
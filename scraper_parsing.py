@@ -0,0 +1,60 @@
+"""
+Couche d'analyse HTML du scraper Tennis Explorer.
+
+Avec lxml, la page est analysée par libxml2 puis seuls les sous-arbres utiles
+(sélectionnés par XPath) sont convertis en BeautifulSoup. Sans lxml, on se
+rabat sur html.parser avec un SoupStrainer quand c'est possible. Les fonctions
+du scraper continuent de manipuler des objets BeautifulSoup.
+"""
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# Sous-arbres nécessaires par type de page (dans l'ordre du document)
+PAGE_XPATHS = {
+    'tournament': ['//h1[contains(concat(" ", normalize-space(@class), " "), " bg ")]'
+                   ' | //div[@id="tournamentTabs-1-data"]'],
+    'match': ['//table[not(ancestor::table)]'],
+    'player': ['//table[not(ancestor::table)]'],
+}
+
+# Équivalents html.parser (un seul nom de balise par strainer)
+PAGE_STRAINERS = {
+    'match': 'table',
+    'player': 'table',
+}
+
+
+def parse_full(content):
+    """Analyse complète de la page (chemin historique)."""
+    return BeautifulSoup(content, 'html.parser')
+
+
+def parse_page(content, kind=None):
+    """Analyse une page en ne conservant que les sous-arbres utiles à `kind`.
+
+    `kind` vaut 'tournament', 'match', 'player' ou None (page complète).
+    """
+    if kind not in PAGE_XPATHS:
+        return BeautifulSoup(content, PARSER)
+
+    if HAS_LXML:
+        try:
+            tree = lxml.html.fromstring(content)
+        except Exception:
+            # Document vide ou illisible pour libxml2
+            return BeautifulSoup(content, PARSER)
+        parts = [lxml.html.tostring(element, with_tail=False)
+                 for xpath in PAGE_XPATHS[kind] for element in tree.xpath(xpath)]
+        return BeautifulSoup(b''.join(parts), 'lxml')
+
+    if kind in PAGE_STRAINERS:
+        return BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer(PAGE_STRAINERS[kind]))
+    return BeautifulSoup(content, 'html.parser')
@@ -0,0 +1,134 @@
+"""
+Registre des joueurs tennisabstract (joueurs_ATP_WTA.csv : nom, lien).
+
+Chaque nom est indexé par ses mots normalisés triés, ce qui rend la
+recherche indépendante de l'ordre nom/prénom ('Sinner Jannik' = 'Jannik
+Sinner'), puis par une clé repliée sans accents ni tirets ni apostrophes
+('Tomás Martín Etcheverry' = 'Tomas Martin Etcheverry'), enfin par les
+lettres du nom triées, sans espaces, pour les initiales et découpages
+différents ('JJ Wolf' = 'Wolf J. J.'). Une recherche est une simple lecture
+de dictionnaire.
+
+L'index est conservé dans un petit fichier binaire à côté du CSV et n'est
+reconstruit que si le CSV change (taille ou date de modification).
+"""
+
+import csv
+import os
+import pickle
+import re
+import unicodedata
+import zlib
+
+INDEX_VERSION = 2
+
+
+def normalize_string(s):
+    """Normalise une chaîne de caractères en supprimant les espaces, les caractères spéciaux et en convertissant en minuscules."""
+    s = s.lower()
+    s = re.sub(r'\s+', '', s)  # Supprime les espaces
+    s = re.sub(r'\W+', '', s)  # Supprime les caractères spéciaux
+    return s
+
+
+def cle_joueur(nom):
+    """Mots normalisés triés du nom (espaces et tirets séparent les mots)."""
+    mots = (normalize_string(mot) for mot in re.split(r'[\s\-]+', nom))
+    return ' '.join(sorted(mot for mot in mots if mot))
+
+
+def cle_repliee(nom):
+    """Clé sans accents, tirets ni apostrophes : 'Auger-Aliassime Félix' -> 'aliassime auger felix'."""
+    sans_accents = ''.join(c for c in unicodedata.normalize('NFKD', nom) if not unicodedata.combining(c))
+    mots = re.split(r'[\W_]+', sans_accents.lower())
+    return ' '.join(sorted(mot for mot in mots if mot))
+
+
+def cle_lettres(nom):
+    """Lettres triées de la clé repliée, sans espaces : 'Wolf J. J.' -> 'fjjlow'."""
+    return ''.join(sorted(cle_repliee(nom).replace(' ', '')))
+
+
+def signature_csv(csv_path):
+    """Taille et date de modification du CSV, None s'il est absent."""
+    try:
+        stat = os.stat(csv_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class PlayerRegistry:
+    """Liens tennisabstract des joueurs, indexés par nom sans tenir compte de l'ordre."""
+
+    def __init__(self, cles=None, replis=None, source=None, lettres=None):
+        self.cles = cles or {}
+        self.replis = replis or {}
+        self.lettres = lettres or {}
+        self.source = source
+
+    @classmethod
+    def from_rows(cls, rows, source=None):
+        """Construit le registre à partir de lignes (nom, lien); le dernier lien d'un nom l'emporte."""
+        cles, replis, lettres = {}, {}, {}
+        ambigus, lettres_ambigues = set(), set()
+        for nom, lien in rows:
+            cles[cle_joueur(nom)] = lien
+            repli = cle_repliee(nom)
+            if replis.get(repli, lien) != lien:
+                ambigus.add(repli)
+            replis[repli] = lien
+            cle = cle_lettres(nom)
+            if lettres.get(cle, lien) != lien:
+                lettres_ambigues.add(cle)
+            lettres[cle] = lien
+        # Une clé de repli partagée par deux joueurs différents ne désigne personne
+        for repli in ambigus:
+            del replis[repli]
+        for cle in lettres_ambigues:
+            del lettres[cle]
+        return cls(cles, replis, source, lettres)
+
+    @classmethod
+    def load(cls, csv_path, index_path=None):
+        """Registre du CSV, lu depuis l'index binaire s'il est à jour (reconstruit sinon)."""
+        source = signature_csv(csv_path)
+        if source is None:
+            return cls()
+        if index_path and os.path.exists(index_path):
+            try:
+                with open(index_path, 'rb') as f:
+                    version, index_source, *index = pickle.loads(zlib.decompress(f.read()))
+                if version == INDEX_VERSION and index_source == source:
+                    cles, replis, lettres = index
+                    return cls(cles, replis, source, lettres)
+            except Exception as e:
+                print(f"Index des joueurs illisible ({index_path}), reconstruction: {e}")
+
+        with open(csv_path, mode='r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip the header
+            registry = cls.from_rows(((row[0], row[1]) for row in reader if row), source)
+        if index_path:
+            registry.save(index_path)
+        return registry
+
+    def save(self, index_path):
+        """Écrit l'index binaire (écriture atomique)."""
+        os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+        tmp_path = f'{index_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(zlib.compress(pickle.dumps((INDEX_VERSION, self.source, self.cles, self.replis, self.lettres))))
+        os.replace(tmp_path, index_path)
+
+    def find(self, nom):
+        """Lien tennisabstract du joueur, ou None."""
+        lien = self.cles.get(cle_joueur(nom))
+        if lien is None:
+            lien = self.replis.get(cle_repliee(nom))
+        if lien is None:
+            lien = self.lettres.get(cle_lettres(nom))
+        return lien
+
+    def __len__(self):
+        return len(self.cles)
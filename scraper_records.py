@@ -0,0 +1,176 @@
+"""
+Enregistrements typés d'un tournoi scrapé : un MatchRecord par match, avec ses
+deux PlayerRecord.
+
+Les pourcentages, compteurs et classements sont stockés en nombres. Le texte
+d'origine est conservé quand la valeur n'est pas numérique ('-', H2H dont les
+noms n'ont pas pu être remis dans l'ordre...). `ChampsJoueurs` recueille les
+champs des joueurs au fil des étapes du calcul. `lignes_export` produit les
+lignes de l'onglet Excel (un match = deux colonnes), identiques à l'ancien
+export.
+"""
+
+from dataclasses import dataclass, fields
+
+
+def nombre(valeur):
+    """Valeur numérique d'un texte ('42' -> 42, '2.0' -> 2.0), None si absente.
+
+    Seuls les textes qui se relisent à l'identique sont convertis, les autres
+    sont conservés tels quels.
+    """
+    if isinstance(valeur, list) and not valeur:
+        return None
+    if not isinstance(valeur, str):
+        return valeur
+    for conversion in (int, float):
+        try:
+            converti = conversion(valeur)
+        except ValueError:
+            continue
+        if str(converti) == valeur:
+            return converti
+    return valeur
+
+
+def texte(valeur):
+    """Rendu d'une valeur dans l'onglet d'export (texte, '' si absente)."""
+    return '' if valeur is None else str(valeur)
+
+
+@dataclass(slots=True)
+class PlayerRecord:
+    """Statistiques d'un joueur pour un match."""
+    nom: str
+    classement: int | str
+    pvc: int | None
+    pvs: int | None
+    h2h: int | str
+    h2h_2ans: int | str
+    h2h_surface: int | str
+    h2h_sets: int | str
+    win_2ans: int | None
+    win_2ans_surface: int | None
+    win_50: int | None
+    win_10: int | None
+    matchs_mois: int | float | None
+    duree_7_jours: int | None
+    def_fav_mois: int | float | None
+    vict_out_mois: int | float | None
+    premier_service: int | None
+    points_1er_service: int | None
+    balles_break_sauvees: int | None
+    cote: str
+    photo: str
+    pays: str
+    age: int | str
+    main: str
+
+
+@dataclass(slots=True)
+class MatchRecord:
+    """Un match du tournoi et ses deux joueurs."""
+    numero: int
+    tournoi: str
+    date: str
+    heure: str
+    rencontre: str
+    h2h: str
+    lien_google: str
+    lien_tennisexplorer: str
+    lieu_tournoi: str
+    round: str
+    joueur_a: PlayerRecord
+    joueur_b: PlayerRecord
+
+
+CHAMPS_JOUEUR = [champ.name for champ in fields(PlayerRecord)]
+
+
+class ChampsJoueurs:
+    """Champs des deux PlayerRecord de chaque match, renseignés étape par étape."""
+
+    def __init__(self, n):
+        self._champs = [({}, {}) for _ in range(n)]
+        self.alignes = True
+
+    def remplir(self, conversion=None, **colonnes):
+        """Renseigne des champs : une paire de valeurs par match, convertie par `conversion`.
+
+        Une colonne qui n'a pas une paire par match marque les champs comme non alignés.
+        """
+        for champ, paires in colonnes.items():
+            if len(paires) != len(self._champs):
+                self.alignes = False
+            for joueurs, valeurs in zip(self._champs, paires):
+                for joueur, valeur in zip(joueurs, valeurs):
+                    joueur[champ] = valeur if conversion is None else conversion(valeur)
+
+    def paires(self):
+        """(PlayerRecord A, PlayerRecord B) de chaque match, jusqu'au premier match incomplet."""
+        paires = []
+        for joueur_a, joueur_b in self._champs:
+            if len(joueur_a) < len(CHAMPS_JOUEUR) or len(joueur_b) < len(CHAMPS_JOUEUR):
+                break
+            paires.append((PlayerRecord(**joueur_a), PlayerRecord(**joueur_b)))
+        return paires
+
+
+# Lignes de l'onglet propres à chaque joueur : (libellé, attribut du PlayerRecord)
+EXPORT_JOUEUR = [
+    ('Nom', 'nom'),
+    ('Classement', 'classement'),
+    ('Pourcentage victoire sur la Carrière', 'pvc'),
+    ('Pourcentage victoire sur la Surface', 'pvs'),
+    ('H2H Ratio victoire/défaite ensemble carrière', 'h2h'),
+    ('H2H Ratio victoire/défaite sur 1 an (2023)', 'h2h_2ans'),
+    ('H2H Ratio victoire/défaite surface', 'h2h_surface'),
+    ('H2H Pourcentage sets gagnés', 'h2h_sets'),
+    ('Pourcentage victoire sur la Carrière (2023)', 'win_2ans'),
+    ('Pourcentage victoire sur la Surface (2023)', 'win_2ans_surface'),
+    ('Pourcentage victoires sur les 50 derniers matchs', 'win_50'),
+    ('Pourcentage victoires sur les 10 derniers matchs', 'win_10'),
+    ('Nombre de match joués sur le dernier mois', 'matchs_mois'),
+    ('Durée cumulée des matchs des 7 derniers Jours', 'duree_7_jours'),
+    ('Nombre défaite en favori (dernier mois)', 'def_fav_mois'),
+    ('Nombre victoire en outsider (dernier mois)', 'vict_out_mois'),
+    ('% 1er service dernier tournoi', 'premier_service'),
+    ('% de points gagnés sur le 1er service', 'points_1er_service'),
+    ('% de balle de break sauvées', 'balles_break_sauvees'),
+]
+
+# Lignes suivantes : (libellé, attribut, True si l'attribut est celui du joueur)
+EXPORT_MATCH = [
+    ('Côtes', 'cote', True),
+    ('Tournoi', 'tournoi', False),
+    ('Date', 'date', False),
+    ('Heure', 'heure', False),
+    ('Rencontre', 'rencontre', False),
+    ('H2H', 'h2h', False),
+    ('Lien Photo', 'photo', True),
+    ('Lien Google', 'lien_google', False),
+    ('Lien TennisExplorer', 'lien_tennisexplorer', False),
+    ('Pays', 'pays', True),
+    ('Age', 'age', True),
+    ('Main', 'main', True),
+    ('Lieu du tournoi', 'lieu_tournoi', False),
+    ('Round', 'round', False),
+]
+
+
+def lignes_export(records):
+    """Lignes de l'onglet d'un tournoi (libellé puis une valeur par joueur)."""
+    joueurs = [(record, joueur) for record in records for joueur in (record.joueur_a, record.joueur_b)]
+
+    # Ligne vide laissée en tête par l'ancien export (noms d'index pandas)
+    yield [None]
+    if not joueurs:
+        return
+    yield ['Match'] + [f'Match {record.numero}' for record, _ in joueurs]
+    yield ['Tableau'] + ['JoueurA' if joueur is record.joueur_a else 'JoueurB' for record, joueur in joueurs]
+    for libelle, attribut in EXPORT_JOUEUR:
+        yield [libelle] + [texte(getattr(joueur, attribut)) for _, joueur in joueurs]
+    for _ in range(2):
+        yield [''] + [' ' for _ in joueurs]
+    for libelle, attribut, par_joueur in EXPORT_MATCH:
+        yield [libelle] + [texte(getattr(joueur if par_joueur else record, attribut)) for record, joueur in joueurs]
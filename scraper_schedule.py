@@ -0,0 +1,89 @@
+"""
+Ordonnancement des matchs à scraper selon leur heure de début.
+
+Les matchs d'un tournoi (listes alignées de fichematch_url) sont triés du plus
+proche au plus lointain et, si un horizon est fixé, limités à ceux qui
+commencent dans les N prochaines heures. Les tournois sont ensuite traités
+dans l'ordre de leur premier match : les prédictions des matchs imminents
+sont prêtes en premier, et une courte exécution planifiée (cron) peut ne
+rafraîchir que les prochaines heures.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+
+def debut_match(date, heure, maintenant=None):
+    """Heure de début d'un match ('18.10.', '14:05'), None si elle est inconnue.
+
+    L'année est celle de `maintenant`, ou la suivante pour une date de janvier
+    lue en fin d'année.
+    """
+    maintenant = maintenant or datetime.now()
+    m_date = re.match(r'^(\d{1,2})\.(\d{1,2})\.?$', (date or '').strip())
+    m_heure = re.match(r'^(\d{1,2}):(\d{2})$', (heure or '').strip())
+    if not m_date or not m_heure:
+        return None
+    jour, mois = int(m_date.group(1)), int(m_date.group(2))
+    annee = maintenant.year + 1 if mois < maintenant.month - 6 else maintenant.year
+    try:
+        return datetime(annee, mois, jour, int(m_heure.group(1)), int(m_heure.group(2)))
+    except ValueError:
+        return None
+
+
+def alignes_tableau(tableau):
+    """True si toutes les listes par match du tableau de fichematch_url ont la même longueur."""
+    urls_M, h2h, fiche, fiche_opt = tableau
+    n = len(urls_M)
+    listes = [h2h] + [liste for i, liste in enumerate(fiche) if i != 7]
+    listes += [liste for i, liste in enumerate(fiche_opt) if i != 7]
+    return all(len(liste) == n for liste in listes)
+
+
+def planifier(tableau, horizon=None, maintenant=None, nom=''):
+    """Trie les matchs d'un tableau de fichematch_url par heure de début.
+
+    horizon (timedelta) : ne garde que les matchs qui commencent entre
+    maintenant et maintenant + horizon (les matchs déjà commencés sont
+    écartés). Les matchs sans heure passent en dernier, et sont écartés si un
+    horizon est fixé.
+
+    Retourne (tableau planifié, heure du premier match ou None). Un tableau
+    dont les listes ne sont pas alignées ne peut pas être filtré match par
+    match : il est rendu tel quel sans horizon, écarté avec un horizon (nom :
+    tournoi cité dans le message).
+    """
+    maintenant = maintenant or datetime.now()
+    urls_M, h2h, fiche, fiche_opt = tableau
+    debuts = [debut_match(date[0] if date else None, heure[0] if heure else None, maintenant)
+              for date, heure in zip(fiche[1], fiche[2])]
+    connus = [debut for debut in debuts if debut is not None]
+    premier = min(connus) if connus else None
+
+    if not alignes_tableau(tableau):
+        if horizon is not None:
+            print(f"Matchs non alignés{f' ({nom})' if nom else ''} : horizon inapplicable, tournoi écarté")
+            return None, None
+        print(f"Matchs non alignés{f' ({nom})' if nom else ''} : ordre du tableau conservé")
+        return tableau, premier
+
+    ordre = sorted(range(len(urls_M)), key=lambda i: (debuts[i] is None, debuts[i] or maintenant))
+    if horizon is not None:
+        limite = maintenant + horizon
+        ordre = [i for i in ordre if debuts[i] is not None and maintenant <= debuts[i] <= limite]
+    if not ordre:
+        return None, None
+
+    def reordonner(liste, i):
+        return liste if i == 7 else [liste[j] for j in ordre]
+
+    planifie = ([urls_M[j] for j in ordre], [h2h[j] for j in ordre],
+                [reordonner(liste, i) for i, liste in enumerate(fiche)],
+                [reordonner(liste, i) for i, liste in enumerate(fiche_opt)])
+    return planifie, debuts[ordre[0]]
+
+
+def horizon_heures(heures):
+    """Horizon en timedelta à partir d'un nombre d'heures (None : pas de limite)."""
+    return None if heures is None else timedelta(hours=heures)
@@ -1,20 +1,39 @@
 import os
 import re
 import sys
+import ast
+import copy
+import argparse
+import multiprocessing
+import json
 import math
 import requests
 import pandas as pd
 import numpy as np
 from bs4 import BeautifulSoup as soup
 from datetime import datetime, timedelta
-from itertools import permutations
 from openpyxl import load_workbook, Workbook
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
+try:
+    from selenium import webdriver
+    from selenium.webdriver.firefox.options import Options
+except ImportError:  # Selenium n'est requis qu'avec ABSTRACT_MODE = 'selenium' ou le repli navigateur
+    webdriver = None
 import csv
 from pathlib import Path
+from urllib.parse import urljoin
 import time
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from scraper_fetch import get_engine
+from scraper_parsing import parse_page
+from scraper_ledger import ScrapeLedger, match_id, match_signature
+from scraper_archive import PageArchive, new_run_id
+from scraper_records import ChampsJoueurs, MatchRecord, lignes_export, nombre
+from scraper_export import ExportClasseur, execution_precedente
+from scraper_players import PlayerRegistry
+from scraper_schedule import alignes_tableau, horizon_heures, planifier
+from scraper_metrics import analyse, debut_tournoi, ecrire_rapport, etape, fin_tournoi, resume
 
 # Supprimer les avertissements pandas FutureWarning
 warnings.filterwarnings('ignore', category=FutureWarning)
@@ -22,8 +41,28 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 ####################### CONFIGURATION #######################
 # Chemins locaux
 CSV_FILENAME = './data/joueurs_ATP_WTA.csv'  # Chemin local pour le fichier joueurs
+PLAYERS_INDEX_PATH = './data/joueurs_ATP_WTA.idx'  # Index binaire du fichier joueurs, reconstruit quand le CSV change
 GECKODRIVER_PATH = './geckodriver'  # Chemin vers Geckodriver
 DATA_FOLDER = './data'  # Dossier pour les fichiers générés
+FETCH_WORKERS = 8  # Nombre de téléchargements simultanés
+FETCH_PER_HOST = 4  # Nombre maximal de connexions simultanées par hôte
+FETCH_RATE = 4.0  # Débit initial par hôte (requêtes/s), ajusté selon les réponses
+FETCH_MAX_RATE = 10.0  # Débit maximal par hôte (requêtes/s)
+FETCH_RETRIES = 3  # Nouvelles tentatives sur 429, 5xx et erreurs réseau
+HTTP_CACHE_PATH = './data/http_cache.sqlite'  # Cache persistant des pages (None pour désactiver)
+ARCHIVE_FOLDER = './data/archive'  # Archive des pages brutes par exécution (None pour désactiver)
+EXPORT_XLSX = './data/Result_data_export.xlsx'  # Classeur d'export des tournois
+EXPORT_EXCEL = True  # Écrire aussi le classeur Excel (sinon seulement Result_data_export.parquet si pyarrow est installé)
+EXPORT_STAGING_FOLDER = './data/export_staging'  # Onglets en attente d'assemblage dans le classeur
+PRIORITE_HORAIRE = True  # Traiter les matchs (et les tournois) du plus proche au plus lointain
+RUN_REPORT_PATH = './data/run_report.json'  # Rapport de l'exécution : durées et compteurs par tournoi et par étape
+SCRAPE_LEDGER_PATH = './data/scrape_ledger.sqlite'  # Registre des matchs déjà scrapés (None pour désactiver)
+MATCHS_PAR_LOT = 4  # Matchs calculés ensemble, enregistrés dans le registre dès que leur lot est prêt
+ABSTRACT_MODE = 'http'  # 'http' (sans navigateur) ou 'selenium'
+ABSTRACT_SELENIUM_FALLBACK = False  # Repli Selenium si les données embarquées sont absentes
+ABSTRACT_DRIVERS = 3  # Nombre de navigateurs headless pour tennisabstract
+ABSTRACT_PAGES_PER_DRIVER = 50  # Pages chargées avant de recycler un navigateur
+ABSTRACT_WAIT_TIMEOUT = 15  # Attente maximale (s) de la table recent-results
 #############################################################
 
 
@@ -37,20 +76,61 @@ def listing(datas):
         for data in datas:
             print(len(data),data)
 
-def extract_source(url):
-    """Extraire le HTML d'une URL."""
+_run = {'run_id': None, 'replay': False, 'archive': None, 'workers': 1, 'jour': None}
+
+def configure_run(run_id=None, replay=False, workers=1):
+    """Fixe l'exécution courante (avant le premier téléchargement); retourne son identifiant.
+
+    En rejeu, toutes les pages sont lues dans l'archive de l'exécution run_id.
+    L'archive est ouverte ici une fois pour toutes (manifestes relus en rejeu).
+    workers : processus qui téléchargent en même temps; chacun n'a droit qu'à
+    sa part des limites par hôte.
+    """
+    _run['run_id'] = run_id or new_run_id()
+    _run['replay'] = replay
+    _run['workers'] = max(1, workers)
+    _run['jour'] = jour_execution(_run['run_id'])
+    _run['archive'] = PageArchive(ARCHIVE_FOLDER, _run['run_id'], replay) if ARCHIVE_FOLDER else None
+    return _run['run_id']
+
+def jour_execution(run_id=None):
+    """Jour de référence des calculs : celui du début de l'exécution run_id (horodatée), sinon aujourd'hui."""
     try:
-        with requests.Session() as session:
-            session.headers.update({
-                "User-Agent": "Mozilla/5.0",
-                "Accept-Encoding": "gzip, deflate"
-            })
-            response = session.get(url, timeout=10)
-            response.raise_for_status()
-            return soup(response.content, 'html.parser')
-    except requests.exceptions.RequestException as e:
-        print(f"Request error: {e}")
+        return datetime.strptime((run_id or '')[:8], '%Y%m%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return datetime.now().strftime('%Y-%m-%d')
+
+def fetch_engine():
+    """Retourne le moteur HTTP partagé (session keep-alive + pool de threads).
+
+    L'archive de l'exécution n'est transmise qu'à la création du moteur. Avec
+    plusieurs processus, connexions et débits par hôte sont partagés entre eux
+    (au moins une connexion chacun).
+    """
+    part = _run['workers']
+    return get_engine(max_workers=FETCH_WORKERS, per_host_limit=max(1, FETCH_PER_HOST // part),
+                      cache_path=HTTP_CACHE_PATH, rate=FETCH_RATE / part, min_rate=0.5 / part,
+                      max_rate=FETCH_MAX_RATE / part, max_retries=FETCH_RETRIES, archive=_run['archive'])
+
+def extract_source(url, kind=None):
+    """Extraire le HTML d'une URL (kind: 'tournament', 'match', 'player' ou None pour la page complète)."""
+    content = fetch_engine().fetch(url)
+    if content is None:
         return None
+    with analyse(kind):
+        return parse_page(content, kind)
+
+def extract_sources(urls, kind=None):
+    """Extraire le HTML d'une liste d'URLs en parallèle (résultats dans l'ordre des URLs)."""
+    contents = fetch_engine().fetch_many(urls)
+    pages = []
+    for content in contents:
+        if content is None:
+            pages.append(None)
+            continue
+        with analyse(kind):
+            pages.append(parse_page(content, kind))
+    return pages
 
 def calculer_ratio(data, separateur):
     """Calculer le ratio en pourcentage à partir des données."""
@@ -172,7 +252,7 @@ def fichematch_url(url):
     """Extraire les informations d'un match à partir de l'URL fournie."""
     #try:
     HTH = []
-    page = extract_source(url)
+    page = extract_source(url, 'tournament')
     if not page:
         return None
 
@@ -268,71 +348,90 @@ def create_match(year, tournament, surface, player_one, player_two, sets_one, se
         'Sets_gagnés_2': sets_two,
     }
 
-def fichejoueur_url(urls):
-    """Extraire les URLs des joueurs à partir des matchs."""
-    liste, urls_img_J, nom_class, matches = [], [], [], []
+# Extraction mesurée à part de l'analyse HTML (déjà mesurée sous 'match' par extract_source/extract_sources)
+@analyse('match-extraction')
+def parse_match_page(page):
+    """Analyser une page de match : URLs et images des joueurs, tableau H2H ('' si absent)."""
+    liste, urls_img_J, match_tp = [], [], []
     racine = 'https://www.tennisexplorer.com'
+    verif = True
+
+    # Extraction des URLs des joueurs
+    for result in page.find_all('th', class_='plName'):
+        a = result.find('a', href=True)
+        if a and a['href'].startswith('/player/'):
+            liste.append(f"{racine}{a['href']}")
+
+    # Extraction des images des joueurs
+    for img_tag in page.find_all('td', class_='thumb'):
+        img = img_tag.find('img', src=True)
+        if img:
+            urls_img_J.append(f"{racine}{img['src']}")
+
+    # Extraction des tableaux de résultats
+    tables = page.find_all('table', class_='result')
+    try:
+        table = tables[4]
+        rows = table.find_all('tr', class_=['one', 'two'])
+        for i in range(0, len(rows), 2):
+            row_one = rows[i]
+            row_two = rows[i + 1]
+            columns_one = row_one.find_all('td')
+            columns_two = row_two.find_all('td')
 
-    for url in urls:
-        match_tp = []
-        verif = True
-        page = extract_source(url)
-        if not page:
-            continue
+            year = columns_one[0].get_text()
+
+        # Vérification si l'année est valide
+            try:
+                year = int(year)
+            except ValueError:
+                verif = False
+
+            tournament = columns_one[1].get_text()
+            span_element = columns_one[4].find('span')
+            surface = span_element['title'] if span_element else "Info non disponible"
+            player_one = columns_one[2].get_text()
+            player_two = columns_two[0].get_text()
+            sets_one = columns_one[3].get_text()
+            sets_two = columns_two[1].get_text()
+            scores_one = [col.get_text().strip() for col in columns_one[5:10]]
+            scores_two = [col.get_text().strip() for col in columns_two[2:7]]
+
+            match = create_match(year, tournament, surface, player_one, player_two, sets_one, sets_two, scores_one, scores_two)
+            if verif:
+              match_tp.append(match)
+            else:
+              match_tp.append('')
 
-        # Extraction des URLs des joueurs
-        for result in page.find_all('th', class_='plName'):
-            a = result.find('a', href=True)
-            if a and a['href'].startswith('/player/'):
-                liste.append(f"{racine}{a['href']}")
+        return liste, urls_img_J, pd.DataFrame(match_tp)
 
-        # Extraction des images des joueurs
-        for img_tag in page.find_all('td', class_='thumb'):
-            img = img_tag.find('img', src=True)
-            if img:
-                urls_img_J.append(f"{racine}{img['src']}")
+    except IndexError:
+        return liste, urls_img_J, ''
 
-        # Extraction des tableaux de résultats
-        tables = page.find_all('table', class_='result')
-        try:
-            table = tables[4]
-            rows = table.find_all('tr', class_=['one', 'two'])
-            for i in range(0, len(rows), 2):
-                row_one = rows[i]
-                row_two = rows[i + 1]
-                columns_one = row_one.find_all('td')
-                columns_two = row_two.find_all('td')
+def fetch_match_page(url):
+    """Télécharger et analyser une page de match (None si indisponible)."""
+    page = extract_source(url, 'match')
+    if not page:
+        return None
+    return parse_match_page(page)
 
-                year = columns_one[0].get_text()
+def fichejoueur_url(urls, parsed=None):
+    """Extraire les URLs des joueurs à partir des matchs.
 
-            # Vérification si l'année est valide
-                try:
-                    year = int(year)
-                except ValueError:
-                    verif = False
-
-                tournament = columns_one[1].get_text()
-                span_element = columns_one[4].find('span')
-                surface = span_element['title'] if span_element else "Info non disponible"
-                player_one = columns_one[2].get_text()
-                player_two = columns_two[0].get_text()
-                sets_one = columns_one[3].get_text()
-                sets_two = columns_two[1].get_text()
-                scores_one = [col.get_text().strip() for col in columns_one[5:10]]
-                scores_two = [col.get_text().strip() for col in columns_two[2:7]]
-
-                match = create_match(year, tournament, surface, player_one, player_two, sets_one, sets_two, scores_one, scores_two)
-                if verif:
-                  match_tp.append(match)
-                else:
-                  match_tp.append('')
+    parsed : pages de match déjà analysées par parse_match_page (dans l'ordre de urls).
+    """
+    liste, urls_img_J, matches = [], [], []
 
-            df = pd.DataFrame(match_tp)
-            matches.append(df)
+    if parsed is None:
+        parsed = [parse_match_page(page) if page else None for page in extract_sources(urls, 'match')]
 
-        except IndexError:
-            matches.append('')
+    for entry in parsed:
+        if entry is None:
             continue
+        players, images, h2h = entry
+        liste.extend(players)
+        urls_img_J.extend(images)
+        matches.append(h2h)
 
     urls_J = [liste[i:i + 2] for i in range(0, len(liste), 2)]
     urls_img_J = [urls_img_J[i:i + 2] for i in range(0, len(urls_img_J), 2)]
@@ -374,74 +473,102 @@ def process_rangs(rangs):
 
     return rang, rang_best
 
-def Tableau(urls):
+PLAYER_DETAIL_PREFIXES = ('Country:', 'Age:', 'Plays:', 'Current/Highest rank - singles:')
+
+def parse_player_details(info):
+    """Extraire pays, âge, main et classement des lignes de détail d'un joueur."""
+    def get_element(prefix):
+        return next((element for element in info if element.startswith(prefix)), '')
+
+    country, age, hand, rank = [get_element(prefix) for prefix in PLAYER_DETAIL_PREFIXES]
+    return [country.split(': ')[1] if ': ' in country else '',
+            age.split(' (')[0].split(': ')[1] if ': ' in age else '',
+            hand.split(': ')[1] if ': ' in hand else '',
+            rank.split(': ')[1] if ': ' in rank else '']
+
+@analyse('player-extraction')
+def parse_player_page(page, url=''):
+    """Analyser une fiche joueur en une seule passe.
+
+    Retourne un enregistrement contenant le bilan de carrière, le sommaire par
+    surface, les derniers matchs, le pays, l'âge, la main et le classement.
+    """
+    record = {'url': url, 'page': page is not None, 'name': 'Unknown', 'career': None, 'summary': None,
+              'recent_matches': None, 'country': '', 'age': '', 'hand': '', 'rank': ''}
+    if page is None:
+        return record
+
+    table_detail = page.find_all('table', class_='plDetail')
+    record['country'], record['age'], record['hand'], record['rank'] = parse_player_details(extract_player_info(table_detail))
+
+    summary_tr = page.find('tr', class_='summary')
+    if summary_tr:
+        tds = summary_tr.find_all('td')
+        datas = [td.a.text if td.a else 'None' for td in tds[1:7]]
+        record['summary'] = dict(zip(("Summary", "Clay", "Hard", "Indoors", "Grass", "Not set"), datas))
+
+    tables = page.find_all('table', class_='result balance')
+    if not tables:
+        return record
+
+    tr_with_photo = page.select_one('tr:has(td.photo)')
+    record['name'] = tr_with_photo.find('h3').text if tr_with_photo else 'Unknown'
+
+    record['career'] = [
+        create_match_tab(*[column.get_text() for column in row.find_all('td')[:7]])
+        for row in tables[0].find_all('tr', class_=['one', 'two'])
+    ]
+
+####### Sur le dernier mois nbr de match joués / défaite en favori / victoire en outsider
+    record['recent_matches'] = process_matches(tables)
+    return record
+
+def fetch_player_page(url):
+    """Télécharger et analyser une fiche joueur."""
+    page = extract_source(url, 'player')
+    return parse_player_page(page, url)
+
+def extract_player_pages(urls):
+    """Télécharger et analyser chaque fiche joueur une seule fois (paires conservées)."""
+    pages = iter(extract_sources([url for url_list in urls for url in url_list if url], 'player'))
+    return [[parse_player_page(next(pages), url) if url else None for url in url_list] for url_list in urls]
+
+def Tableau(players):
     career_J, info_J, player_names, match_J = [], [], [], []
-    for url_list in urls:
+    for player_list in players:
         match_tp = []
-        for url in url_list:
-            if not url:
+        for player in player_list:
+            if player is None:
                 match_tp.append(create_match_tab('', '', '', '', '', '', ''))
                 continue
-            page = extract_source(url)
 
 ############################################career_J, fiche_J#############################
-            if not page:
+            if not player['page']:
                 match_tp.append(create_match_tab('Er', 'Er', 'Er', 'Er', 'Er', 'Er', 'Er'))
                 continue
 
-            table_detail = page.find_all('table', class_='plDetail')
-            info_J.append(extract_player_info(table_detail))
+            info_J.append([player['country'], player['age'], player['hand'], player['rank']])
 
-            tables = page.find_all('table', class_='result balance')
-            if not tables:
-                print(f"No tables found for URL: {url}")
+            if player['career'] is None:
+                print(f"No tables found for URL: {player['url']}")
                 match_tp.append(create_match_tab('Er', 'Er', 'Er', 'Er', 'Er', 'Er', 'Er'))
                 continue
 
-            tr_with_photo = page.select_one('tr:has(td.photo)')
-            player_name = tr_with_photo.find('h3').text if tr_with_photo else 'Unknown'
-            player_names.append(player_name)
+            player_names.append(player['name'])
 
-
-            table = tables[0]
-            rows = table.find_all('tr', class_=['one', 'two'])
-            for row in rows:
-                columns = row.find_all('td')
-                match_tp.append(create_match_tab(
-                    columns[0].get_text(),  # year
-                    columns[1].get_text(),  # summary
-                    columns[2].get_text(),  # surf_clay
-                    columns[3].get_text(),  # surf_hard
-                    columns[4].get_text(),  # surf_indoor
-                    columns[5].get_text(),  # surf_grass
-                    columns[6].get_text()   # not_set
-                ))
+            match_tp.extend(player['career'])
 
             if match_tp:
               career_J.append(pd.DataFrame(match_tp))
               match_tp = []
 
 ####### Sur le dernier mois nbr de match joués / défaite en favori / victoire en outsider
-            match_J.append(process_matches(tables))
+            match_J.append(player['recent_matches'])
 
 
 ########################################################################################
     career_J = [career_J[i:i + 2] for i in range(0, len(career_J), 2) if i + 1 < len(career_J)]
 
-    prefixes = ('Country:', 'Age:', 'Plays:','Current/Highest rank - singles:')
-
-    def get_element(sub_list, prefix):
-        return next((element for element in sub_list if element.startswith(prefix)), '')
-
-    info_J = [[get_element(sub_list, prefix) for prefix in prefixes] for sub_list in info_J]
-
-    info_J = [[item[0].split(': ')[1] if ': ' in item[0] else '',
-                item[1].split(' (')[0].split(': ')[1] if ': ' in item[1] else '',
-                item[2].split(': ')[1] if ': ' in item[2] else '',
-                item[3].split(': ')[1] if ': ' in item[3] else ''
-                ]
-              for item in info_J]
-
     countries, ages, hands, rangs = [paires(list(x)) for x in zip(*info_J)]
 
     rang, rang_best = process_rangs(rangs)
@@ -452,31 +579,17 @@ def Tableau(urls):
     return career_J, fiche_J,match_J
 
 ####
-def Win_Car_Surf(urls, surf):
+def Win_Car_Surf(players, surf):
     PVCratio, PVSratio = [], []
 
-    def traiter_page(page, surf):
-        summary_tr = page.find('tr', class_='summary')
-        if summary_tr:
-            tds = summary_tr.find_all('td')
-            get_text = lambda td: td.a.text if td.a else 'None'
-            datas = [get_text(td) for td in tds[1:7]]
-            surfaces = {"Summary": datas[0], "Clay": datas[1], "Hard": datas[2], "Indoors": datas[3], "Grass": datas[4], "Not set": datas[5]}
-            dataS = surfaces.get(surf, "None")
-            PVC = calculer_ratio(datas[0], '/')[0]
-            PVCratio.append(f'{math.ceil(PVC)}')
-            PVS = calculer_ratio(dataS, '/')[0]
-            PVSratio.append(f'{math.ceil(PVS)}')
-    for groupe_urls in urls:
-        for url in groupe_urls:
-            page = extract_source(url)
-            if page:
-                traiter_page(page, surf)
-                tbody = page.find('table', class_='result balance')
-                if tbody:
-                    two_tr = tbody.find('tr', class_='two')
-                    if two_tr:
-                       tds = two_tr.find_all('td')
+    for player_list in players:
+        for player in player_list:
+            if player and player['summary']:
+                dataS = player['summary'].get(surf, "None")
+                PVC = calculer_ratio(player['summary']['Summary'], '/')[0]
+                PVCratio.append(f'{math.ceil(PVC)}')
+                PVS = calculer_ratio(dataS, '/')[0]
+                PVSratio.append(f'{math.ceil(PVS)}')
     return paires(PVCratio), paires(PVSratio)
 
 ########
@@ -562,6 +675,85 @@ def sets_win(df):
 
     return resultat
 
+H2H_COLUMNS = ('Année', 'Surface', 'Joueur_1', 'Joueur_2', 'Gagnant', 'Rencontre', 'Sets_gagnés_1', 'Sets_gagnés_2')
+
+def h2h_typee(ele):
+    """Vrai si le tableau H2H est complet (aucune ligne vide), donc agrégeable en bloc."""
+    if not isinstance(ele, pd.DataFrame) or ele.empty or not set(H2H_COLUMNS).issubset(ele.columns):
+        return False
+    if ele[list(H2H_COLUMNS)].isnull().any().any():
+        return False
+    # sets_win n'accepte que les deux joueurs de la première rencontre
+    joueurs = set(ele['Rencontre'].iloc[0].split(' - ')[:2])
+    return set(ele['Joueur_1']).union(ele['Joueur_2']).issubset(joueurs)
+
+def agregation_h2h(h2h_Tab, lastan, surf):
+    """Ratios H2H (année lastan, année suivante, surface) et sets gagnés en une passe.
+
+    Tous les tableaux H2H du tournoi sont concaténés en une table avec une clé
+    de match, puis agrégés par groupby. Résultats identiques à
+    h2h_an_surf / sets_win (les tableaux incomplets passent par ces fonctions).
+    Retourne (h2h_lastan_f, h2h_an_f, h2h_surf_f, h2h_sets_win).
+    """
+    filtres = (('Année', lastan), ('Année', str(int(lastan) + 1)), ('Surface', surf))
+    resultats = [[['0', '0'] for _ in h2h_Tab] for _ in range(len(filtres) + 1)]
+
+    typees = []
+    for i, ele in enumerate(h2h_Tab):
+        if h2h_typee(ele):
+            typees.append(i)
+        elif isinstance(ele, pd.DataFrame):
+            ele = ele.copy()
+            for k, (column, value) in enumerate(filtres):
+                resultats[k][i] = h2h_an_surf([ele], column, value)[0]
+            resultats[-1][i] = sets_win(ele)
+    if not typees:
+        return tuple(resultats)
+
+    # Année convertie tableau par tableau, comme le faisait h2h_an_surf
+    table = pd.concat([h2h_Tab[i][list(H2H_COLUMNS)].assign(**{'Année': h2h_Tab[i]['Année'].astype(str), 'match': i})
+                       for i in typees], ignore_index=True)
+    table['rang'] = np.arange(len(table))
+
+    # Vue longue : une ligne par joueur et par rencontre (joueur 1 puis joueur 2)
+    victoire_1 = (table['Gagnant'] == table['Joueur_1']).to_numpy()
+    longue = pd.DataFrame({
+        'match': np.repeat(table['match'].to_numpy(), 2),
+        'ordre': np.repeat(table['rang'].to_numpy() * 2, 2) + np.tile([0, 1], len(table)),
+        'joueur': np.column_stack([table['Joueur_1'], table['Joueur_2']]).ravel(),
+        'victoire': np.column_stack([victoire_1, ~victoire_1]).ravel().astype(int),
+    })
+    for k, (column, value) in enumerate(filtres):
+        masque = np.repeat((table[column] == value).to_numpy(), 2)
+        bilan = (longue[masque].groupby(['match', 'joueur'], sort=False)
+                 .agg(victoires=('victoire', 'sum'), matchs=('victoire', 'size'), ordre=('ordre', 'min'))
+                 .reset_index().sort_values('ordre'))
+        for i, groupe in bilan.groupby('match', sort=False):
+            resultats[k][i] = [[f"{joueur}: {'{:.0f}'.format(int(v) / int(n) * 100)}"]
+                               for joueur, v, n in zip(groupe['joueur'], groupe['victoires'], groupe['matchs'])]
+
+    # Sets : gagnés par joueur et joués dans ses rencontres
+    def sets_entiers(colonne):
+        valeurs = table[colonne].astype(str)
+        return pd.to_numeric(valeurs.where(valeurs.str.isdigit()), errors='coerce').fillna(0).astype(int)
+
+    sets_1, sets_2 = sets_entiers('Sets_gagnés_1'), sets_entiers('Sets_gagnés_2')
+    sets = pd.DataFrame({
+        'match': np.repeat(table['match'].to_numpy(), 2),
+        'joueur': longue['joueur'],
+        'gagnes': np.column_stack([sets_1, sets_2]).ravel(),
+        'joues': np.repeat((sets_1 + sets_2).to_numpy(), 2),
+    }).groupby(['match', 'joueur']).sum()
+    for i in typees:
+        joueur_1, joueur_2 = h2h_Tab[i]['Rencontre'].iloc[0].split(' - ')[:2]
+        pourcentages = []
+        for joueur in (joueur_1, joueur_2):
+            gagnes, joues = sets.loc[(i, joueur)] if (i, joueur) in sets.index else (0, 0)
+            pourcentages.append(math.ceil(100 * int(gagnes) / int(joues)) if joues > 0 else 0)
+        resultats[-1][i] = [f"{joueur_1}: {pourcentages[0]}", f"{joueur_2}: {pourcentages[1]}"]
+
+    return tuple(resultats)
+
 def win_perso(career_J,surf,an, audit=False):
     a, b, e, f ,bb ,ff = [], [], [], [], [], []
 
@@ -712,6 +904,80 @@ def win_perso_10_50(career_J):
 
 ########################################################
 
+def bilan_vd(valeur):
+    """(victoires, défaites) d'une cellule 'V/D' de la fiche carrière, None si illisible."""
+    try:
+        victoires, defaites = str(valeur).split('/')
+        return int(victoires), int(defaites)
+    except (ValueError, TypeError):
+        return None
+
+def ratio_vd(valeur, vd):
+    """Pourcentage de victoires arrondi au supérieur (mêmes règles que calculer_ratio)."""
+    if vd is None:
+        # '-' et 'None' valent 0; toute autre valeur lève la même erreur qu'avant
+        return math.ceil(calculer_ratio(valeur, '/')[0])
+    victoires, defaites = vd
+    return math.ceil(victoires * 100 / (victoires + defaites)) if victoires + defaites else 0
+
+def features_carriere(career_J, surf, lastan):
+    """Statistiques de carrière de tous les joueurs en une passe.
+
+    Chaque cellule 'V/D' n'est lue qu'une fois; les ratios par année et les
+    ratios sur 10 / 50 matchs viennent de sommes cumulées par joueur.
+    Résultats identiques à win_perso_moy_2ans et win_perso_10_50.
+    Retourne (win_2ans, win_2ans_surf, win_10, win_50).
+    """
+    frames = [df for htablist in career_J for df in htablist]
+    if len(frames) % 2 or not all(isinstance(df, pd.DataFrame) and {'Année', 'Sommaire', surf}.issubset(df.columns)
+                                  for df in frames):
+        # Cas irréguliers : fonctions historiques
+        win_2ans, win_2ans_surf = win_perso_moy_2ans(career_J, surf, lastan)
+        win_10, win_50 = win_perso_10_50(career_J)
+        return win_2ans, win_2ans_surf, win_10, win_50
+    if not frames:
+        return [], [], [], []
+
+    table = pd.concat([df[['Année', 'Sommaire', surf]].set_axis(['Année', 'Sommaire', 'Surface'], axis=1).assign(joueur=p)
+                       for p, df in enumerate(frames)], ignore_index=True)
+    lectures = {valeur: bilan_vd(valeur) for valeur in pd.unique(table[['Sommaire', 'Surface']].to_numpy().ravel())}
+
+    # Ratios de l'année (première ligne de l'année pour chaque joueur, 0 sinon)
+    def ratios_annee(an):
+        somm, surface = [0] * len(frames), [0] * len(frames)
+        lignes = table[table['Année'] == f'{an}'].drop_duplicates('joueur')
+        for p, valeur_somm, valeur_surf in zip(lignes['joueur'], lignes['Sommaire'], lignes['Surface']):
+            somm[p] = ratio_vd(valeur_somm, lectures.get(valeur_somm))
+            surface[p] = ratio_vd(valeur_surf, lectures.get(valeur_surf))
+        return somm, surface
+
+    somm_lastan, surf_lastan = ratios_annee(lastan)
+    somm_an, surf_an = ratios_annee(datetime.now().year)
+    moyenne_h = [math.ceil((a + b) / 2) for a, b in zip(somm_lastan, somm_an)]
+    moyenne_i = [math.ceil((a + b) / 2) for a, b in zip(surf_lastan, surf_an)]
+
+    # 10 / 50 derniers matchs : cumul des bilans valides, dans l'ordre de la fiche
+    bilans = table['Sommaire'].map(lectures)
+    valides = table[bilans.notna()].assign(victoires=[vd[0] for vd in bilans.dropna()],
+                                           defaites=[vd[1] for vd in bilans.dropna()])
+    cumul = valides.groupby('joueur')[['victoires', 'defaites']].cumsum()
+    valides = valides.assign(victoires=cumul['victoires'], defaites=cumul['defaites'],
+                             total=cumul['victoires'] + cumul['defaites'])
+
+    def ratios(lignes):
+        return {p: f"{math.ceil(calculer_ratio(f'{v}/{d}', '/')[0])}"
+                for p, v, d in zip(lignes['joueur'], lignes['victoires'], lignes['defaites'])}
+
+    plus_de_10 = valides[valides['total'] > 10]
+    apres_10 = ratios(plus_de_10.groupby('joueur').head(1))
+    # Premier passage au-dessus de 50 matchs, sinon total de la fiche (si plus de 10)
+    apres_50 = {**ratios(plus_de_10.groupby('joueur').tail(1)),
+                **ratios(valides[valides['total'] > 50].groupby('joueur').head(1))}
+    win_10 = [apres_10.get(p, []) for p in range(len(frames))]
+    win_50 = [apres_50.get(p, []) for p in range(len(frames))]
+
+    return paires(moyenne_h), paires(moyenne_i), paires(win_10), paires(win_50)
+
 def process_matches(table):
     def create_match(date, matches, resultat, cote_H, cote_A):
         return {
@@ -897,70 +1163,71 @@ def matchjouemois(lf):
 ##########
 
 from datetime import datetime
-from itertools import permutations
 import math
 from bs4 import BeautifulSoup
 
-def load_players_from_csv(filename):
-    """Charge les joueurs existants à partir du fichier CSV."""
-    joueurs_dict = {}
-    try:
-        with open(filename, mode='r', newline='', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            next(reader)  # Skip the header
-            for row in reader:
-                if row:
-                    joueurs_dict[normalize_string(row[0])] = row[1]
-    except FileNotFoundError:
-        return {}
-    return joueurs_dict
-
-def normalize_string(s):
-    """Normalise une chaîne de caractères en supprimant les espaces, les caractères spéciaux et en convertissant en minuscules."""
-    s = s.lower()
-    s = re.sub(r'\s+', '', s)  # Supprime les espaces
-    s = re.sub(r'\W+', '', s)  # Supprime les caractères spéciaux
-    return s
-
-def generate_name_permutations(full_name):
-    """Génère toutes les permutations possibles des noms."""
-    names = full_name.split()
-    permutations_list = [''.join(p) for p in permutations(names)]
-    return [normalize_string(p) for p in permutations_list]
-
-def search_player(joueurs_dict, player_name):
-    """Cherche le joueur par nom (y compris permutations) et retourne le lien s'il est trouvé."""
-    name_permutations = generate_name_permutations(player_name)
+_players = None
+
+def player_registry():
+    """Registre des joueurs tennisabstract, chargé une fois par processus."""
+    global _players
+    if _players is None:
+        _players = PlayerRegistry.load(csv_url, PLAYERS_INDEX_PATH)
+    return _players
+
+def search_player(registry, player_name):
+    """Cherche le joueur par nom (dans n'importe quel ordre) et retourne le lien s'il est trouvé."""
+    player_link = registry.find(player_name)
     if audit1:
         print("\nplayer_name: ",player_name)
-        print("name_permutations: ",name_permutations)
-
-    for permuted_name in name_permutations:
-        if permuted_name in joueurs_dict:
-            return joueurs_dict[permuted_name]
-    return None
+        print("player_link: ",player_link)
+    return player_link
 
 def initialize_driver():
     """Initialise le driver Firefox avec les options nécessaires."""
+    if webdriver is None:
+        raise ImportError("Selenium est requis pour ABSTRACT_MODE = 'selenium' (pip install selenium)")
     firefox_options = Options()
     firefox_options.add_argument("--headless")
     driver = webdriver.Firefox(options=firefox_options)
     return driver
 
-def fetch_page_source(url, driver):
-    """Récupère le contenu HTML de la page spécifiée."""
+_driver_pool = None
+_driver_pool_lock = threading.Lock()
+
+def abstract_pool():
+    """Retourne le pool de navigateurs partagé (créé au premier appel, un seul par processus)."""
+    global _driver_pool
+    # Les threads tennisabstract de pipeline_matchs l'appellent en même temps
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            from scraper_browser import DriverPool
+            _driver_pool = DriverPool(size=ABSTRACT_DRIVERS, max_pages=ABSTRACT_PAGES_PER_DRIVER,
+                                      wait_timeout=ABSTRACT_WAIT_TIMEOUT, driver_factory=initialize_driver)
+        return _driver_pool
+
+def close_abstract_pool():
+    """Ferme les navigateurs du pool partagé."""
+    global _driver_pool
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+    if pool is not None:
+        pool.close()
+
+def fetch_page_source(url, driver=None):
+    """Récupère le contenu HTML de la page spécifiée via le pool de navigateurs."""
+    archive = fetch_engine().archive
+    if archive is not None and archive.replay:
+        content = archive.get(url)
+        return content.decode('utf-8') if content is not None else None
     try:
-        # Vérifier si le driver est encore valide
-        if driver.current_window_handle:
-            driver.get(url)
-            time.sleep(5)  # Attendre que la page se charge complètement
-            return driver.page_source
-        else:
-            print("Driver window is not available")
-            return None
+        page_source = abstract_pool().fetch(url)
     except Exception as e:
         print(f"Erreur lors de la récupération de la page {url}: {e}")
         return None
+    if page_source is not None and archive is not None:
+        archive.put(url, page_source.encode('utf-8'))
+    return page_source
 
 def parse_additional_info(page_source):
     """Analyse et extrait les informations supplémentaires du joueur à partir du contenu HTML."""
@@ -992,6 +1259,97 @@ def parse_additional_info(page_source):
                 })
     return recent_results
 
+# Colonnes du tableau JavaScript `matchmx` embarqué dans les pages tennisabstract
+MATCHMX_COLUMNS = {
+    'date': 0, 'tournament': 1, 'surface': 2, 'rank': 5, 'round': 8, 'score': 9,
+    'opponent': 11, 'opp_rank': 12, 'time': 20, 'aces': 21, 'dfs': 22, 'pts': 23,
+    'firsts': 24, 'fwon': 25, 'swon': 26, 'saved': 28, 'chances': 29
+}
+MATCHMX_PATTERN = re.compile(r'var\s+matchmx\s*=\s*(\[.*?\])\s*;', re.S)
+
+def load_js_array(literal):
+    """Convertit un tableau JavaScript littéral (guillemets simples ou doubles) en liste."""
+    try:
+        return json.loads(literal)
+    except ValueError:
+        return ast.literal_eval(literal)
+
+def find_matchmx(page_source, fetch=None, page_url=''):
+    """Retourne les lignes `matchmx` de la page, ou du script jsmatches qu'elle charge.
+
+    page_url : adresse de la page, pour résoudre un src relatif ('/jsmatches/...', '//...').
+    """
+    found = MATCHMX_PATTERN.search(page_source)
+    if found:
+        return load_js_array(found.group(1))
+    if fetch is None:
+        return None
+    for src in re.findall(r'<script[^>]+src=["\']([^"\']*jsmatches[^"\']*)["\']', page_source):
+        content = fetch(urljoin(page_url, src))
+        found = MATCHMX_PATTERN.search(content.decode('utf-8', 'replace')) if content else None
+        if found:
+            return load_js_array(found.group(1))
+    return None
+
+def parse_embedded_matches(page_source, fetch=None, page_url=''):
+    """Extrait les résultats récents depuis les données JavaScript de la page (sans navigateur).
+
+    Retourne des enregistrements au format de parse_additional_info, ou None si
+    la page ne contient pas de données `matchmx`.
+    """
+    rows = find_matchmx(page_source, fetch, page_url)
+    if rows is None:
+        return None
+
+    def cell(row, key):
+        index = MATCHMX_COLUMNS[key]
+        value = row[index] if index < len(row) else ''
+        return '' if value is None else str(value).strip()
+
+    def number(row, key):
+        value = cell(row, key)
+        return int(value) if value.isdigit() else None
+
+    def pct(numerator, denominator):
+        if numerator is None or not denominator:
+            return ''
+        return f"{numerator * 100 / denominator:.1f}%"
+
+    recent_results = []
+    for row in rows:
+        try:
+            date = datetime.strptime(cell(row, 'date'), '%Y%m%d').strftime('%d-%b-%Y')
+        except ValueError:
+            continue
+        pts, firsts, saved, chances = (number(row, key) for key in ('pts', 'firsts', 'saved', 'chances'))
+        minutes = number(row, 'time')
+        recent_results.append({
+            "Date": date,
+            "Tournament": cell(row, 'tournament'),
+            "Surface": cell(row, 'surface'),
+            "Rd": cell(row, 'round'),
+            "Rang": cell(row, 'rank'),
+            "vRk": cell(row, 'opp_rank'),
+            "lien": cell(row, 'opponent'),
+            "Score": cell(row, 'score'),
+            "DR": '',
+            "A%": pct(number(row, 'aces'), pts),
+            "DF%": pct(number(row, 'dfs'), pts),
+            "1stin": pct(firsts, pts),
+            "1st%": pct(number(row, 'fwon'), firsts),
+            "2nd%": pct(number(row, 'swon'), pts - firsts if pts is not None and firsts is not None else None),
+            "BPVsd": f"{saved}/{chances}" if saved is not None and chances else '',
+            "Time": f"{minutes // 60}:{minutes % 60:02d}" if minutes else ''
+        })
+    return recent_results
+
+def fetch_abstract_matches(url):
+    """Récupère les résultats récents d'un joueur tennisabstract par simple requête HTTP."""
+    content = fetch_engine().fetch(url)
+    if content is None:
+        return None
+    return parse_embedded_matches(content.decode('utf-8', 'replace'), fetch_engine().fetch, url)
+
 from datetime import datetime, timedelta
 
 def process_last_tournament(matches):
@@ -1114,18 +1472,20 @@ def process_last_tournament(matches):
     ]
 
 
-def get_last_tournament_info(player_name, joueurs_dict):
+def get_last_tournament_info(player_name, registry):
     """Fonction principale pour obtenir les informations du dernier tournoi."""
-    player_link = search_player(joueurs_dict, player_name.replace('-', ' '))
+    player_link = search_player(registry, player_name)
 
     if player_link:
-        driver = None
         try:
-            driver = initialize_driver()
-            player_page_source = fetch_page_source(player_link, driver)
-            
-            if player_page_source:
-                additional_info = parse_additional_info(player_page_source)
+            additional_info = fetch_abstract_matches(player_link) if ABSTRACT_MODE == 'http' else None
+
+            if additional_info is None and (ABSTRACT_MODE == 'selenium' or ABSTRACT_SELENIUM_FALLBACK):
+                player_page_source = fetch_page_source(player_link)
+                if player_page_source:
+                    additional_info = parse_additional_info(player_page_source)
+
+            if additional_info is not None:
                 last_tournament_info = process_last_tournament(additional_info)
                 if audit:
                     print("additional_info: ",additional_info)
@@ -1137,27 +1497,34 @@ def get_last_tournament_info(player_name, joueurs_dict):
         except Exception as e:
             print(f"Erreur lors du traitement de {player_name}: {e}")
             return ['Erreur de traitement', '-1', '-1', '-1', '-1','-1']
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass  # Ignorer les erreurs de fermeture du driver
     else:
         return ['Aucun joueur trouvé', '-1', '-1', '-1', '-1','-1']
 
 
 ########
-def abstract(f_NomPrenom):
+def abstract(f_NomPrenom, known=None):
+    """Derniers tournois tennisabstract des joueurs (known : résultats déjà obtenus par nom)."""
     cube = []
-    joueurs_dict = load_players_from_csv(csv_url)
 
-    for pair in f_NomPrenom:
-        for player_name_input in pair:
-            last_tournament_info = get_last_tournament_info(player_name_input, joueurs_dict)
-            last_tournament_info.insert(0, player_name_input)
-            #print(f"Résultats pour {player_name_input} : {last_tournament_info}\n")
-            cube.append(last_tournament_info)
+    # Répartition des joueurs sur les requêtes HTTP ou les navigateurs du pool (ordre conservé)
+    player_names = [player_name_input for pair in f_NomPrenom for player_name_input in pair]
+    known = dict(known or {})
+    missing = [name for name in dict.fromkeys(player_names) if name not in known]
+    if missing:
+        registry = player_registry()
+        if ABSTRACT_MODE == 'selenium':
+            found = abstract_pool().map(lambda name: get_last_tournament_info(name, registry), missing)
+        else:
+            with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+                found = list(executor.map(lambda name: get_last_tournament_info(name, registry), missing))
+        known.update(zip(missing, found))
+    # Copies : un même joueur peut apparaître dans plusieurs matchs
+    infos = [list(known[name]) for name in player_names]
+
+    for player_name_input, last_tournament_info in zip(player_names, infos):
+        last_tournament_info.insert(0, player_name_input)
+        #print(f"Résultats pour {player_name_input} : {last_tournament_info}\n")
+        cube.append(last_tournament_info)
 
     cube = paires(cube)
     if audit1: print("cube: ",cube)
@@ -1184,287 +1551,82 @@ def abstract(f_NomPrenom):
 ################## Export ###################
 
 from openpyxl import load_workbook, Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
-
-def safe_value(value):
-    if isinstance(value, list) and not value:
-        return ""  # Convertit les listes vides en chaînes vides
-    return value
-
-def exportxls(data, sheet_name='Sheet1', filename='Result_data_export.xlsx'):
-
-    def split_J(name_pairs):
-        return [name[0].split(' - ') for name in name_pairs]
-
-    def flat(lst):
-        lst_f = []
-        for item in lst:
-            if isinstance(item[0], list):  # si c'est une liste imbriquée
-                flat_item = [item[0][0], item[1][0]]
-            else:  # sinon c'est déjà une liste plate
-                flat_item = item
-            # Ajoutez la logique de transformation des pourcentages ici si nécessaire
-            lst_f.append(flat_item)
-        return lst_f
-
-    # Fonction pour traiter les éléments h2h
-    def process_h2h(h2h_item, a_player, b_player):
-        if h2h_item == '0':
-            return h2h_item
-        for i in range(2):
-            if h2h_item[i][0].startswith(a_player):
-                h2h_item[0], h2h_item[1] = h2h_item[i], h2h_item[1 - i]
-                break
-            elif h2h_item[i][0].startswith(b_player):
-                h2h_item[0], h2h_item[1] = h2h_item[1 - i], h2h_item[i]
-                break
-        for i in range(2):
-            if h2h_item[i][0] != '0':
-                h2h_item[i][0] = h2h_item[i][0].split(': ')[1]
-        return h2h_item
 
-    # Fonction pour traiter les sets
-    def process_sets(sets_item, a_player, b_player):
-        if sets_item == '0':
-            return sets_item
-        if sets_item[0].startswith(a_player):
-            sets_item[0], sets_item[1] = sets_item[0], sets_item[1]
-        elif sets_item[0].startswith(b_player):
-            sets_item[0], sets_item[1] = sets_item[1], sets_item[0]
-        if sets_item[0] != '0' and sets_item[1] != '0':
-            sets_item[0] = sets_item[0].split(': ')[1]
-            sets_item[1] = sets_item[1].split(': ')[1]
+def process_h2h(h2h_item, a_player, b_player):
+    """Met le ratio H2H du joueur A en premier et ne garde que les pourcentages."""
+    if h2h_item == '0':
+        return h2h_item
+    for i in range(2):
+        if h2h_item[i][0].startswith(a_player):
+            h2h_item[0], h2h_item[1] = h2h_item[i], h2h_item[1 - i]
+            break
+        elif h2h_item[i][0].startswith(b_player):
+            h2h_item[0], h2h_item[1] = h2h_item[1 - i], h2h_item[i]
+            break
+    for i in range(2):
+        if h2h_item[i][0] != '0':
+            h2h_item[i][0] = h2h_item[i][0].split(': ')[1]
+    return h2h_item
+
+def process_sets(sets_item, a_player, b_player):
+    """Met le pourcentage de sets du joueur A en premier et ne garde que les pourcentages."""
+    if sets_item == '0':
         return sets_item
+    if sets_item[0].startswith(a_player):
+        sets_item[0], sets_item[1] = sets_item[0], sets_item[1]
+    elif sets_item[0].startswith(b_player):
+        sets_item[0], sets_item[1] = sets_item[1], sets_item[0]
+    if sets_item[0] != '0' and sets_item[1] != '0':
+        sets_item[0] = sets_item[0].split(': ')[1]
+        sets_item[1] = sets_item[1].split(': ')[1]
+    return sets_item
+
+def flat(lst):
+    lst_f = []
+    for item in lst:
+        if isinstance(item[0], list):  # si c'est une liste imbriquée
+            flat_item = [item[0][0], item[1][0]]
+        else:  # sinon c'est déjà une liste plate
+            flat_item = item
+        lst_f.append(flat_item)
+    return lst_f
+
+def ordonner_h2h(rencontres, h2h_2ans_f, h2h_surf_f, h2h_sets_win):
+    """Met les H2H du joueur A en premier dans chaque match (rencontres : 'A - B' du tableau)."""
+    # Copies : les fonctions de mise en ordre modifient les listes
+    h2h_2ans_f, h2h_surf_f, h2h_sets_win = copy.deepcopy((h2h_2ans_f, h2h_surf_f, h2h_sets_win))
+
+    for indice, (f_rencontre_item, h2h_win_an_item, h2h_win_surf_item, h2h_win_set_item) in enumerate(zip(rencontres, h2h_2ans_f, h2h_surf_f, h2h_sets_win)):
+        try:
+            a_player, b_player = [name.strip() for name in f_rencontre_item[0].split(' - ')]
+        except ValueError as e:
+            print(f"Error processing item at index {indice}: {f_rencontre_item}")
+            continue
+        h2h_2ans_f[indice] = process_h2h(h2h_win_an_item, a_player, b_player)
+        h2h_surf_f[indice] = process_h2h(h2h_win_surf_item, a_player, b_player)
+        h2h_sets_win[indice] = process_sets(h2h_win_set_item, a_player, b_player)
 
-    def transf(fiche):
-        #a, b, c, d, e, f, g, h, i, j, k, m, o, p, fiche, linkImg, fiche_det = df
-        #urls_M, h2h, fiche, urls_J, urls_img_J, h2h_Tab, career_J, fiche_J, PVC, PVS, urls_h2h, h2h_lastan_f, h2h_an_f,h2h_2ans_f, h2h_surf_f, h2h_sets_win, win_2ans, win_2ans_surf, win_10, win_50, match_J, M_mois, Def_fav_mois, Vict_out_mois, tournoi = df
-        match_data = []
-
-        # vide
-        vide = [' ' for _ in range(len(fiche[7][3]))]
-        #vide = paires(vide)
-        # zero
-        zero = ['0' for _ in range(len(fiche[7][3]))]
-        #zero = paires(zero)
-        # -1
-        moinsun = ['-1' for _ in range(len(fiche[7][3]))]
-        #moinsun = paires(moinsun)
-
-        # H2H Ratio victoire/défaite Ens
-        h2h_win = fiche[1]
-        # H2H Ratio victoire/défaite sur 2 ans e
-        h2h_win_an = fiche[13]
-        # H2H Ratio victoire/défaite surface f
-        h2h_win_surf = fiche[14]
-        # H2H Pourcentage sets gagnés g
-        h2h_win_set = fiche[15]
-        # Pourcentage victoires sur 2ans
-        win_an = [[str(item1), str(item2)] for item1, item2 in fiche[16]]
-        # Pourcentage victoires surface sur 2ans
-        win_surf_an = [[str(item1), str(item2)] for item1, item2 in fiche[17]]
-        # Pourcentage victoires sur les 50 derniers matchs
-        win_50 = fiche[19]
-        # Pourcentage victoires sur les 10 derniers matchs
-        win_10 = fiche[18]
-        # Nombre de match joués (dernier mois)
-        match_M = fiche[21]
-        # Nombre défaite en favori (dernier mois)
-        def_fav_M = fiche[22]
-        # Nombre victoire en outsider (dernier mois)
-        vict_out_M = fiche[23]
-        # pays det1
-        f_pays = fiche[7][0]
-        # age det2
-        f_age = fiche[7][1]
-        # main det3
-        f_main = fiche[7][2]
-        # Tournoi
-        #f_tourn = [f'{fiche[24]}' for _ in range(len(fiche[7][3])*2)]
-        #f_tourn = paires(f_tourn)
-        f_tourn = [f'{fiche[24]}' for _ in range(len(fiche[7][3]))]
-        # Rencontre a
-        f_rencontre = fiche[2][0]
-        # Joueurs
-        f_joueurs = split_J(f_rencontre)
-        # classement
-        f_classement = fiche[7][3]
-        # Nom Prenom
-        f_NomPrenom = fiche[7][5]
-        # PVC
-        f_PVC =  fiche[8]
-        # PVS
-        f_PVS =  fiche[9]
-        # Date
-        f_date = fiche[2][1]
-        # Heure
-        f_heure = fiche[2][2]
-        # Côtes
-        f_cote = fiche[2][4]
-        # H2H
-        f_h2h = fiche[2][5]
-        # LieuTournoi
-        f_lieutourn = ([f'{fiche[2][7]}' for _ in range(len(fiche[7][3]))])
-        # Round
-        f_round = fiche[2][8]
-        # link Image
-        f_linkImg = fiche[4]
-        # link Google
-        f_linkgoogle = fiche[2][6]
-        # link TennisExplorer
-        f_linkTennisExplorer = [[url] for url in fiche[0]]
-        #f_total_time_minutes
-        f_total_time_last_7_days = fiche[25][6]
-        #f_last_1stin
-        f_last_1stin = fiche[25][2]
-        #f_avg_1st_percent
-        f_avg_1st_percent = fiche[25][3]
-        #f_bp_percentage
-        f_bp_percentage = fiche[25][4]
+    return flat(h2h_2ans_f), flat(h2h_surf_f), h2h_sets_win
 
-        if audit:
-            print("f_total_time_last_7_days:\n",f_total_time_last_7_days)
-            print("f_last_1stin:\n",f_last_1stin)
-            print("f_avg_1st_percent:\n",f_avg_1st_percent)
-            print("f_bp_percentage:\n",f_bp_percentage)
+def records_tournoi(urls_M, fiche, joueurs, tournoi):
+    """Construit les MatchRecord d'un tournoi (joueurs : paire de PlayerRecord de chaque match)."""
+    fichename, fichedate, ficheheure, ficheurls, fichecote, ficheh2h, ficheliengoogle, countrytournoi, ficheround = fiche
 
-########## Mets les noms à la bonnes place
-        for indice, (f_rencontre_item, h2h_win_an_item, h2h_win_surf_item, h2h_win_set_item) in enumerate(zip(f_rencontre, h2h_win_an, h2h_win_surf, h2h_win_set)):
-            try:
-                a_player, b_player = [name.strip() for name in f_rencontre_item[0].split(' - ')]
-            except ValueError as e:
-                print(f"Error processing item at index {indice}: {f_rencontre_item}")
-                continue
-            h2h_win_an[indice] = process_h2h(h2h_win_an_item, a_player, b_player)
-            h2h_win_surf[indice] = process_h2h(h2h_win_surf_item, a_player, b_player)
-            h2h_win_set[indice] = process_sets(h2h_win_set_item, a_player, b_player)
-
-        h2h_win_an = flat(h2h_win_an)
-        h2h_win_surf = flat(h2h_win_surf)
-###########################################
- # Définition des variables zippées
-        if audit:
-          test = f_joueurs, f_NomPrenom,f_classement, f_PVC, f_PVS, h2h_win, h2h_win_an, h2h_win_surf, h2h_win_set,win_an, win_surf_an, win_50, win_10, match_M, moinsun, def_fav_M, vict_out_M, vide, f_cote,f_tourn, f_date, f_heure, f_rencontre, f_h2h, f_linkImg, f_linkgoogle, f_linkTennisExplorer,f_pays, f_age, f_main, f_lieutourn, f_round
-          listing(test)
-
-        # Correction du zip sans redondance de noms de variables et avec correction de la décompaction
-        zipped_items = zip(f_joueurs, f_classement,
-                           f_PVC, f_PVS,
-                           h2h_win, h2h_win_an, h2h_win_surf, h2h_win_set,
-                           win_an, win_surf_an, win_50, win_10,
-                           match_M, f_total_time_last_7_days, def_fav_M, vict_out_M,
-                           f_last_1stin, f_avg_1st_percent, f_bp_percentage,
-                           vide, vide,
-                           f_cote, f_tourn, f_date, f_heure,
-                           f_rencontre, f_h2h,
-                           f_linkImg, f_linkgoogle, f_linkTennisExplorer,
-                           f_pays, f_age, f_main,
-                           f_lieutourn, f_round#,vide
-                           )
-
-        for indice, items in enumerate(zipped_items, start=1):
-            # Décompression correcte des items sans redondance de noms
-            (f_joueurs_item, f_classement_item,
-             f_PVC_item, f_PVS_item,
-             h2h_win_item, h2h_win_an_item, h2h_win_surf_item, h2h_win_set_item,
-             win_an_item, win_surf_an_item, win_50_item, win_10_item,
-             match_M_item, f_total_time_last_7_days_item, def_fav_M_item, vict_out_M_item,
-             f_last_1stin_item, f_avg_1st_percent_item, f_bp_percentage_item,
-             vide_item, vide_item,
-             f_cote_item, f_tourn_item, f_date_item, f_heure_item,
-             f_rencontre_item, f_h2h_item,
-             f_linkImg_item, f_linkgoogle_item, f_linkTennisExplorer_item,
-             f_pays_item, f_age_item, f_main_item,
-             f_lieutourn_item, f_round_item,
-             #vide_item
-             ) = items
-
-            # Création des données pour Joueur A
-            match_joueurA = [
-                'Match ' + str(indice), 'JoueurA',
-                f_joueurs_item[0], f_classement_item[0],
-                f_PVC_item[0], f_PVS_item[0],
-                h2h_win_item[0], h2h_win_an_item[0], h2h_win_surf_item[0], h2h_win_set_item[0],
-                win_an_item[0], win_surf_an_item[0], win_50_item[0], win_10_item[0],
-                match_M_item[0], f_total_time_last_7_days_item[0], def_fav_M_item[0], vict_out_M_item[0],
-                f_last_1stin_item[0], f_avg_1st_percent_item[0], f_bp_percentage_item[0],
-                vide_item, vide_item,
-                f_cote_item[0], f_tourn_item, f_date_item[0], f_heure_item[0],
-                f_rencontre_item[0], f_h2h_item[0],
-                f_linkImg_item[0], f_linkgoogle_item[0], f_linkTennisExplorer_item[0],
-                f_pays_item[0], f_age_item[0], f_main_item[0],
-                f_lieutourn_item, f_round_item[0],
-                #vide_item
-            ]
-
-            # Création des données pour Joueur B
-            match_joueurB = [
-                'Match ' + str(indice), 'JoueurB',
-                f_joueurs_item[1], f_classement_item[1],
-                f_PVC_item[1], f_PVS_item[1],
-                h2h_win_item[1], h2h_win_an_item[1], h2h_win_surf_item[1], h2h_win_set_item[1],
-                win_an_item[1], win_surf_an_item[1], win_50_item[1], win_10_item[1],
-                match_M_item[1], f_total_time_last_7_days_item[1], def_fav_M_item[1], vict_out_M_item[1],
-                f_last_1stin_item[1], f_avg_1st_percent_item[1], f_bp_percentage_item[1],
-                vide_item, vide_item,
-                f_cote_item[1], f_tourn_item, f_date_item[0], f_heure_item[0],
-                f_rencontre_item[0], f_h2h_item[0],
-                f_linkImg_item[1], f_linkgoogle_item[0], f_linkTennisExplorer_item[0],
-                f_pays_item[1], f_age_item[1], f_main_item[1],
-                f_lieutourn_item, f_round_item[0],
-                #vide_item
-            ]
-
-            # Ajout des données dans la liste finale
-            match_data.append(match_joueurA)
-            match_data.append(match_joueurB)
+    records = []
+    for numero, ((joueur_a, joueur_b), date, heure, rencontre, f_h2h, lien_google, lien_te, round_m) in enumerate(zip(
+            joueurs, fichedate, ficheheure, fichename, ficheh2h, ficheliengoogle, urls_M, ficheround), start=1):
+        records.append(MatchRecord(
+            numero=numero, tournoi=f'{tournoi}', date=date[0], heure=heure[0], rencontre=rencontre[0], h2h=f_h2h[0],
+            lien_google=lien_google[0], lien_tennisexplorer=lien_te, lieu_tournoi=f'{countrytournoi}',
+            round=round_m[0], joueur_a=joueur_a, joueur_b=joueur_b))
 
-        if audit:
-          listing(match_data)
-
-        df = pd.DataFrame(match_data, columns=['Match', 'Tableau', 'Nom', 'Classement',
-                                               'Pourcentage victoire sur la Carrière',
-                                               'Pourcentage victoire sur la Surface',
-                                               'H2H Ratio victoire/défaite ensemble carrière',
-                                               'H2H Ratio victoire/défaite sur 1 an (2023)',
-                                               'H2H Ratio victoire/défaite surface',
-                                               'H2H Pourcentage sets gagnés',
-                                               'Pourcentage victoire sur la Carrière (2023)',
-                                               'Pourcentage victoire sur la Surface (2023)',
-                                               'Pourcentage victoires sur les 50 derniers matchs',
-                                               'Pourcentage victoires sur les 10 derniers matchs',
-                                               'Nombre de match joués sur le dernier mois',
-                                               'Durée cumulée des matchs des 7 derniers Jours',
-                                               'Nombre défaite en favori (dernier mois)',
-                                               'Nombre victoire en outsider (dernier mois)',
-                                               '% 1er service dernier tournoi',
-                                               '% de points gagnés sur le 1er service',
-                                               '% de balle de break sauvées',
-                                               '',
-                                               '',
-                                               'Côtes',
-                                               'Tournoi',
-                                               'Date',
-                                               'Heure',
-                                               'Rencontre',
-                                               'H2H',
-                                               'Lien Photo',
-                                               'Lien Google',
-                                               'Lien TennisExplorer',
-                                               'Pays',
-                                               'Age',
-                                               'Main',
-                                               'Lieu du tournoi',
-                                               'Round',
-                                               #'Dernier tournoi'
-                                               ])
-
-        df_transposed = df.T
-        return df_transposed
-
-    df_detail = transf(data)
-    sheet_name = data[24]
+    if audit:
+        listing([records])
 
+    return records
+
+def exportxls(records, sheet_name='Sheet1', filename='Result_data_export.xlsx'):
+    """Écrit les MatchRecord d'un tournoi dans un onglet du classeur (remplacé s'il existe)."""
     # Ouvrir le fichier Excel existant ou en créer un nouveau
     try:
         wb = load_workbook(filename)
@@ -1488,66 +1650,229 @@ def exportxls(data, sheet_name='Sheet1', filename='Result_data_export.xlsx'):
     ws_detail = wb.create_sheet(title=sheet_name_detail)
 
     # Écriture des nouvelles données dans l'onglet detail
-    for r in dataframe_to_rows(df_detail, index=True, header=False):
-        safe_row = [safe_value(cell) for cell in r]  # Nettoyer les valeurs avant d'écrire
-        ws_detail.append(safe_row)
+    for row in lignes_export(records):
+        ws_detail.append(row)
 
     # Sauvegarder le fichier Excel
     wb.save(filename)
 
 
 ################################################################################################################################################
-def go(url, surf='Hard', lastan='2024', tournoi="Tournoi"):
-    urls_M, h2h, fiche, fiche_opt = fichematch_url(url)
+def pipeline_matchs(urls_M):
+    """Télécharge en flux les pages nécessaires aux matchs de urls_M.
+
+    Dès qu'une page de match est analysée, les fiches de ses joueurs sont
+    demandées; dès qu'une fiche est analysée, la recherche tennisabstract du
+    joueur est lancée. La durée suit la chaîne la plus lente plutôt que la
+    somme des étapes.
+
+    Retourne (pages de match analysées, fiches par URL, infos tennisabstract par nom).
+    """
+    registry = player_registry()
+    parsed = [None] * len(urls_M)
+    players, infos = {}, {}
+    # Les navigateurs du pool sont peu nombreux : file séparée pour tennisabstract
+    abstract_workers = ABSTRACT_DRIVERS if ABSTRACT_MODE == 'selenium' else FETCH_WORKERS
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pages_executor, \
+            ThreadPoolExecutor(max_workers=abstract_workers) as abstract_executor:
+        pending = {pages_executor.submit(fetch_match_page, url): ('match', i) for i, url in enumerate(urls_M)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, key = pending.pop(future)
+                result = future.result()
+                if stage == 'match':
+                    parsed[key] = result
+                    for url in (result[0] if result else []):
+                        if url not in players:
+                            players[url] = None
+                            pending[pages_executor.submit(fetch_player_page, url)] = ('player', url)
+                elif stage == 'player':
+                    players[key] = result
+                    name = result['name']
+                    if result['career'] is not None and name not in infos:
+                        infos[name] = None
+                        pending[abstract_executor.submit(get_last_tournament_info, name, registry)] = ('abstract', name)
+                else:
+                    infos[key] = result
+
+    return parsed, players, infos
+
+def calcul_matchs(urls_M, h2h, rencontres, cotes, surf, lastan):
+    """Calcule les statistiques des joueurs des matchs de urls_M.
+
+    h2h, rencontres et cotes : colonnes du tableau du tournoi alignées sur urls_M.
+    Chaque étape renseigne directement ses champs des PlayerRecord. Retourne
+    (paire de PlayerRecord de chaque match, False si une étape n'est pas alignée sur les matchs).
+    """
+    joueurs = ChampsJoueurs(len(urls_M))
+    joueurs.remplir(nom=[rencontre[0].split(' - ') for rencontre in rencontres], cote=cotes)
+    joueurs.remplir(nombre, h2h=h2h)
+
+    with etape('pipeline_matchs'):
+        parsed, players, infos = pipeline_matchs(urls_M)
+
+    with etape('fichejoueur_url'):
+        urls_J, urls_img_J, h2h_Tab = fichejoueur_url(urls_M, parsed)
+        joueurs.remplir(photo=urls_img_J)
+
+    players_J = [[players[url] if url else None for url in url_list] for url_list in urls_J]
+
+    with etape('Tableau'):
+        career_J, fiche_J, match_J = Tableau(players_J)
+        countries, ages, hands, rang, rang_best, namefull_J = fiche_J
+        joueurs.remplir(pays=countries, main=hands)
+        joueurs.remplir(nombre, classement=rang, age=ages)
+
+    with etape('Win_Car_Surf'):
+        PVC, PVS = Win_Car_Surf(players_J, surf)
+        joueurs.remplir(nombre, pvc=PVC, pvs=PVS)
+
+    with etape('agregation_h2h'):
+        h2h_lastan_f, h2h_an_f, h2h_surf_f, h2h_sets_win = agregation_h2h(h2h_Tab, lastan, surf)
+        h2h_2ans_f = Moy_H2H_2ans(h2h_lastan_f,h2h_an_f)
+        h2h_2ans_f, h2h_surf_f, h2h_sets_win = ordonner_h2h(rencontres, h2h_2ans_f, h2h_surf_f, h2h_sets_win)
+        joueurs.remplir(nombre, h2h_2ans=h2h_2ans_f, h2h_surface=h2h_surf_f, h2h_sets=h2h_sets_win)
+
+    with etape('features_carriere'):
+        win_2ans, win_2ans_surf, win_10, win_50 = features_carriere(career_J, surf, lastan)
+        joueurs.remplir(win_2ans=win_2ans, win_2ans_surface=win_2ans_surf)
+        joueurs.remplir(nombre, win_10=win_10, win_50=win_50)
+
+    with etape('matchjouemois'):
+        M_mois, Def_fav_mois, Vict_out_mois = matchjouemois(match_J)
+        joueurs.remplir(nombre, matchs_mois=M_mois, def_fav_mois=Def_fav_mois, vict_out_mois=Vict_out_mois)
+
+    with etape('abstract'):
+        players_abstract, tournaments, last_1stin, avg_1st_percent, bp_percentage, total_time, time_last_7_days = \
+            abstract(namefull_J, infos)
+        joueurs.remplir(nombre, duree_7_jours=time_last_7_days, premier_service=last_1stin,
+                        points_1er_service=avg_1st_percent, balles_break_sauvees=bp_percentage)
+
+    paires = joueurs.paires()
+    return paires, joueurs.alignes and len(paires) == len(urls_M)
+
+_ledger = None
+
+def scrape_ledger():
+    """Retourne le registre des matchs déjà scrapés (None si désactivé ou en rejeu)."""
+    global _ledger
+    if _run['replay']:
+        # Un rejeu ne doit pas écraser le registre avec des données anciennes
+        return None
+    if _ledger is None and SCRAPE_LEDGER_PATH:
+        _ledger = ScrapeLedger(SCRAPE_LEDGER_PATH)
+    return _ledger
+
+def go(url, surf='Hard', lastan='2024', tournoi="Tournoi", export=True, full_refresh=False, tableau=None):
+    """Scrape un tournoi; tableau : résultat de fichematch_url déjà lu (et planifié) par main()."""
+    if tableau is None:
+        with etape('fichematch_url'):
+            tableau = fichematch_url(url)
+
+    if tableau is None:
+        print(f"Page du tournoi {tournoi} indisponible")
+        return None
+    urls_M, h2h, fiche, fiche_opt = tableau
 
     if not urls_M:
         return None
 
-    urls_J, urls_img_J, h2h_Tab = fichejoueur_url(urls_M)
-
-    career_J, fiche_J, match_J = Tableau(urls_J)
-
-    PVC, PVS = Win_Car_Surf(urls_J, surf)
-
-    urls_h2h = ['' if dd == ['0', '0'] else uu for uu,dd in zip(urls_M,h2h)]
-
-    h2h_lastan_f = h2h_an_surf(h2h_Tab, 'Année', lastan)
-
-    h2h_an_f = h2h_an_surf(h2h_Tab, 'Année', str(int(lastan) + 1))
-
-    h2h_2ans_f = Moy_H2H_2ans(h2h_lastan_f,h2h_an_f)
-
-    h2h_surf_f = h2h_an_surf(h2h_Tab, "Surface", surf)
-
-    h2h_sets_win = [sets_win(ele) for ele in h2h_Tab]
-
-    win_2ans, win_2ans_surf = win_perso_moy_2ans(career_J, surf,lastan)
-
-    win_10_50 = win_perso_10_50(career_J)
-
-    win_10 = win_10_50[0]
-
-    win_50 = win_10_50[1]
-
-    M_mois, Def_fav_mois, Vict_out_mois = matchjouemois(match_J)
+    # Signature cotes / horaires de chaque match pour le scraping incrémental. Le jour de
+    # l'exécution en fait partie : ratios de l'année, matchs du mois, temps de jeu des 7 derniers
+    # jours et dernier tournoi dépendent de la date. Une nouvelle exécution recalcule chaque jour
+    # les matchs restés au programme; une exécution reprise (--resume) garde le jour de son début
+    def valeur(liste, i):
+        return liste[i] if i < len(liste) else None
+
+    jour = _run['jour'] or jour_execution()
+    signatures = [match_signature(valeur(fiche[0], i), valeur(fiche[1], i), valeur(fiche[2], i),
+                                  valeur(fiche[4], i), valeur(fiche[5], i), valeur(h2h, i), surf, lastan, jour)
+                  for i in range(len(urls_M))]
+
+    ledger = scrape_ledger()
+    joueurs = [None] * len(urls_M)
+    if ledger and not full_refresh:
+        with etape('registre'):
+            joueurs = [ledger.get(match_id(u), sig) for u, sig in zip(urls_M, signatures)]
+    a_calculer = [i for i, paire in enumerate(joueurs) if paire is None]
+
+    # Calcul par lots : chaque match est enregistré dès que son lot est prêt, une
+    # exécution interrompue ne perd que le lot en cours (sans registre : un seul lot)
+    taille_lot = MATCHS_PAR_LOT if ledger else max(1, len(a_calculer))
+    for debut in range(0, len(a_calculer), taille_lot):
+        lot = a_calculer[debut:debut + taille_lot]
+
+        def colonne(liste):
+            return [liste[i] for i in lot if i < len(liste)]
+
+        paires, alignes = calcul_matchs(colonne(urls_M), colonne(h2h), colonne(fiche[0]), colonne(fiche[4]), surf, lastan)
+        if not alignes:
+            # Statistiques non alignées sur les matchs : calcul complet, sans registre
+            print(f"Données non alignées pour {tournoi}, calcul complet sans registre")
+            if len(lot) < len(urls_M):
+                paires, _ = calcul_matchs(urls_M, h2h, fiche[0], fiche[4], surf, lastan)
+            joueurs = paires
+            break
+        with etape('registre'):
+            for i, paire in zip(lot, paires):
+                joueurs[i] = paire
+                if ledger:
+                    ledger.put(match_id(urls_M[i]), tournoi, signatures[i], paire)
 
-    f_abstract = abstract(fiche_J[5])
-#######
-    Krilin = urls_M, h2h, fiche, urls_J, urls_img_J, h2h_Tab, career_J, fiche_J, PVC, PVS, urls_h2h, h2h_lastan_f, h2h_an_f,h2h_2ans_f, h2h_surf_f, h2h_sets_win, win_2ans, win_2ans_surf, win_10, win_50, match_J, M_mois, Def_fav_mois, Vict_out_mois, tournoi,f_abstract
+    with etape('records_tournoi'):
+        records = records_tournoi(urls_M, fiche, joueurs, tournoi)
 
 ######## Export xlsx ########
-    Chemin_fichier_xlsx = './data/Result_data_export.xlsx' ##########chemin fichier export à changer
-   
-    # Utiliser le nom du tournoi comme nom d'onglet
-    sheet_name = tournoi.replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
-
-    exportxls(Krilin, sheet_name, Chemin_fichier_xlsx)
+    if export:
+        with etape('exportxls'):
+            export_tournoi(records, tournoi)
 
     print("\n#" + "#" * 20)
     print(f"Traitement de {tournoi} ...")
-    print(f"Nombre de matchs: {len(urls_M)}")
+    print(f"Nombre de matchs: {len(urls_M)} (dont {len(urls_M) - len(a_calculer)} depuis le registre)")
+
+    return records
+
+def nom_onglet(tournoi):
+    """Nom d'onglet Excel d'un tournoi (caractères interdits remplacés)."""
+    return tournoi.replace('/', '_').replace('\\', '_').replace(':', '_').replace('*', '_').replace('?', '_').replace('"', '_').replace('<', '_').replace('>', '_').replace('|', '_')
 
-    return Krilin
+def export_tournoi(records, tournoi):
+    """Écrit l'onglet d'un tournoi dans le fichier d'export (réécrit tout le classeur)."""
+    exportxls(records, nom_onglet(tournoi), EXPORT_XLSX)
+
+def go_mesure(url, surf, lastan, tournoi, full_refresh=False, tableau=None):
+    """go() sans export, avec mesures; retourne (MatchRecord, rapport des mesures du tournoi)."""
+    debut_tournoi(tournoi, fetch_engine().counters)
+    try:
+        records = go(url, surf, lastan, tournoi, export=False, full_refresh=full_refresh, tableau=tableau)
+    finally:
+        rapport = fin_tournoi()
+        print(resume(rapport))
+    return records, rapport
+
+def go_worker(url, surf, lastan, tournoi, full_refresh=False, run_id=None, replay=False, tableau=None, workers=1):
+    """Traite un tournoi dans un processus du pool, sans export; retourne (MatchRecord, durée, mesures).
+
+    workers : taille du pool, pour partager les limites HTTP par hôte entre les processus.
+    """
+    configure_run(run_id, replay, workers)
+    start = time.time()
+    try:
+        records, rapport = go_mesure(url, surf, lastan, tournoi, full_refresh, tableau)
+        return records, time.time() - start, rapport
+    finally:
+        close_abstract_pool()
+        print_fetch_counters(f"processus {os.getpid()}")
+
+def print_fetch_counters(label="total"):
+    """Affiche les compteurs HTTP (succès, relances, limitations) du moteur partagé."""
+    counters = fetch_engine().counters()
+    rates = ', '.join(f"{host}: {rate}/s" for host, rate in counters.pop('rates').items())
+    print(f"Compteurs HTTP ({label}): " + ', '.join(f"{k}={v:.1f}" if isinstance(v, float) else f"{k}={v}"
+                                                  for k, v in counters.items()) + (f" | débits {rates}" if rates else ''))
 
 csv_url = "./data/joueurs_ATP_WTA.csv" ##########chemin fichier joueur ATP WTA à changer
 
@@ -1565,10 +1890,61 @@ def clear_excel_file(filename='./data/Result_data_export.xlsx'):
 
 
 
-def main():
-    sangohan = []
+def planifier_tournois(jobs, horizon=None):
+    """Lit le tableau de chaque tournoi et ordonne les tournois selon l'heure de leur premier match.
+
+    horizon : nombre d'heures; seuls les matchs pas encore commencés qui
+    commencent d'ici là sont gardés, et les tournois sans match dans la fenêtre sont écartés.
+    Retourne (tournois ordonnés, tableaux planifiés par tournoi).
+    """
+    maintenant = datetime.now()
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        lus = list(executor.map(lambda job: fichematch_url(job[0]), jobs))
+
+    planifies, tableaux = [], {}
+    for job, tableau in zip(jobs, lus):
+        if tableau is None or not tableau[0]:
+            if horizon is None:
+                # go() relira la page et signalera le problème
+                planifies.append((None, job))
+            continue
+        alignes = alignes_tableau(tableau)
+        tableau, premier = planifier(tableau, horizon_heures(horizon), maintenant, job[3])
+        if tableau is None:
+            if alignes:
+                print(f"Aucun match dans les {horizon:g} prochaines heures pour {job[3]}")
+            continue
+        tableaux[job[3]] = tableau
+        planifies.append((premier, job))
+
+    planifies.sort(key=lambda p: (p[0] is None, p[0] or maintenant))
+    for premier, job in planifies:
+        print(f"{premier:%d/%m %H:%M} {job[3]} ({len(tableaux[job[3]][0])} matchs)" if premier else f"--/-- --:-- {job[3]}")
+    return [job for _, job in planifies], tableaux
+
+def main(workers=1, full_refresh=False, replay=None, resume=False, horizon=None):
+    """Point d'entrée principal du script (workers > 1 : un processus par tournoi).
+
+    full_refresh ignore le registre des matchs et retélécharge tout.
+    replay rejoue l'exécution archivée indiquée, sans aucun accès réseau.
+    resume reprend l'exécution interrompue : les tournois déjà déposés dans le
+    classeur sont conservés et sautés, les matchs déjà calculés repris du registre.
+    horizon limite l'exécution aux matchs des N prochaines heures.
+    """
+    precedente = execution_precedente(EXPORT_STAGING_FOLDER) if resume else None
+    if resume and (not precedente or precedente.get('termine') or precedente.get('replay') != replay):
+        print("Aucune exécution interrompue à reprendre : exécution complète")
+        resume = False
+    run_id = configure_run(replay or (precedente['run_id'] if resume else None), replay=bool(replay))
+    if resume:
+        print(f"Reprise de l'exécution {run_id}")
+    if replay:
+        # Les pages archivées sont réanalysées, pas reprises du registre
+        full_refresh = True
+        print(f"Rejeu de l'exécution {run_id} depuis {ARCHIVE_FOLDER}")
+    elif ARCHIVE_FOLDER:
+        print(f"Exécution {run_id} (pages archivées dans {ARCHIVE_FOLDER})")
 
-    """Point d'entrée principal du script."""
     current_year = datetime.now().year
     lastan = str(current_year - 1)
     tournaments = extract_Tournois()
@@ -1577,9 +1953,13 @@ def main():
         print("Aucun tournoi trouvé.")
         return
 
-    # Vider le fichier Excel avant de commencer
-    clear_excel_file()
-    print("Fichier Excel vidé. Début du traitement automatique...")
+    if not resume:
+        # Vider le fichier Excel avant de commencer
+        clear_excel_file(EXPORT_XLSX)
+        print("Fichier Excel vidé. Début du traitement automatique...")
+    # Onglets déposés au fil des tournois, classeur écrit une seule fois à la fin
+    classeur = ExportClasseur(EXPORT_XLSX, EXPORT_STAGING_FOLDER, excel=EXPORT_EXCEL,
+                              execution={'run_id': run_id, 'replay': replay}, reprise=resume)
 
     print("Voici la liste des tournois disponibles:")
 
@@ -1592,24 +1972,124 @@ def main():
 
     valid_surfaces = ['Indoors', 'Clay', 'Hard', 'Grass']
 
+    jobs = []
     for tournament in selected_tournaments:
         url, surface = tournament[2], tournament[3]
         if surface not in valid_surfaces:
             print(f"Surface non adaptée pour le tournoi {tournament[1]}: {surface}")
             continue
-
-        print("\nEn cours ...")
-        sangohan.append(go(url, surface, lastan, f"{tournament[1]} ({tournament[0]})"))
+        jobs.append((url, surface, lastan, f"{tournament[1]} ({tournament[0]})", full_refresh))
 
         if audit:
             print("Info Tournois:", url, surface, lastan, f"{tournament[1]} ({tournament[0]})")
 
+    repris = 0
+    if resume:
+        # Tournois déjà déposés par l'exécution interrompue : onglets conservés
+        repris = sum(nom_onglet(job[3]) in classeur for job in jobs)
+        jobs = [job for job in jobs if nom_onglet(job[3]) not in classeur]
+        print(f"{repris} tournoi(s) déjà traités conservés, {len(jobs)} à traiter")
+
+    start = time.time()
+    tableaux, planification = {}, None
+    if PRIORITE_HORAIRE or horizon is not None:
+        # Matchs les plus proches d'abord, tous tournois confondus; pages lues mesurées à part
+        print("\nOrdre de traitement (premier match de chaque tournoi):")
+        debut_tournoi('planification', fetch_engine().counters)
+        try:
+            jobs, tableaux = planifier_tournois(jobs, horizon)
+        finally:
+            planification = fin_tournoi()
+            print(resume(planification))
+
+    sangohan = [None] * len(jobs)
+    rapports = []
+
+    try:
+        echecs = traiter_tournois(jobs, sangohan, classeur, workers, full_refresh, run_id, replay, rapports, tableaux)
+        if echecs:
+            print(f"{echecs} tournoi(s) en échec : relancer avec --resume pour les reprendre")
+        else:
+            classeur.marquer_termine()
+    finally:
+        start_export = time.time()
+        classeur.terminer()
+        print(f"{len(classeur)} onglet(s) écrits dans {EXPORT_XLSX}")
+        if RUN_REPORT_PATH:
+            ecrire_rapport(RUN_REPORT_PATH, run_id, rapports, workers=workers, replay=bool(replay), repris=repris,
+                           horizon=horizon, planification=planification,
+                           duree_s=round(time.time() - start, 3), export_s=round(time.time() - start_export, 3))
+            print(f"Rapport d'exécution écrit dans {RUN_REPORT_PATH}")
+
     return sangohan
 
+def traiter_tournois(jobs, sangohan, classeur, workers, full_refresh, run_id, replay, rapports, tableaux=None):
+    """Traite les tournois (en parallèle si workers > 1) et dépose leurs onglets dans le classeur.
+
+    Les mesures de chaque tournoi traité sont ajoutées à rapports. tableaux :
+    tableaux de matchs déjà lus par planifier_tournois. Retourne le nombre de
+    tournois en échec.
+    """
+    tableaux = tableaux or {}
+    echecs = 0
+    if workers > 1:
+        # Un processus par tournoi; seul le processus principal écrit le classeur
+        print(f"\nTraitement de {len(jobs)} tournois sur {workers} processus ...")
+        # 'spawn' : chaque processus ouvre ses propres connexions (cache, registre, navigateurs)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {executor.submit(go_worker, *job, run_id, bool(replay), tableaux.get(job[3]), workers): i for i, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                i = futures[future]
+                tournoi = jobs[i][3]
+                try:
+                    records, duree, rapport = future.result()
+                except Exception as e:
+                    print(f"[{done}/{len(jobs)}] Échec {tournoi}: {e}")
+                    echecs += 1
+                    continue
+                rapports.append(rapport)
+                if records:
+                    classeur.ajouter(nom_onglet(tournoi), records)
+                sangohan[i] = records
+                print(f"[{done}/{len(jobs)}] {tournoi} terminé en {duree:.1f}s")
+    else:
+        for i, job in enumerate(jobs):
+            print("\nEn cours ...")
+            start = time.time()
+            try:
+                sangohan[i], rapport = go_mesure(*job[:4], full_refresh=full_refresh, tableau=tableaux.get(job[3]))
+            except Exception as e:
+                print(f"[{i + 1}/{len(jobs)}] Échec {job[3]}: {e}")
+                echecs += 1
+                continue
+            rapports.append(rapport)
+            if sangohan[i] is not None:
+                classeur.ajouter(nom_onglet(job[3]), sangohan[i])
+            print(f"[{i + 1}/{len(jobs)}] {job[3]} terminé en {time.time() - start:.1f}s")
+        print_fetch_counters()
+    return echecs
+
 if __name__ == "__main__":
     if audit:
         print("#" * 20 + "\n     AUDIT\n" + "#" * 20 + "\n")
-    sangoku = main()
+    parser = argparse.ArgumentParser(description="Scraper Tennis Explorer")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="nombre de processus pour traiter les tournois en parallèle")
+    parser.add_argument('--full-refresh', action='store_true',
+                        help="ignorer le registre des matchs déjà scrapés")
+    parser.add_argument('--replay', metavar='RUN_ID',
+                        help="réanalyser une exécution archivée sans accès réseau")
+    parser.add_argument('--resume', action='store_true',
+                        help="reprendre l'exécution interrompue sans refaire les tournois déjà exportés")
+    parser.add_argument('--horizon', type=float, metavar='HEURES',
+                        help="ne traiter que les matchs qui commencent dans les HEURES prochaines heures")
+    args = parser.parse_args()
+
+    try:
+        sangoku = main(workers=args.workers, full_refresh=args.full_refresh, replay=args.replay, resume=args.resume,
+                       horizon=args.horizon)
+    finally:
+        close_abstract_pool()
 
     print("\n" + "#" * 20)
     print("fin")
@@ -11,6 +11,8 @@ import json
 import os
 import joblib
 
+from columnar_interchange import read_stats
+
 class SimplifiedTennisPredictionSystem:
     """Système de prédiction tennis pour le format simplifié"""
     
@@ -23,9 +25,9 @@ class SimplifiedTennisPredictionSystem:
         self.load_data()
     
     def load_data(self):
-        # Charger les données depuis le fichier Excel
+        # Charger les données (table Parquet si disponible, sinon le fichier Excel)
         try:
-            df = pd.read_excel(self.excel_file_path, sheet_name='StatsJoueurs')
+            df = read_stats(self.excel_file_path, sheet_name='StatsJoueurs')
             print(f"Données chargées: {len(df)} joueurs depuis {self.excel_file_path}")
             return df
         except FileNotFoundError:
@@ -0,0 +1,69 @@
+"""
+Test hors ligne du mode HTTP tennisabstract (données matchmx embarquées)
+"""
+
+from scraper_tennis_explorer import parse_additional_info, parse_embedded_matches, process_last_tournament
+
+FIXTURE_EMBEDDED = './data/fixtures/tennisabstract_player.html'
+FIXTURE_RENDERED = './data/fixtures/tennisabstract_player_rendered.html'
+
+def read_fixture(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+def test_embedded_matches_like_rendered_table():
+    """Le mode HTTP doit donner les mêmes résultats que la table rendue par Selenium"""
+    embedded = parse_embedded_matches(read_fixture(FIXTURE_EMBEDDED))
+    rendered = parse_additional_info(read_fixture(FIXTURE_RENDERED))
+
+    print(f"[HTTP] {len(embedded)} matchs - [SELENIUM] {len(rendered)} matchs")
+    assert len(embedded) == len(rendered) == 4
+
+    for http_match, browser_match in zip(embedded, rendered):
+        for key in ("Date", "Tournament", "Surface", "Rd", "Score", "1stin", "1st%", "2nd%", "BPVsd", "Time"):
+            assert http_match[key] == browser_match[key], (key, http_match[key], browser_match[key])
+
+    assert process_last_tournament(embedded) == process_last_tournament(rendered)
+    print(f"[DERNIER TOURNOI] {process_last_tournament(embedded)}")
+
+def test_embedded_matches_from_linked_script():
+    """Les données peuvent venir du script jsmatches chargé par la page"""
+    script = read_fixture(FIXTURE_EMBEDDED).split('<script language="JavaScript">')[1].split('</script>')[0]
+    page = '<html><head><script src="https://example.org/jsmatches/JannikSinner.js"></script></head></html>'
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return script.encode('utf-8')
+
+    matches = parse_embedded_matches(page, fetch)
+    assert fetched == ["https://example.org/jsmatches/JannikSinner.js"]
+    assert matches[0]["Tournament"] == "Wimbledon"
+    assert matches[0]["Time"] == "1:55"
+
+def test_linked_script_relative_src():
+    """Un src relatif ou sans schéma est résolu par rapport à l'adresse de la page"""
+    script = read_fixture(FIXTURE_EMBEDDED).split('<script language="JavaScript">')[1].split('</script>')[0]
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return script.encode('utf-8')
+
+    page_url = "https://www.tennisabstract.com/cgi-bin/player.cgi?p=JannikSinner"
+    for src in ('/jsmatches/JannikSinner.js', '//www.minorleaguesplits.com/tennisabstract/jsmatches/JannikSinner.js'):
+        page = f'<html><head><script src="{src}"></script></head></html>'
+        assert parse_embedded_matches(page, fetch, page_url)[0]["Tournament"] == "Wimbledon"
+    assert fetched == ["https://www.tennisabstract.com/jsmatches/JannikSinner.js",
+                       "https://www.minorleaguesplits.com/tennisabstract/jsmatches/JannikSinner.js"]
+    print(f"[SCRIPT RELATIF] {fetched}")
+
+def test_page_without_embedded_data():
+    """Sans données matchmx, None signale qu'un repli est nécessaire"""
+    assert parse_embedded_matches(read_fixture(FIXTURE_RENDERED)) is None
+
+if __name__ == "__main__":
+    test_embedded_matches_like_rendered_table()
+    test_embedded_matches_from_linked_script()
+    test_linked_script_relative_src()
+    test_page_without_embedded_data()
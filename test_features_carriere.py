@@ -0,0 +1,53 @@
+"""
+Test de non-régression des statistiques de carrière en une passe
+(features_carriere contre win_perso_moy_2ans / win_perso_10_50)
+"""
+
+import random
+from datetime import datetime
+
+import pandas as pd
+
+from scraper_tennis_explorer import features_carriere, win_perso_10_50, win_perso_moy_2ans
+
+SURFACES = ['Clay', 'Hard', 'Indoors', 'Grass', 'Not Classified']
+
+def cellule(rng):
+    """Cellule 'V/D' de la fiche carrière, avec les valeurs vides du site"""
+    return rng.choice([f'{rng.randint(0, 40)}/{rng.randint(0, 30)}'] * 6 + ['-', 'None', '0/0'])
+
+def fiche_carriere(rng, n):
+    """Fiche carrière d'un joueur : une ligne par année, la plus récente en tête"""
+    annee = datetime.now().year - rng.randint(0, 1)
+    lignes = [dict({'Année': str(annee - i), 'Sommaire': cellule(rng)}, **{s: cellule(rng) for s in SURFACES})
+              for i in range(n)]
+    return pd.DataFrame(lignes, columns=['Année', 'Sommaire'] + SURFACES)
+
+def compare(career_J, surf, lastan):
+    win_2ans, win_2ans_surf = win_perso_moy_2ans(career_J, surf, lastan)
+    win_10, win_50 = win_perso_10_50(career_J)
+    attendu = (win_2ans, win_2ans_surf, win_10, win_50)
+    obtenu = features_carriere(career_J, surf, lastan)
+    for nom, a, b in zip(('2ans', '2ans_surf', '10', '50'), attendu, obtenu):
+        assert a == b, (nom, a, b)
+
+def test_features_identiques_donnees_synthetiques():
+    """Fiches aléatoires + cas limites (fiche vide, une seule année, aucun match)"""
+    rng = random.Random(13)
+    career_J = [[fiche_carriere(rng, rng.randint(1, 12)), fiche_carriere(rng, rng.randint(1, 12))] for _ in range(30)]
+    career_J += [[fiche_carriere(rng, 0), fiche_carriere(rng, 1)],
+                 [pd.DataFrame([{'Année': '2020', 'Sommaire': '0/0', **dict.fromkeys(SURFACES, '-')}]),
+                  fiche_carriere(rng, 20)]]
+    annee = datetime.now().year
+    for lastan in (str(annee - 1), str(annee - 3)):
+        for surf in ('Hard', 'Clay', 'Grass'):
+            compare(career_J, surf, lastan)
+    print(f"[SYNTHETIQUE] {2 * len(career_J)} fiches carrière identiques")
+
+def test_features_sans_fiche():
+    assert features_carriere([], 'Hard', '2024') == ([], [], [], [])
+    print("[VIDE] aucune fiche OK")
+
+if __name__ == "__main__":
+    test_features_identiques_donnees_synthetiques()
+    test_features_sans_fiche()
@@ -0,0 +1,67 @@
+"""
+Test de non-régression de l'agrégation H2H vectorisée
+(agregation_h2h contre h2h_an_surf / sets_win)
+"""
+
+import copy
+import random
+
+import pandas as pd
+
+from scraper_archive import PageArchive, list_runs
+from scraper_parsing import parse_page
+from scraper_tennis_explorer import (ARCHIVE_FOLDER, agregation_h2h, create_match, h2h_an_surf,
+                                     parse_match_page, sets_win)
+
+SURFACES = ['Hard', 'Clay', 'Grass', 'Indoors', 'Info non disponible']
+
+def calcul_historique(h2h_Tab, lastan, surf):
+    """Chemin historique (sur une copie : h2h_an_surf modifie les tableaux)"""
+    h2h_Tab = copy.deepcopy(h2h_Tab)
+    return (h2h_an_surf(h2h_Tab, 'Année', lastan),
+            h2h_an_surf(h2h_Tab, 'Année', str(int(lastan) + 1)),
+            h2h_an_surf(h2h_Tab, 'Surface', surf),
+            [sets_win(ele) for ele in h2h_Tab])
+
+def tableau_h2h(rng, joueur_1, joueur_2, n):
+    matchs = []
+    for _ in range(n):
+        a, b = (joueur_1, joueur_2) if rng.random() < 0.5 else (joueur_2, joueur_1)
+        sets_a, sets_b = rng.choice([('2', '0'), ('2', '1'), ('1', '2'), ('0', '2'), ('3', '1'), ('1', '0'), ('', '')])
+        matchs.append(create_match(rng.randint(2019, 2025), f"Tournoi {rng.randint(1, 5)}", rng.choice(SURFACES),
+                                   a, b, sets_a, sets_b, ['6', '4'], ['4', '6']))
+    return pd.DataFrame(matchs)
+
+def compare(h2h_Tab, lastan, surf):
+    attendu = calcul_historique(h2h_Tab, lastan, surf)
+    obtenu = agregation_h2h(h2h_Tab, lastan, surf)
+    for nom, a, b in zip(('lastan', 'an', 'surface', 'sets'), attendu, obtenu):
+        assert a == b, (nom, a, b)
+
+def test_agregation_identique_donnees_synthetiques():
+    """Tableaux aléatoires + cas limites (page sans H2H, tableau vide, lignes invalides)"""
+    rng = random.Random(7)
+    h2h_Tab = [tableau_h2h(rng, f"Joueur {i}", f"Adversaire {i}", rng.randint(1, 12)) for i in range(40)]
+    h2h_Tab += ['', pd.DataFrame([]), pd.DataFrame(['', '']), tableau_h2h(rng, "Seul", "Autre", 1)]
+    for lastan in ('2023', '2024'):
+        for surf in ('Hard', 'Clay', 'Grass'):
+            compare(h2h_Tab, lastan, surf)
+    print(f"[SYNTHETIQUE] {len(h2h_Tab)} tableaux H2H identiques")
+
+def test_agregation_identique_archive():
+    """Pages de match des exécutions archivées (si une archive existe)"""
+    total = 0
+    for run_id in list_runs(ARCHIVE_FOLDER):
+        archive = PageArchive(ARCHIVE_FOLDER, run_id, replay=True)
+        h2h_Tab = []
+        for url in archive.urls():
+            if 'match-detail' in url:
+                parsed = parse_match_page(parse_page(archive.get(url), 'match'))
+                h2h_Tab.append(parsed[2])
+        compare(h2h_Tab, '2024', 'Hard')
+        total += len(h2h_Tab)
+    print(f"[ARCHIVE] {total} tableaux H2H identiques")
+
+if __name__ == "__main__":
+    test_agregation_identique_donnees_synthetiques()
+    test_agregation_identique_archive()
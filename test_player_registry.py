@@ -0,0 +1,94 @@
+"""
+Test du registre des joueurs tennisabstract (scraper_players.PlayerRegistry)
+contre l'ancienne recherche par permutations des mots du nom
+"""
+
+import csv
+import os
+import tempfile
+import time
+from itertools import permutations
+
+from scraper_players import PlayerRegistry, normalize_string
+
+JOUEURS = [
+    ('Jannik\xa0Sinner', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=JannikSinner'),
+    ('Alex De Minaur', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=AlexDeMinaur'),
+    ('Felix Auger Aliassime', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=FelixAugerAliassime'),
+    ('Jan-Lennard Struff', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=JanLennardStruff'),
+    ('Tomas Martin Etcheverry', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=TomasMartinEtcheverry'),
+    ("Christopher O'Connell", 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=ChristopherOConnell'),
+    ('Roberto Bautista Agut', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=RobertoBautistaAgut'),
+]
+
+# Noms tels qu'écrits sur Tennis Explorer
+RECHERCHES = ['Sinner Jannik', 'De Minaur Alex', 'Auger-Aliassime Felix', 'Struff Jan-Lennard',
+              "O'Connell Christopher", 'Bautista Agut Roberto', 'Inconnu Joueur']
+
+def recherche_permutations(joueurs, player_name):
+    """Ancienne recherche : chaque ordre des mots du nom, concaténés et normalisés"""
+    joueurs_dict = {normalize_string(nom): lien for nom, lien in joueurs}
+    for p in permutations(player_name.replace('-', ' ').split()):
+        if normalize_string(''.join(p)) in joueurs_dict:
+            return joueurs_dict[normalize_string(''.join(p))]
+    return None
+
+def ecrire_csv(path, joueurs):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Nom', 'Lien'])
+        writer.writerows(joueurs)
+
+def test_recherche_identique_permutations():
+    registry = PlayerRegistry.from_rows(JOUEURS)
+    for nom in RECHERCHES:
+        assert registry.find(nom) == recherche_permutations(JOUEURS, nom), nom
+    print(f"[RECHERCHE] {len(RECHERCHES)} noms identiques à la recherche par permutations")
+
+def test_recherche_accents():
+    registry = PlayerRegistry.from_rows(JOUEURS)
+    assert registry.find('Martín Etcheverry Tomás') == JOUEURS[4][1]
+    assert registry.find('Auger Aliassime Félix') == JOUEURS[2][1]
+    # Clé repliée commune à deux joueurs : pas de résultat plutôt qu'un mauvais lien
+    ambigu = PlayerRegistry.from_rows([('Jose Perez', 'a'), ('José Pérez', 'b')])
+    assert ambigu.find('José Pérez') == 'b' and ambigu.find('Jose Perez') == 'a'
+    assert ambigu.find('Josè Perez') is None
+    print("[ACCENTS] recherche sans accents, tirets ni apostrophes OK")
+
+def test_recherche_initiales():
+    registry = PlayerRegistry.from_rows(JOUEURS + [('JJ Wolf', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=JJWolf')])
+    assert registry.find('Wolf J. J.') == registry.find('Wolf J.J.') == registry.find('J J Wolf') == registry.find('JJ Wolf')
+    assert registry.find('Wolf J. J.') is not None
+    assert registry.find('DeMinaur Alex') == JOUEURS[1][1]
+    # Anagrammes de deux joueurs différents : pas de résultat par les lettres seules
+    ambigu = PlayerRegistry.from_rows([('Ana Lor', 'a'), ('Lara On', 'b')])
+    assert ambigu.find('Lor Ana') == 'a' and ambigu.find('Nola Ra') is None
+    print("[INITIALES] recherche indépendante des espaces et des initiales OK")
+
+def test_index_reconstruit_si_csv_modifie():
+    with tempfile.TemporaryDirectory() as dossier:
+        csv_path = os.path.join(dossier, 'joueurs.csv')
+        index_path = os.path.join(dossier, 'joueurs.idx')
+        ecrire_csv(csv_path, JOUEURS)
+        assert len(PlayerRegistry.load(csv_path, index_path)) == len(JOUEURS)
+        assert os.path.exists(index_path)
+
+        # Index relu tel quel tant que le CSV ne change pas
+        mtime_index = os.stat(index_path).st_mtime_ns
+        assert PlayerRegistry.load(csv_path, index_path).find('Sinner Jannik') == JOUEURS[0][1]
+        assert os.stat(index_path).st_mtime_ns == mtime_index
+
+        time.sleep(0.01)
+        ecrire_csv(csv_path, JOUEURS + [('Arthur Fils', 'https://www.tennisabstract.com/cgi-bin/player.cgi?p=ArthurFils')])
+        registry = PlayerRegistry.load(csv_path, index_path)
+        assert registry.find('Fils Arthur') is not None
+        assert len(registry) == len(JOUEURS) + 1
+
+        assert len(PlayerRegistry.load(os.path.join(dossier, 'absent.csv'), index_path)) == 0
+    print("[INDEX] index binaire relu puis reconstruit après modification du CSV")
+
+if __name__ == "__main__":
+    test_recherche_identique_permutations()
+    test_recherche_accents()
+    test_recherche_initiales()
+    test_index_reconstruit_si_csv_modifie()
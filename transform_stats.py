@@ -1,68 +1,153 @@
 import pandas as pd
+import numpy as np
 import os
 import time
 import sqlite3
-from datetime import datetime
-import re
+from datetime import date, datetime
+from functools import lru_cache
 import csv
+import json
+import hashlib
+import pickle
 
+from columnar_interchange import HAS_COLUMNAR, columnar_path, onglets_table, read_if_present, read_stats, types_comme_excel, write_table
+from workbook_reader import read_sheets
+
+# Écrire aussi Stats_tournois_en_cours.xlsx (la table Parquet est toujours écrite si pyarrow est installé)
+WRITE_EXCEL = True
+# Processus pour lire les onglets de Result_data_export.xlsx sans table Parquet (1 : lecture séquentielle)
+EXCEL_READ_WORKERS = 1
+
+# Ligne de l'onglet d'export (Result_data_export) lue pour chaque colonne de StatsJoueurs
+LIGNES_EXPORT = [
+    ('Date', 25), ('Heure', 26), ('Round', 36), ('Nom', 2), ('Classement', 3),
+    ('Pourc_vict_car', 4), ('Pourc_vict_surf', 5), ('H2H_ratio_car', 6), ('H2H_ratio_1_an', 7),
+    ('H2H_ratio_surf', 8), ('H2H_sets_gagnés', 9), ('Pourc_vict_car_1_an_car', 10),
+    ('Pourc_vict_car_1_an_surf', 11), ('Pourc_vict_last_50', 12), ('Pourc_vict_last_10', 13),
+    ('Nb_matchs_joués_30j', 14), ('Durée_tournoi', 15), ('Favori_lose', 16), ('Outsider_win', 17),
+    ('Pourc_serv_last_game', 18), ('Pourc_pts_winfirst_serv', 19), ('Pourc_bb_sauvées', 20),
+    ('Côtes', 23), ('H2H', 28), ('Lien Photo', 29), ('Pays', 32), ('Age', 33), ('Lien TennisExplorer', 31),
+]
+# Compilé une fois : un seul indexage de la feuille transposée par onglet
+_COLONNES_EXPORT = [col for col, _ in LIGNES_EXPORT]
+_LIGNES_EXPORT = np.array([ligne for _, ligne in LIGNES_EXPORT])
+
+COLUMNS_ORDER = [
+    'Id', 'Date', 'Heure', 'Tournoi', 'Round', 'Nom', 'Classement',
+    'Pourc_vict_car', 'Pourc_vict_surf', 'H2H_ratio_car', 'H2H_ratio_1_an',
+    'H2H_ratio_surf', 'H2H_sets_gagnés', 'Pourc_vict_car_1_an_car',
+    'Pourc_vict_car_1_an_surf', 'Pourc_vict_last_50', 'Pourc_vict_last_10',
+    'Nb_matchs_joués_30j', 'Durée_tournoi', 'Favori_lose', 'Outsider_win',
+    'Pourc_serv_last_game', 'Pourc_pts_winfirst_serv', 'Pourc_bb_sauvées',
+    'Forme_recente', 'Surface_preferee', 'Confiance', 'Tendance',
+    'Côtes', 'H2H', 'Lien Photo', 'Pays', 'Age', 'Lien TennisExplorer'
+]
+
+def en_nombres(valeurs):
+    """float() appliqué à une colonne : (flottants, masque des valeurs convertibles).
+
+    pd.to_numeric traite le cas courant, les rares textes qu'il refuse
+    repassent par float() ; les valeurs absentes ne sont pas convertibles.
+    """
+    serie = pd.Series(valeurs, dtype=object)
+    presents = serie.notna().to_numpy()
+    nombres = pd.to_numeric(serie, errors='coerce').to_numpy(dtype=float, na_value=np.nan, copy=True)
+    valides = presents & ~np.isnan(nombres)
+    for i in np.flatnonzero(presents & ~valides):
+        try:
+            nombres[i] = float(serie.iat[i])
+            valides[i] = True
+        except (ValueError, TypeError):
+            pass
+    return nombres, valides
+
+# Indicateurs dérivés, calculés sur des colonnes entières (une valeur par joueur)
 def calculer_forme_recente(pourc_vict_last_10, pourc_vict_last_50):
-    try:
-        if pd.isna(pourc_vict_last_10) or pd.isna(pourc_vict_last_50):
-            return "Non disponible"
-        pourc_vict_last_10 = float(pourc_vict_last_10)
-        pourc_vict_last_50 = float(pourc_vict_last_50)
-        if pourc_vict_last_10 > pourc_vict_last_50 + 10:
-            return "Excellente"
-        elif pourc_vict_last_10 > pourc_vict_last_50:
-            return "Bonne"
-        elif pourc_vict_last_10 < pourc_vict_last_50 - 10:
-            return "Mauvaise"
-        else:
-            return "Stable"
-    except (ValueError, TypeError):
-        return "Non disponible"
+    last_10, ok_10 = en_nombres(pourc_vict_last_10)
+    last_50, ok_50 = en_nombres(pourc_vict_last_50)
+    return np.select(
+        [~(ok_10 & ok_50), last_10 > last_50 + 10, last_10 > last_50, last_10 < last_50 - 10],
+        ["Non disponible", "Excellente", "Bonne", "Mauvaise"], "Stable")
 
 def determiner_surface_preferee(pourc_vict_car, pourc_vict_surf):
-    try:
-        if pd.isna(pourc_vict_car) or pd.isna(pourc_vict_surf):
-            return "Non disponible"
-        pourc_vict_car = float(pourc_vict_car)
-        pourc_vict_surf = float(pourc_vict_surf)
-        if pourc_vict_car > pourc_vict_surf + 5:
-            return "Terre battue"
-        elif pourc_vict_surf > pourc_vict_car + 5:
-            return "Dur"
-        else:
-            return "Polyvalent"
-    except (ValueError, TypeError):
-        return "Non disponible"
+    car, ok_car = en_nombres(pourc_vict_car)
+    surf, ok_surf = en_nombres(pourc_vict_surf)
+    return np.select(
+        [~(ok_car & ok_surf), car > surf + 5, surf > car + 5],
+        ["Non disponible", "Terre battue", "Dur"], "Polyvalent")
 
 def calculer_confiance(pourc_vict_last_10, pourc_serv_last_game, pourc_bb_sauvées):
-    try:
-        if pd.isna(pourc_vict_last_10) or pd.isna(pourc_serv_last_game) or pd.isna(pourc_bb_sauvées):
-            return None
-        pourc_vict_last_10 = float(pourc_vict_last_10)
-        pourc_serv_last_game = float(pourc_serv_last_game)
-        pourc_bb_sauvées = float(pourc_bb_sauvées)
-        return (pourc_vict_last_10 + pourc_serv_last_game + pourc_bb_sauvées) / 3
-    except (ValueError, TypeError):
-        return None
+    last_10, ok_10 = en_nombres(pourc_vict_last_10)
+    serv, ok_serv = en_nombres(pourc_serv_last_game)
+    bb, ok_bb = en_nombres(pourc_bb_sauvées)
+    return np.where(ok_10 & ok_serv & ok_bb, (last_10 + serv + bb) / 3, None)
 
 def determiner_tendance(pourc_vict_last_10, pourc_vict_car):
+    last_10, ok_10 = en_nombres(pourc_vict_last_10)
+    car, ok_car = en_nombres(pourc_vict_car)
+    return np.select(
+        [~(ok_10 & ok_car), last_10 > car + 5, last_10 < car - 5],
+        ["Non disponible", "Progression", "Régression"], "Stable")
+
+# Format des dates de match dans les sorties et la base
+FORMAT_DATE = '%d/%m/%y'
+
+# Texte libre lu comme une date : commence par un jour ou une année suivi d'un séparateur
+# ('10/07/2025', '2025-07-10', '10 Jul 2025'), jamais 'today', 'now' ou une heure seule
+DATE_LIBRE = r'\d{1,4}[./\-\s]\w'
+
+@lru_cache(maxsize=1024)
+def _date_libre(texte):
+    """Date d'un texte libre ('10/07/2025', '2025-07-10', '10 Jul 2025'...), NaT s'il est illisible.
+
+    Jour en premier comme en français, sauf si le texte commence par l'année.
+    """
+    annee_en_tete = texte[:4].isdigit() and not texte[4:5].isdigit()
     try:
-        if pd.isna(pourc_vict_last_10) or pd.isna(pourc_vict_car):
-            return "Non disponible"
-        pourc_vict_last_10 = float(pourc_vict_last_10)
-        pourc_vict_car = float(pourc_vict_car)
-        if pourc_vict_last_10 > pourc_vict_car + 5:
-            return "Progression"
-        elif pourc_vict_last_10 < pourc_vict_car - 5:
-            return "Régression"
-        else:
-            return "Stable"
-    except (ValueError, TypeError):
-        return "Non disponible"
+        valeur = pd.Timestamp(pd.to_datetime(texte, dayfirst=not annee_en_tete))
+        return valeur.tz_localize(None) if valeur.tzinfo is not None else valeur
+    except (ValueError, TypeError, OverflowError):
+        return pd.NaT
+
+def normaliser_dates(valeurs):
+    """Colonne de dates de match (datetime64) à partir des textes du scraper, NaT si illisible.
+
+    'JJ.MM.' et 'JJ.MM' (année en cours) et 'JJ/MM/AA' sont lus en une passe
+    par les accesseurs .str ; les autres textes qui commencent par une date
+    chiffrée passent par pd.to_datetime, une fois par texte distinct. Les dates déjà typées sont conservées.
+    """
+    serie = pd.Series(valeurs, dtype=object)
+    index = serie.index
+    serie = serie.reset_index(drop=True)
+    dates = pd.Series(pd.NaT, index=serie.index, dtype='datetime64[ns]')
+    est_texte = serie.map(type).eq(str)
+    textes = serie.where(est_texte).astype('string').str.strip()
+
+    jour_mois = textes.str.extract(r'^(\d{2})\.(\d{2})\.*$').dropna()
+    if len(jour_mois):
+        dates[jour_mois.index] = pd.to_datetime(
+            pd.DataFrame({'year': datetime.now().year, 'month': jour_mois[1].astype(int),
+                          'day': jour_mois[0].astype(int)}), errors='coerce')
+    courtes = textes.str.fullmatch(r'\d{2}/\d{2}/\d{2}').fillna(False).astype(bool)
+    if courtes.any():
+        dates[courtes] = pd.to_datetime(textes[courtes], format=FORMAT_DATE, errors='coerce')
+
+    libres = est_texte & textes.str.match(DATE_LIBRE).fillna(False).astype(bool) & ~courtes & ~serie.index.isin(jour_mois.index)
+    if libres.any():
+        dates[libres] = textes[libres].map(_date_libre).astype('datetime64[ns]')
+    autres = serie[~est_texte & serie.notna()]
+    if len(autres):
+        dates[autres.index] = autres.map(lambda v: pd.Timestamp(v) if isinstance(v, (datetime, date)) else pd.NaT)
+    return dates.set_axis(index).rename(serie.name)
+
+def dates_en_texte(valeurs):
+    """Dates de match au format JJ/MM/AA ; une valeur illisible est gardée telle quelle (texte nettoyé)."""
+    serie = pd.Series(valeurs, dtype=object)
+    dates = normaliser_dates(serie)
+    est_texte = serie.map(type).eq(str)
+    nettoyees = serie.where(est_texte).astype('string').str.strip().str.rstrip('.').astype(object)
+    restes = nettoyees.where(est_texte, serie)
+    return dates.dt.strftime(FORMAT_DATE).astype(object).where(dates.notna(), restes)
 
 def format_date_values(df, date_column='Date', format_type="dd/mm/yy"):
     """
@@ -81,32 +166,7 @@ def format_date_values(df, date_column='Date', format_type="dd/mm/yy"):
         return df
     
     print(f"Formatage des dates en cours vers le format: {format_type.upper()}")
-    
-    def format_single_date(date_str):
-        """Formate une date individuelle du format '10.07.' vers '10/07/25'."""
-        try:
-            if pd.isna(date_str) or not isinstance(date_str, str):
-                return date_str
-            
-            # Nettoyer la chaîne et enlever les points finaux
-            date_str = date_str.strip().rstrip('.')
-            
-            # Vérifier si c'est au format attendu (JJ.MM)
-            if re.match(r'^\d{2}\.\d{2}$', date_str):
-                day, month = date_str.split('.')
-                current_year = datetime.now().year
-                formatted_date = f"{day}/{month}/{str(current_year)[-2:]}"
-                print(f"Date formatée: {date_str} -> {formatted_date}")
-                return formatted_date
-            else:
-                # Si ce n'est pas le format attendu, retourner tel quel
-                return date_str
-        except Exception as e:
-            print(f"Erreur formatage date '{date_str}': {e}")
-            return date_str
-    
-    # Appliquer le formatage à chaque valeur de la colonne
-    df[date_column] = df[date_column].apply(format_single_date)
+    df[date_column] = dates_en_texte(df[date_column])
     
     return df
 
@@ -172,110 +232,187 @@ def init_database():
     
       
     ''')
-    
+
+    # Lignes transformées de chaque onglet d'export, réutilisées tant que l'onglet ne change pas
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS onglets_transformes (
+        onglet TEXT PRIMARY KEY,
+        empreinte TEXT NOT NULL,
+        joueurs BLOB NOT NULL,
+        date_maj TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+
+    # Colonnes ajoutées après la création des premières bases
+    colonnes = {ligne[1] for ligne in cursor.execute('PRAGMA table_info(statistiques)')}
+    for colonne, type_sql in COLONNES_AJOUTEES:
+        if colonne not in colonnes:
+            cursor.execute(f'ALTER TABLE statistiques ADD COLUMN {colonne} {type_sql}')
+
     conn.commit()
+    creer_index_uniques(conn)
     conn.close()
     print("Base de données initialisée avec succès.")
 
+# Colonnes de statistiques absentes du CREATE TABLE d'origine
+COLONNES_AJOUTEES = [('forme_recente', 'TEXT'), ('surface_preferee', 'TEXT'), ('confiance', 'REAL'), ('tendance', 'TEXT')]
+
+# Colonnes de la table statistiques et colonnes correspondantes du DataFrame final
+COLONNES_STATISTIQUES = [
+    ('date_match', 'Date'), ('heure_match', 'Heure'), ('tournoi', 'Tournoi'), ('round', 'Round'), ('nom', 'Nom'),
+    ('classement', 'Classement'), ('pourc_vict_car', 'Pourc_vict_car'), ('pourc_vict_surf', 'Pourc_vict_surf'),
+    ('h2h_ratio_car', 'H2H_ratio_car'), ('h2h_ratio_1_an', 'H2H_ratio_1_an'), ('h2h_ratio_surf', 'H2H_ratio_surf'),
+    ('h2h_sets_gagnes', 'H2H_sets_gagnés'), ('pourc_vict_car_1_an_car', 'Pourc_vict_car_1_an_car'),
+    ('pourc_vict_car_1_an_surf', 'Pourc_vict_car_1_an_surf'), ('pourc_vict_last_50', 'Pourc_vict_last_50'),
+    ('pourc_vict_last_10', 'Pourc_vict_last_10'), ('nb_matchs_joues_30j', 'Nb_matchs_joués_30j'),
+    ('duree_tournoi', 'Durée_tournoi'), ('favori_lose', 'Favori_lose'), ('outsider_win', 'Outsider_win'),
+    ('pourc_serv_last_game', 'Pourc_serv_last_game'), ('pourc_pts_winfirst_serv', 'Pourc_pts_winfirst_serv'),
+    ('pourc_bb_sauvees', 'Pourc_bb_sauvées'), ('forme_recente', 'Forme_recente'),
+    ('surface_preferee', 'Surface_preferee'), ('confiance', 'Confiance'), ('tendance', 'Tendance'),
+    ('cotes', 'Côtes'), ('h2h', 'H2H'), ('lien_photo', 'Lien Photo'), ('pays', 'Pays'), ('age', 'Age'),
+    ('lien_tennisexplorer', 'Lien TennisExplorer'),
+]
+
+# Colonnes d'une statistique existante remplacées lors d'un nouvel enregistrement (hors clé)
+COLONNES_MISES_A_JOUR = [colonne for colonne, _ in COLONNES_STATISTIQUES
+                         if colonne not in ('date_match', 'tournoi', 'round')]
+
+def creer_index_uniques(conn):
+    """Index uniques sur joueurs.nom et sur la clé d'une statistique (joueur, date, tournoi, round).
+
+    Les doublons laissés par les anciennes versions sont d'abord fusionnés
+    (on garde la première ligne).
+    """
+    try:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_joueurs_nom ON joueurs(nom)')
+    except sqlite3.IntegrityError:
+        print("Doublons dans joueurs : fusion avant création de l'index")
+        with conn:
+            conn.execute('''
+            UPDATE statistiques SET joueur_id = (
+                SELECT MIN(j2.id) FROM joueurs j1 JOIN joueurs j2 ON j2.nom = j1.nom WHERE j1.id = statistiques.joueur_id
+            ) WHERE joueur_id IN (SELECT id FROM joueurs WHERE id NOT IN (SELECT MIN(id) FROM joueurs GROUP BY nom))
+            ''')
+            conn.execute('DELETE FROM joueurs WHERE id NOT IN (SELECT MIN(id) FROM joueurs GROUP BY nom)')
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_joueurs_nom ON joueurs(nom)')
+    try:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_statistiques_cle '
+                     'ON statistiques(joueur_id, date_match, tournoi, round)')
+    except sqlite3.IntegrityError:
+        print("Doublons dans statistiques : suppression avant création de l'index")
+        with conn:
+            # Les lignes avec une clé incomplète (NULL) ne sont pas concernées par l'index
+            conn.execute('''
+            DELETE FROM statistiques WHERE joueur_id IS NOT NULL AND date_match IS NOT NULL
+                AND tournoi IS NOT NULL AND round IS NOT NULL
+                AND id NOT IN (SELECT MIN(id) FROM statistiques GROUP BY joueur_id, date_match, tournoi, round)
+            ''')
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_statistiques_cle '
+                     'ON statistiques(joueur_id, date_match, tournoi, round)')
+    conn.commit()
+
+def valeurs_sql(df, colonnes):
+    """Lignes de df (colonnes choisies) en objets Python, NaN remplacés par None."""
+    sous_df = df[colonnes].astype(object)
+    return sous_df.where(sous_df.notna(), None).values.tolist()
+
 def save_to_database(df):
-    """Sauvegarde les données dans la base de données SQLite existante."""
+    """Sauvegarde les données dans la base de données SQLite existante.
+
+    Écriture groupée en une transaction : joueurs manquants puis statistiques
+    insérés par executemany. Une statistique déjà présente (même joueur, date,
+    tournoi et round) est mise à jour avec les nouvelles valeurs.
+
+    Retourne True si la transaction a été validée, False sinon.
+    """
     db_path = './data/tennis_stats.db'
     conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    for _, row in df.iterrows():
-        try:
-            # Vérifier si le joueur existe déjà
-            cursor.execute('SELECT id FROM joueurs WHERE nom = ?', (row['Nom'],))
-            result = cursor.fetchone()
-            
-            if result is None:
-                # Insérer le nouveau joueur
-                cursor.execute('''
-                INSERT INTO joueurs (nom, classement, pays, age, lien_photo, lien_tennisexplorer)
-                VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    row['Nom'],
-                    row['Classement'],
-                    row['Pays'],
-                    row['Age'],
-                    row['Lien Photo'],
-                    row['Lien TennisExplorer']
-                ))
-                joueur_id = cursor.lastrowid
-            else:
-                joueur_id = result[0]
-            
-            # Formater la date si elle existe
-            date_match = None
-            if pd.notna(row['Date']):
-                try:
-                    # Si la date est déjà au bon format (dd/mm/yy), l'utiliser directement
-                    if isinstance(row['Date'], str) and re.match(r'^\d{2}/\d{2}/\d{2}$', row['Date']):
-                        date_match = row['Date']
-                    # Si la date est au format JJ.MM. (avec point final)
-                    elif isinstance(row['Date'], str) and re.match(r'^\d{2}\.\d{2}\.$', row['Date'].strip()):
-                        current_year = datetime.now().year
-                        # Extraire le jour et le mois
-                        day, month = row['Date'].strip('.').split('.')
-                        date_str = f"{day}/{month}/{str(current_year)[-2:]}"
-                        date_match = date_str
-                    # Si la date est au format JJ.MM (sans point final)
-                    elif isinstance(row['Date'], str) and re.match(r'^\d{2}\.\d{2}$', row['Date'].strip()):
-                        current_year = datetime.now().year
-                        # Extraire le jour et le mois
-                        day, month = row['Date'].split('.')
-                        date_str = f"{day}/{month}/{str(current_year)[-2:]}"
-                        date_match = date_str
-                    else:
-                        # Essayer de parser la date dans d'autres formats
-                        date_obj = pd.to_datetime(row['Date'])
-                        date_match = date_obj.strftime('%d/%m/%y')
-                except Exception as e:
-                    print(f"Erreur lors du formatage de la date '{row['Date']}': {e}")
-            
-            # Vérifier si cette statistique existe déjà
-            cursor.execute('''
-            SELECT id FROM statistiques 
-            WHERE joueur_id = ? AND date_match = ? AND tournoi = ? AND round = ?
-            ''', (joueur_id, date_match, row['Tournoi'], row['Round']))
-            
-            if cursor.fetchone() is None:
-                # Insérer les nouvelles statistiques
-                cursor.execute('''
-                INSERT INTO statistiques (
-                    joueur_id, date_match, heure_match, tournoi, round, nom, classement,
-                    pourc_vict_car, pourc_vict_surf, h2h_ratio_car, h2h_ratio_1_an,
-                    h2h_ratio_surf, h2h_sets_gagnes, pourc_vict_car_1_an_car,
-                    pourc_vict_car_1_an_surf, pourc_vict_last_50, pourc_vict_last_10,
-                    nb_matchs_joues_30j, duree_tournoi, favori_lose, outsider_win,
-                    pourc_serv_last_game, pourc_pts_winfirst_serv, pourc_bb_sauvees,
-                    forme_recente, surface_preferee, confiance, tendance, cotes, h2h,
-                    lien_photo, pays, age, lien_tennisexplorer
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    joueur_id, date_match, row['Heure'], row['Tournoi'], row['Round'],
-                    row['Nom'], row['Classement'], row['Pourc_vict_car'], row['Pourc_vict_surf'],
-                    row['H2H_ratio_car'], row['H2H_ratio_1_an'], row['H2H_ratio_surf'],
-                    row['H2H_sets_gagnés'], row['Pourc_vict_car_1_an_car'],
-                    row['Pourc_vict_car_1_an_surf'], row['Pourc_vict_last_50'],
-                    row['Pourc_vict_last_10'], row['Nb_matchs_joués_30j'],
-                    row['Durée_tournoi'], row['Favori_lose'], row['Outsider_win'],
-                    row['Pourc_serv_last_game'], row['Pourc_pts_winfirst_serv'],
-                    row['Pourc_bb_sauvées'], row['Forme_recente'], row['Surface_preferee'],
-                    row['Confiance'], row['Tendance'], row['Côtes'], row['H2H'],
-                    row['Lien Photo'], row['Pays'], row['Age'], row['Lien TennisExplorer']
-                ))
-                print(f"Nouvelles statistiques ajoutées pour {row['Nom']}")
-            else:
-                print(f"Statistiques déjà existantes pour {row['Nom']} à cette date")
-        except Exception as e:
-            print(f"Erreur lors de la sauvegarde des données pour {row['Nom']}: {str(e)}")
-            continue
-    
-    conn.commit()
+    df = df[df['Nom'].notna()]
+    try:
+        conn.execute('PRAGMA journal_mode=WAL')
+        creer_index_uniques(conn)
+        with conn:
+            # Joueurs absents de la base (première ligne de chaque nom)
+            joueurs = df.drop_duplicates('Nom')
+            conn.executemany('''
+            INSERT INTO joueurs (nom, classement, pays, age, lien_photo, lien_tennisexplorer)
+            VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(nom) DO NOTHING
+            ''', valeurs_sql(joueurs, ['Nom', 'Classement', 'Pays', 'Age', 'Lien Photo', 'Lien TennisExplorer']))
+
+            # Identifiants de tous les joueurs en une requête
+            ids = dict(conn.execute(
+                'SELECT j.nom, j.id FROM joueurs j JOIN json_each(?) e ON e.value = j.nom',
+                (json.dumps(joueurs['Nom'].tolist(), ensure_ascii=False, default=str),)
+            ).fetchall())
+
+            lignes = valeurs_sql(df, [colonne for _, colonne in COLONNES_STATISTIQUES])
+            dates = normaliser_dates(df['Date']).dt.strftime(FORMAT_DATE).to_frame()
+            statistiques = [(ids.get(ligne[4]), date_match, *ligne[1:])
+                            for ligne, (date_match,) in zip(lignes, valeurs_sql(dates, ['Date']))]
+            avant = conn.execute('SELECT COUNT(*) FROM statistiques').fetchone()[0]
+            conn.executemany(f'''
+            INSERT INTO statistiques (joueur_id, {', '.join(colonne for colonne, _ in COLONNES_STATISTIQUES)})
+            VALUES ({', '.join('?' * (len(COLONNES_STATISTIQUES) + 1))})
+            ON CONFLICT(joueur_id, date_match, tournoi, round) DO UPDATE SET
+            {', '.join(f'{colonne} = excluded.{colonne}' for colonne in COLONNES_MISES_A_JOUR)}
+            ''', statistiques)
+            inserees = conn.execute('SELECT COUNT(*) FROM statistiques').fetchone()[0] - avant
+    except sqlite3.Error as e:
+        print(f"Erreur lors de la sauvegarde des données: {str(e)}")
+        conn.close()
+        return False
+
     conn.close()
+    print(f"Statistiques : {inserees} lignes ajoutées, {len(statistiques) - inserees} mises à jour")
     print("Données sauvegardées dans la base de données avec succès.")
+    return True
+
+# Version de la transformation d'un onglet : la changer invalide les lignes en cache
+VERSION_TRANSFORMATION = 1
+
+def empreinte_onglet(df):
+    """Empreinte du contenu d'un onglet : libellés des colonnes et valeurs, types compris."""
+    contenu = json.dumps([VERSION_TRANSFORMATION, [str(col) for col in df.columns], df.to_numpy(dtype=object).tolist()],
+                         ensure_ascii=False, default=str)
+    return hashlib.sha1(contenu.encode('utf-8')).hexdigest()
+
+def charger_onglets_transformes():
+    """Lignes transformées lors des exécutions précédentes : {onglet: (empreinte, joueurs)}."""
+    db_path = './data/tennis_stats.db'
+    conn = sqlite3.connect(db_path)
+    try:
+        lignes = conn.execute('SELECT onglet, empreinte, joueurs FROM onglets_transformes').fetchall()
+    except sqlite3.Error as e:
+        print(f"Cache des onglets illisible: {str(e)}")
+        return {}
+    finally:
+        conn.close()
+    onglets = {}
+    for onglet, empreinte, joueurs in lignes:
+        try:
+            onglets[onglet] = (empreinte, pickle.loads(joueurs))
+        except Exception as e:
+            print(f"Cache de l'onglet {onglet} illisible, il sera retransformé: {str(e)}")
+    return onglets
+
+def enregistrer_onglets_transformes(modifies, presents):
+    """Met en cache les lignes des onglets modifiés et oublie les onglets disparus.
+
+    modifies : {onglet: (empreinte, joueurs)} ; presents : onglets de l'exécution.
+    """
+    db_path = './data/tennis_stats.db'
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO onglets_transformes (onglet, empreinte, joueurs) VALUES (?, ?, ?)',
+                [(onglet, empreinte, pickle.dumps(joueurs)) for onglet, (empreinte, joueurs) in modifies.items()])
+            conn.execute('DELETE FROM onglets_transformes WHERE onglet NOT IN (SELECT value FROM json_each(?))',
+                         (json.dumps(presents, ensure_ascii=False),))
+    except sqlite3.Error as e:
+        print(f"Erreur lors de la mise à jour du cache des onglets: {str(e)}")
+    finally:
+        conn.close()
 
 def load_player_names():
     """
@@ -333,6 +470,85 @@ def handle_similar_names_in_tournament(df, player_names):
                     df.at[idx, 'Nom'] = f"{name} E."
     return df
 
+def ecrire_excel_stats(final_df, output_file):
+    """Écrit l'onglet StatsJoueurs dans le classeur de sortie (plusieurs tentatives si le fichier est ouvert)."""
+    # Vérifier si le fichier de sortie existe déjà
+    if os.path.exists(output_file):
+        try:
+            # Essayer de supprimer le fichier existant
+            os.remove(output_file)
+            print(f"Fichier existant {output_file} supprimé")
+        except PermissionError:
+            print(f"Erreur: Impossible de supprimer le fichier {output_file}. Veuillez fermer le fichier s'il est ouvert.")
+            return
+        except Exception as e:
+            print(f"Erreur lors de la suppression du fichier: {str(e)}")
+            return
+    
+    # Essayer d'écrire le fichier avec plusieurs tentatives
+    max_attempts = 3
+    for attempt in range(max_attempts):
+        try:
+            # S'assurer que la colonne Date reste au format string JJ/MM/AA
+            if 'Date' in final_df.columns:
+                # Convertir en string pour éviter la conversion automatique en datetime
+                final_df['Date'] = final_df['Date'].astype(str)
+            
+            # Sauvegarder dans Excel
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                final_df.to_excel(writer, index=False, sheet_name='StatsJoueurs')
+            
+            print(f"Transformation terminée. Le fichier a été sauvegardé sous {output_file}")
+            break
+        except PermissionError:
+            if attempt < max_attempts - 1:
+                print(f"Tentative {attempt + 1} échouée. Veuillez fermer le fichier s'il est ouvert. Nouvelle tentative dans 2 secondes...")
+                time.sleep(2)
+            else:
+                print("Erreur: Impossible d'écrire dans le fichier après plusieurs tentatives. Veuillez fermer le fichier s'il est ouvert.")
+        except Exception as e:
+            print(f"Une erreur s'est produite lors de l'écriture du fichier: {str(e)}")
+            break
+
+def lignes_onglet(df):
+    """Joueurs d'un onglet d'export : une ligne par colonne de joueur, colonnes de LIGNES_EXPORT.
+
+    La feuille est transposée une fois puis lue selon LIGNES_EXPORT. Les
+    colonnes d'en-tête ('Match', 'Tableau') et celles sans nom de joueur sont
+    écartées ; les lignes absentes de la feuille valent None.
+    """
+    joueurs = df.to_numpy(dtype=object).T
+    if joueurs.shape[1] <= _LIGNES_EXPORT.max():
+        manquantes = np.full((joueurs.shape[0], _LIGNES_EXPORT.max() + 1 - joueurs.shape[1]), None, dtype=object)
+        joueurs = np.hstack([joueurs, manquantes])
+    entetes = (joueurs[:, 0] == 'Match') | (joueurs[:, 0] == 'Tableau')
+    valides = ~entetes & pd.notna(joueurs[:, 2]) if df.shape[0] > 2 else np.zeros(len(joueurs), dtype=bool)
+    return joueurs[valides][:, _LIGNES_EXPORT]
+
+def construire_stats(onglets):
+    """DataFrame StatsJoueurs à partir des joueurs de chaque onglet [(nom d'onglet, lignes_onglet)].
+
+    Classement et indicateurs sont calculés en une fois sur tous les joueurs.
+    """
+    blocs = [joueurs for _, joueurs in onglets]
+    joueurs = np.vstack(blocs) if blocs else np.empty((0, len(LIGNES_EXPORT)), dtype=object)
+    lignes = dict(zip(_COLONNES_EXPORT, joueurs.T))
+
+    classement, ok = en_nombres(lignes['Classement'])
+    ok &= np.isfinite(classement)
+    lignes['Classement'] = np.where(ok, np.trunc(np.where(ok, classement, 0)).astype(np.int64), None)
+    lignes.update({
+        'Id': np.full(len(joueurs), None, dtype=object),
+        'Tournoi': np.repeat(np.array([nom for nom, _ in onglets], dtype=object), [len(b) for b in blocs]),
+        'Forme_recente': calculer_forme_recente(lignes['Pourc_vict_last_10'], lignes['Pourc_vict_last_50']),
+        'Surface_preferee': determiner_surface_preferee(lignes['Pourc_vict_car'], lignes['Pourc_vict_surf']),
+        'Confiance': calculer_confiance(lignes['Pourc_vict_last_10'], lignes['Pourc_serv_last_game'],
+                                        lignes['Pourc_bb_sauvées']),
+        'Tendance': determiner_tendance(lignes['Pourc_vict_last_10'], lignes['Pourc_vict_car']),
+    })
+    # Listes Python : mêmes types de colonnes qu'un DataFrame construit ligne à ligne
+    return pd.DataFrame({col: lignes[col].tolist() for col in COLUMNS_ORDER}, columns=COLUMNS_ORDER)
+
 def transform_stats():
     # Initialiser la base de données
     init_database()
@@ -340,8 +556,8 @@ def transform_stats():
     # Charger les noms des joueurs
     player_names = load_player_names()
     
-    # Lire le fichier Excel
-    df = pd.read_excel('./data/Stats_tournois_en_cours.xlsx')
+    # Lire le fichier de sortie précédent (Parquet si disponible)
+    df = read_stats('./data/Stats_tournois_en_cours.xlsx')
     
     # Appliquer le formatage des noms
     df = handle_similar_names_in_tournament(df, player_names)
@@ -351,25 +567,34 @@ def transform_stats():
     output_file = './data/Stats_tournois_en_cours.xlsx'
     
     try:
-        # Vérifier si le fichier d'entrée existe
-        if not os.path.exists(input_file):
-            print(f"Erreur: Le fichier {input_file} n'existe pas.")
-            return
-            
-        # Lire tous les onglets du fichier Excel
-        xls = pd.ExcelFile(input_file)
-        print(f"Onglets trouvés: {xls.sheet_names}")
+        # Table Parquet du scraper en priorité, sinon le classeur Excel
+        table = read_if_present(input_file)
+        if table is not None:
+            print(f"Lecture de {columnar_path(input_file)}")
+            onglets = onglets_table(table)
+            sheet_names = list(onglets)
+        else:
+            # Vérifier si le fichier d'entrée existe
+            if not os.path.exists(input_file):
+                print(f"Erreur: Le fichier {input_file} n'existe pas.")
+                return
+
+            # Lire tous les onglets du fichier Excel (classeur ouvert une seule fois)
+            onglets = read_sheets(input_file, workers=EXCEL_READ_WORKERS)
+            sheet_names = list(onglets)
+        print(f"Onglets trouvés: {sheet_names}")
         
-        all_data = []
+        joueurs_onglets = []
+        # Onglets inchangés depuis la dernière exécution : lignes reprises du cache
+        onglets_caches = charger_onglets_transformes()
+        modifies = {}
         
         # Parcourir chaque onglet
-        for sheet_name in xls.sheet_names:
+        for sheet_name in sheet_names:
             print(f"\nTraitement de l'onglet: {sheet_name}")
             
-            # Lire l'onglet
-            df = pd.read_excel(input_file, sheet_name=sheet_name)
+            df = onglets[sheet_name]
             print(f"Nombre de colonnes: {len(df.columns)}")
-            print(f"Colonnes disponibles: {df.columns.tolist()}")
             
             # Formater les dates si la colonne existe
             if 'Date' in df.columns:
@@ -383,160 +608,28 @@ def transform_stats():
                 current_year = datetime.now().year
                 df['Année'] = current_year
             
-            # Afficher les premières lignes pour debug
-            print("\nPremières lignes du DataFrame:")
-            print(df.head())
-            
             # Vérifier si le DataFrame a des données
             if df.empty:
                 print(f"Attention: L'onglet {sheet_name} est vide")
                 continue
                 
-            # Créer un nouveau DataFrame pour stocker les données transformées
-            transformed_data = []
-            
-            # Parcourir toutes les colonnes
-            for col in df.columns:
-                print(f"\nTraitement de la colonne: {col}")
-                
-                # Extraire les données de la colonne
-                player_data = df[col]
-                
-                # Vérifier si la ligne contient des données de joueur (pas un en-tête)
-                if player_data.iloc[0] == 'Match' or player_data.iloc[0] == 'Tableau':
-                    print("Ligne d'en-tête détectée, passage à la suivante")
-                    continue
-                
-                print(f"Données du joueur: {player_data.iloc[2] if len(player_data) > 2 else 'Non disponible'}")
-                
-                # Vérifier si les données du joueur sont valides
-                if len(player_data) <= 2 or pd.isna(player_data.iloc[2]):
-                    print("Données du joueur non valides, passage au suivant")
-                    continue
-                    
-                try:
-                    # Extraire les informations supplémentaires
-                    cotes = player_data.iloc[23] if len(player_data) > 23 else None
-                    date = player_data.iloc[25] if len(player_data) > 25 else None
-                    heure = player_data.iloc[26] if len(player_data) > 26 else None
-                    lien_photo = player_data.iloc[29] if len(player_data) > 29 else None
-                    pays = player_data.iloc[32] if len(player_data) > 32 else None
-                    age = player_data.iloc[33] if len(player_data) > 33 else None
-                    round_info = player_data.iloc[36] if len(player_data) > 36 else None
-                    lien_tennisexplorer = player_data.iloc[31] if len(player_data) > 31 else None
-                    H2H = player_data.iloc[28] if len(player_data) > 28 else None
-                    
-                    # Extraire et convertir le classement
-                    classement = player_data.iloc[3] if len(player_data) > 3 else None
-                    if classement is not None:
-                        try:
-                            classement = int(float(classement))
-                            print(f"Classement converti pour {player_data.iloc[2]}: {classement}")
-                        except (ValueError, TypeError):
-                            print(f"Erreur de conversion du classement pour {player_data.iloc[2]}: {classement}")
-                            classement = None
-                    
-                    # Créer une nouvelle ligne avec les données du joueur
-                    new_row = {
-                        'Id': None,
-                        'Date': date,
-                        'Heure': heure,
-                        'Tournoi': sheet_name,
-                        'Round': round_info,
-                        'Nom': player_data.iloc[2],
-                        'Classement': classement,
-                        'Pourc_vict_car': player_data.iloc[4] if len(player_data) > 4 else None,
-                        'Pourc_vict_surf': player_data.iloc[5] if len(player_data) > 5 else None,
-                        'H2H_ratio_car': player_data.iloc[6] if len(player_data) > 6 else None,
-                        'H2H_ratio_1_an': player_data.iloc[7] if len(player_data) > 7 else None,
-                        'H2H_ratio_surf': player_data.iloc[8] if len(player_data) > 8 else None,
-                        'H2H_sets_gagnés': player_data.iloc[9] if len(player_data) > 9 else None,
-                        'Pourc_vict_car_1_an_car': player_data.iloc[10] if len(player_data) > 10 else None,
-                        'Pourc_vict_car_1_an_surf': player_data.iloc[11] if len(player_data) > 11 else None,
-                        'Pourc_vict_last_50': player_data.iloc[12] if len(player_data) > 12 else None,
-                        'Pourc_vict_last_10': player_data.iloc[13] if len(player_data) > 13 else None,
-                        'Nb_matchs_joués_30j': player_data.iloc[14] if len(player_data) > 14 else None,
-                        'Durée_tournoi': player_data.iloc[15] if len(player_data) > 15 else None,
-                        'Favori_lose': player_data.iloc[16] if len(player_data) > 16 else None,
-                        'Outsider_win': player_data.iloc[17] if len(player_data) > 17 else None,
-                        'Pourc_serv_last_game': player_data.iloc[18] if len(player_data) > 18 else None,
-                        'Pourc_pts_winfirst_serv': player_data.iloc[19] if len(player_data) > 19 else None,
-                        'Pourc_bb_sauvées': player_data.iloc[20] if len(player_data) > 20 else None,
-                        'Forme_recente': calculer_forme_recente(
-                            player_data.iloc[13] if len(player_data) > 13 else None,
-                            player_data.iloc[12] if len(player_data) > 12 else None
-                        ),
-                        'Surface_preferee': determiner_surface_preferee(
-                            player_data.iloc[4] if len(player_data) > 4 else None,
-                            player_data.iloc[5] if len(player_data) > 5 else None
-                        ),
-                        'Confiance': calculer_confiance(
-                            player_data.iloc[13] if len(player_data) > 13 else None,
-                            player_data.iloc[18] if len(player_data) > 18 else None,
-                            player_data.iloc[20] if len(player_data) > 20 else None
-                        ),
-                        'Tendance': determiner_tendance(
-                            player_data.iloc[13] if len(player_data) > 13 else None,
-                            player_data.iloc[4] if len(player_data) > 4 else None
-                        ),
-                        'Côtes': cotes,
-                        'H2H': H2H,
-                        'Lien Photo': lien_photo,
-                        'Pays': pays,
-                        'Age': age,
-                        'Lien TennisExplorer': lien_tennisexplorer
-                    }
-                    transformed_data.append(new_row)
-                    print(f"Ajout des données pour le joueur: {new_row['Nom']} (Classement: {new_row['Classement']})")
-                except Exception as e:
-                    print(f"Erreur lors de la création de la ligne: {str(e)}")
-                    continue
-            
-            # Ajouter les données transformées à la liste principale
-            all_data.extend(transformed_data)
-            print(f"Nombre de lignes ajoutées pour cet onglet: {len(transformed_data)}")
-        
-        # Créer un DataFrame final avec toutes les données
-        final_df = pd.DataFrame(all_data)
+            empreinte = empreinte_onglet(df)
+            cache = onglets_caches.get(sheet_name)
+            if cache is not None and cache[0] == empreinte:
+                joueurs = cache[1]
+                print("Onglet inchangé, lignes reprises du cache")
+            else:
+                joueurs = lignes_onglet(df)
+                modifies[sheet_name] = (empreinte, joueurs)
+            joueurs_onglets.append((sheet_name, joueurs))
+            print(f"Nombre de lignes ajoutées pour cet onglet: {len(joueurs)}")
         
-        # Réorganiser les colonnes dans l'ordre souhaité
-        columns_order = [
-            'Id', 'Date', 'Heure', 'Tournoi', 'Round', 'Nom', 'Classement',
-            'Pourc_vict_car', 'Pourc_vict_surf', 'H2H_ratio_car', 'H2H_ratio_1_an',
-            'H2H_ratio_surf', 'H2H_sets_gagnés', 'Pourc_vict_car_1_an_car',
-            'Pourc_vict_car_1_an_surf', 'Pourc_vict_last_50', 'Pourc_vict_last_10',
-            'Nb_matchs_joués_30j', 'Durée_tournoi', 'Favori_lose', 'Outsider_win',
-            'Pourc_serv_last_game', 'Pourc_pts_winfirst_serv', 'Pourc_bb_sauvées',
-            'Forme_recente', 'Surface_preferee', 'Confiance', 'Tendance',
-            'Côtes', 'H2H', 'Lien Photo', 'Pays', 'Age', 'Lien TennisExplorer'
-        ]
-        final_df = final_df[columns_order]
+        # Créer un DataFrame final avec toutes les données, dans l'ordre souhaité
+        final_df = construire_stats(joueurs_onglets)
 
         # --- AJOUT : formatage systématique de la colonne 'Date' ---
-        def format_single_date(date_str):
-            try:
-                if pd.isna(date_str) or not isinstance(date_str, str):
-                    return date_str
-                date_str = date_str.strip().rstrip('.')
-                # Format JJ.MM
-                if re.match(r'^\d{2}\.\d{2}$', date_str):
-                    day, month = date_str.split('.')
-                    current_year = datetime.now().year
-                    return f"{day}/{month}/{str(current_year)[-2:]}"
-                # Format JJ.MM.
-                if re.match(r'^\d{2}\.\d{2}\.$', date_str):
-                    day, month = date_str.strip('.').split('.')
-                    current_year = datetime.now().year
-                    return f"{day}/{month}/{str(current_year)[-2:]}"
-                # Format déjà correct
-                if re.match(r'^\d{2}/\d{2}/\d{2}$', date_str):
-                    return date_str
-                return date_str
-            except Exception as e:
-                print(f"Erreur formatage date '{date_str}': {e}")
-                return date_str
         if 'Date' in final_df.columns:
-            final_df['Date'] = final_df['Date'].apply(format_single_date)
+            final_df['Date'] = dates_en_texte(final_df['Date'])
             # Forcer le type string pour éviter la conversion automatique en datetime
             final_df['Date'] = final_df['Date'].astype(str)
         # --- FIN AJOUT ---
@@ -547,49 +640,35 @@ def transform_stats():
         print("\nValeurs uniques de classement:")
         print(final_df['Classement'].unique())
         
-        if len(final_df) > 0:
-            # Sauvegarder dans la base de données
+        presents = [sheet_name for sheet_name, _ in joueurs_onglets]
+        disparus = set(onglets_caches) - set(presents)
+        # Fichiers de sortie attendus : classeur (ou repli sans pyarrow) et table Parquet
+        sorties = [output_file] if WRITE_EXCEL or not HAS_COLUMNAR else []
+        sorties += [columnar_path(output_file)] if HAS_COLUMNAR else []
+        print(f"Onglets modifiés: {list(modifies)}, disparus: {sorted(disparus)}")
+
+        if len(final_df) > 0 and not modifies and not disparus and all(os.path.exists(f) for f in sorties):
+            print("Aucun onglet modifié depuis la dernière exécution : base et fichiers de sortie inchangés.")
+        elif len(final_df) > 0:
+            # Sauvegarder dans la base de données (onglets modifiés seulement)
             print("Sauvegarde des données dans la base de données...")
-            save_to_database(final_df)
-            print("Données sauvegardées dans la base de données avec succès.")
+            base_a_jour = save_to_database(final_df[final_df['Tournoi'].isin(list(modifies))])
             
-            # Vérifier si le fichier de sortie existe déjà
-            if os.path.exists(output_file):
-                try:
-                    # Essayer de supprimer le fichier existant
-                    os.remove(output_file)
-                    print(f"Fichier existant {output_file} supprimé")
-                except PermissionError:
-                    print(f"Erreur: Impossible de supprimer le fichier {output_file}. Veuillez fermer le fichier s'il est ouvert.")
-                    return
-                except Exception as e:
-                    print(f"Erreur lors de la suppression du fichier: {str(e)}")
-                    return
-            
-            # Essayer d'écrire le fichier avec plusieurs tentatives
-            max_attempts = 3
-            for attempt in range(max_attempts):
-                try:
-                    # S'assurer que la colonne Date reste au format string JJ/MM/AA
-                    if 'Date' in final_df.columns:
-                        # Convertir en string pour éviter la conversion automatique en datetime
-                        final_df['Date'] = final_df['Date'].astype(str)
-                    
-                    # Sauvegarder dans Excel
-                    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                        final_df.to_excel(writer, index=False, sheet_name='StatsJoueurs')
-                    
-                    print(f"Transformation terminée. Le fichier a été sauvegardé sous {output_file}")
-                    break
-                except PermissionError:
-                    if attempt < max_attempts - 1:
-                        print(f"Tentative {attempt + 1} échouée. Veuillez fermer le fichier s'il est ouvert. Nouvelle tentative dans 2 secondes...")
-                        time.sleep(2)
-                    else:
-                        print("Erreur: Impossible d'écrire dans le fichier après plusieurs tentatives. Veuillez fermer le fichier s'il est ouvert.")
-                except Exception as e:
-                    print(f"Une erreur s'est produite lors de l'écriture du fichier: {str(e)}")
-                    break
+            # Classeur Excel d'abord : la table Parquet écrite ensuite est reconnue à jour
+            if WRITE_EXCEL:
+                ecrire_excel_stats(final_df, output_file)
+            # Mêmes types que la lecture du classeur par les systèmes de prédiction
+            if write_table(types_comme_excel(final_df), columnar_path(output_file)):
+                print(f"Table Parquet sauvegardée sous {columnar_path(output_file)}")
+            elif not WRITE_EXCEL:
+                ecrire_excel_stats(final_df, output_file)
+
+            # Cache mis à jour une fois les sorties écrites, et seulement si la base l'est aussi :
+            # sinon les onglets modifiés passeraient pour inchangés et n'atteindraient jamais la base
+            if base_a_jour:
+                enregistrer_onglets_transformes(modifies, presents)
+            else:
+                print("Base non mise à jour : cache des onglets conservé, ils seront retransformés")
         else:
             print("Aucune donnée n'a été transformée. Le fichier de sortie n'a pas été créé.")
         
@@ -6,6 +6,7 @@ from datetime import datetime
 import warnings
 from player_nationalities import is_home_advantage, get_player_nationality, get_tournament_country
 from ai_context_analyzer import AIContextAnalyzer
+from columnar_interchange import read_stats
 warnings.filterwarnings('ignore')
 
 class UltimateTennisPredictionSystem:
@@ -346,8 +347,8 @@ class UltimateTennisPredictionSystem:
     def process_all_matches(self):
         """Traite tous les matchs depuis Excel et retourne les prédictions formatées pour le dashboard"""
         try:
-            # Charger les données Excel
-            df = pd.read_excel(self.excel_file_path, sheet_name='StatsJoueurs')
+            # Charger les données (table Parquet si disponible, sinon Excel)
+            df = read_stats(self.excel_file_path, sheet_name='StatsJoueurs')
             predictions = []
             
             # Créer des matchs individuels basés sur les liens Tennis Explorer
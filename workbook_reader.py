@@ -0,0 +1,59 @@
+"""
+Lecture en une passe des classeurs multi-onglets (Result_data_export.xlsx).
+
+pd.read_excel(fichier, sheet_name=nom) rouvre le classeur à chaque appel :
+décompression, lecture de workbook.xml et de la table des chaînes partagées,
+puis analyse de l'onglet. Avec un onglet par tournoi, ce travail est refait
+autant de fois qu'il y a de tournois. Ici le classeur est ouvert une seule
+fois en lecture seule (openpyxl en flux, via pd.ExcelFile) et chaque onglet
+est rendu tel que pd.read_excel le lirait.
+
+En mode parallèle, les onglets sont répartis entre des processus qui ouvrent
+chacun le classeur une fois et en analysent une part.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+
+import pandas as pd
+
+
+def sheet_names(path):
+    """Noms des onglets du classeur, dans leur ordre."""
+    with pd.ExcelFile(path) as xls:
+        return xls.sheet_names
+
+
+def iter_sheets(path, names=None):
+    """Génère (nom, DataFrame) pour chaque onglet ; le classeur n'est ouvert qu'une fois.
+
+    names : onglets à lire (tous par défaut), dans l'ordre donné.
+    """
+    with pd.ExcelFile(path) as xls:
+        for name in xls.sheet_names if names is None else names:
+            yield name, xls.parse(name)
+
+
+def _lire_onglets(path, names):
+    return list(iter_sheets(path, names))
+
+
+def read_sheets(path, workers=1):
+    """{nom: DataFrame} de tous les onglets du classeur, dans l'ordre du classeur.
+
+    workers > 1 : onglets analysés en parallèle par autant de processus.
+    Le démarrage des processus ('spawn', import de pandas) coûte de l'ordre
+    d'une seconde : ce mode ne paie que pour de gros classeurs.
+    """
+    if workers <= 1:
+        return dict(iter_sheets(path))
+    names = sheet_names(path)
+    workers = min(workers, len(names))
+    if workers <= 1:
+        return dict(iter_sheets(path, names))
+    # Répartition alternée : les onglets voisins ont souvent des tailles proches
+    lots = [names[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        onglets = dict(chain.from_iterable(executor.map(_lire_onglets, repeat(path), lots)))
+    return {name: onglets[name] for name in names}